@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from performance import compute_performance_metrics_batch, infer_periods_per_year
+from simulation_engine import calendar_rebalance_indices
+
+
+def backtest_weight_matrix(prices, weights, initial_capital, rebalance_indices):
+    """
+    K개 목표 비율 벡터의 정기 리밸런싱 가치 곡선을 한 번에 계산합니다.
+
+    리밸런싱 구간마다 각 자산의 상대 가격(구간 시작 대비)을 구해 두면,
+    k번째 포트폴리오의 가치는 (구간 시작 가치) x (상대 가격 @ 비율)이고
+    구간 시작 가치는 구간 성장률의 누적곱입니다. 따라서 모든 포트폴리오를
+    (거래일 수 x 자산 수) @ (자산 수 x K) 행렬곱으로 계산할 수 있습니다.
+
+    Parameters:
+    - prices: (거래일 수, 자산 수) 종가 배열
+    - weights: (K, 자산 수) 목표 비율 행렬 (행 합이 1보다 작으면 나머지는 현금)
+    - initial_capital: 초기 투자금
+    - rebalance_indices: 모든 포트폴리오가 공유하는 리밸런싱 거래일 인덱스
+
+    Returns:
+    - (거래일 수, K) 포트폴리오 가치 배열
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+    n_days = prices.shape[0]
+
+    rebalance_indices = np.asarray(rebalance_indices, dtype=np.int64)
+    rebalance_indices = rebalance_indices[(rebalance_indices > 0) & (rebalance_indices < n_days)]
+    event_indices = np.concatenate(([0], np.unique(rebalance_indices)))
+
+    # 거래일별 소속 구간과 구간 시작 대비 상대 가격
+    segment = np.searchsorted(event_indices, np.arange(n_days), side='right') - 1
+    relative = prices / prices[event_indices[segment]]
+
+    # 구간 시작 가치: 이전 구간들의 성장률 누적곱
+    cash_weight = 1.0 - weights.sum(axis=1)
+    event_prices = prices[event_indices]
+    event_growth = np.ones((len(event_indices), weights.shape[0]))
+    event_growth[1:] = (event_prices[1:] / event_prices[:-1]) @ weights.T + cash_weight
+    event_values = initial_capital * np.cumprod(event_growth, axis=0)
+
+    growth = relative @ weights.T + cash_weight
+
+    return event_values[segment] * growth
+
+
+def backtest_allocation_curve(data, ratios=np.linspace(0, 1, 101), rebalance_frequency='monthly',
+                              initial_capital=10000, tickers=('SOXL', 'VXX'), chunk_size=512,
+                              return_equity=False):
+    """
+    첫 번째 자산 비율을 0~100%로 바꿔 가며 전체 비율 곡선의 성과를 계산합니다.
+
+    포트폴리오를 chunk_size개씩 나누어 계산하므로 메모리 사용량은
+    (거래일 수 x chunk_size)로 제한됩니다.
+
+    Parameters:
+    - data: 시뮬레이터의 self.data 형식 DataFrame
+    - ratios: 첫 번째 자산 비율 목록 (나머지는 두 번째 자산)
+    - rebalance_frequency: 리밸런싱 주기 ('monthly', 'quarterly', 'month_end' 등, rebalance_schedule 참고)
+    - initial_capital: 초기 투자금
+    - tickers: 두 자산 티커
+    - chunk_size: 한 번에 계산할 포트폴리오 수
+    - return_equity: True이면 (거래일 수, K) 가치 곡선도 함께 반환
+
+    Returns:
+    - DataFrame: 비율별 성과 지표 (return_equity=True이면 (DataFrame, 가치 배열))
+    """
+    ratios = np.asarray(ratios, dtype=np.float64)
+    dates = pd.DatetimeIndex(data['Date'])
+    prices = data[[f"{ticker}_Close" for ticker in tickers]].to_numpy(dtype=np.float64)
+    rebalance_indices = calendar_rebalance_indices(dates, rebalance_frequency)
+    periods_per_year = infer_periods_per_year(dates)
+
+    weights = np.column_stack([ratios, 1.0 - ratios])
+    metrics = []
+    equity = np.empty((len(dates), len(ratios))) if return_equity else None
+
+    for start in range(0, len(ratios), chunk_size):
+        stop = min(start + chunk_size, len(ratios))
+        values = backtest_weight_matrix(prices, weights[start:stop], initial_capital, rebalance_indices)
+        metrics.append(compute_performance_metrics_batch(dates, values, initial_capital,
+                                                         periods_per_year=periods_per_year))
+        if return_equity:
+            equity[:, start:stop] = values
+
+    results = pd.DataFrame({
+        f"{tickers[0]}_Ratio": ratios,
+        f"{tickers[1]}_Ratio": 1.0 - ratios,
+        'Final_Value': np.concatenate([m['final_value'] for m in metrics]),
+        'Total_Return': np.concatenate([m['total_return'] for m in metrics]),
+        'Annual_Return': np.concatenate([m['annual_return'] for m in metrics]),
+        'Volatility': np.concatenate([m['volatility'] for m in metrics]),
+        'Max_Drawdown': np.concatenate([m['max_drawdown'] for m in metrics]),
+        'Sharpe_Ratio': np.concatenate([m['sharpe_ratio'] for m in metrics]),
+    })
+
+    if return_equity:
+        return results, equity
+    return results
@@ -0,0 +1,166 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from extended_5year_simulation import ExtendedSOXLVXXSimulation  # noqa: E402
+from price_cache import PriceCache  # noqa: E402
+from synthetic_market import generate_market  # noqa: E402
+
+DEFAULT_HISTORY = os.path.join(ROOT, 'benchmarks', 'history.json')
+START_DATE = pd.Timestamp('1990-01-02')
+
+# 이름 -> (봉 수, 분봉 간격)
+SIZES = {
+    '1y': (252, None),
+    '5y': (252 * 5, None),
+    '30y': (252 * 30, None),
+    '1y_minute': (252 * 390, 1),
+}
+REBALANCE_MODES = ('weekly', 'monthly', 'quarterly', 'month_end', 'band')
+EXPORT_FORMATS = ('parquet', 'arrow', 'csv', 'xlsx')
+# openpyxl은 행 수에 비례해 매우 느리므로 이보다 큰 결과는 Excel 벤치마크에서 제외
+XLSX_MAX_ROWS = 20000
+
+
+def measure(func, repeat):
+    """func를 repeat번 실행하여 최소/중앙값 시간(초)을 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        timings.append(time.perf_counter() - started)
+    return {'min': min(timings), 'median': float(np.median(timings)), 'repeat': repeat}
+
+
+def run_benchmarks(sizes=tuple(SIZES), repeat=3, charts=True, exports=EXPORT_FORMATS):
+    """
+    크기별 생성 데이터로 주요 경로의 실행 시간을 측정합니다 (네트워크 사용 없음).
+
+    Returns:
+    - 결과 목록: {'size', 'rows', 'benchmark', 'min', 'median', 'repeat'}
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            periods, bar_minutes = SIZES[size]
+            panel = generate_market(START_DATE, periods=periods, bar_minutes=bar_minutes)
+            index = panel.index
+            cache = PriceCache(os.path.join(workdir, f"cache_{size}"), offline=True)
+            start, end = index[0].normalize(), index[-1].normalize() + pd.Timedelta(days=1)
+            for ticker in ('SOXL', 'VXX'):
+                frame = pd.DataFrame({'Close': panel[f"{ticker}_Close"].to_numpy(),
+                                      'Volume': panel[f"{ticker}_Volume"].to_numpy()},
+                                     index=pd.DatetimeIndex(index, name='Date'))
+                cache.store(ticker, frame, start, end)
+            start, end = start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+            def record(name, func, times=repeat):
+                timing = measure(func, times)
+                results.append({'size': size, 'rows': len(index), 'benchmark': name, **timing})
+                print(f"{size:>10} {name:<32} {timing['min'] * 1000:>10.2f} ms")
+
+            simulator = ExtendedSOXLVXXSimulation(100000, 0.75, 0.25)
+            record('fetch_data (cache)', lambda: simulator.fetch_data(start, end, cache=cache))
+
+            for mode in REBALANCE_MODES:
+                record(f"run_simulation[{mode}]", lambda: simulator.run_simulation(mode))
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                simulator.run_simulation('monthly')
+            record('calculate_performance_metrics', simulator.calculate_performance_metrics)
+            record('create_year_by_year_analysis', simulator.create_year_by_year_analysis)
+
+            if charts:
+                record('create_comprehensive_dashboard', simulator.create_comprehensive_dashboard)
+                record('create_rolling_dashboard', simulator.create_rolling_dashboard)
+
+            for fmt in exports:
+                if fmt == 'xlsx':
+                    if len(index) > XLSX_MAX_ROWS:
+                        continue
+                    path = os.path.join(workdir, f"{size}.xlsx")
+                    record('save_results[xlsx]', lambda: simulator.save_results(path), times=1)
+                else:
+                    target = os.path.join(workdir, f"{size}_{fmt}")
+                    record(f"export_results[{fmt}]", lambda: simulator.export_results(target, fmt))
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def append_history(path, results):
+    """결과를 커밋/시각/환경 정보와 함께 JSON 기록 파일에 추가합니다."""
+    history = load_history(path)
+    history.append({
+        'commit': _git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    })
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=1)
+    return history
+
+
+def compare(previous, current, threshold=0.1):
+    """이전 실행 대비 최소 시간 변화율을 출력합니다 (threshold 이상 느려지면 표시)."""
+    before = {(r['size'], r['benchmark']): r['min'] for r in previous['results']}
+    print(f"\n이전 실행 ({previous['commit']}, {previous['timestamp']}) 대비")
+    print(f"{'크기':>10} {'벤치마크':<32} {'이전(ms)':>10} {'현재(ms)':>10} {'변화':>8}")
+    for r in current['results']:
+        key = (r['size'], r['benchmark'])
+        if key not in before:
+            continue
+        change = r['min'] / before[key] - 1
+        flag = '  <- 느려짐' if change > threshold else ''
+        print(f"{r['size']:>10} {r['benchmark']:<32} {before[key] * 1000:>10.2f} {r['min'] * 1000:>10.2f} "
+              f"{change:>+8.1%}{flag}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="시뮬레이션/지표/저장 경로 벤치마크 (생성 데이터, 오프라인)")
+    parser.add_argument('--sizes', nargs='+', default=list(SIZES), choices=list(SIZES), help="데이터 크기")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (최소 시간 기록)")
+    parser.add_argument('--no-charts', action='store_true', help="대시보드 벤치마크 제외")
+    parser.add_argument('--exports', nargs='*', default=list(EXPORT_FORMATS), help="저장 형식")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help="JSON 기록 파일")
+    parser.add_argument('--no-record', action='store_true', help="기록 파일에 저장하지 않음")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.repeat, not args.no_charts, args.exports)
+    if not args.no_record:
+        history = append_history(args.history, results)
+        if len(history) > 1:
+            compare(history[-2], history[-1])
+        print(f"\n결과가 {args.history}에 기록되었습니다.")
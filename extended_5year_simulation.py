@@ -1,13 +1,17 @@
-import yfinance as yf
+import os
+
 import pandas as pd
-import numpy as np
 from datetime import datetime
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import warnings
-warnings.filterwarnings('ignore')
+from instrumentation import count, profiling, span
+from portfolio_core import SOXLVXXSimulator
+from report_builder import HTMLReport
+from price_cache import DEFAULT_CACHE_DIR
+from rolling_analytics import DEFAULT_WINDOWS
 
-class ExtendedSOXLVXXSimulation:
+class ExtendedSOXLVXXSimulation(SOXLVXXSimulator):
+    simulation_name = "5년 모의투자"
+    verbose_rebalance = False
+    
     def __init__(self, initial_capital=100000, soxl_ratio=0.75, vxx_ratio=0.25):
         """
         SOXL-VXX 5년 확장 모의투자 시뮬레이터
@@ -17,263 +21,28 @@ class ExtendedSOXLVXXSimulation:
         - soxl_ratio: SOXL 투자 비율 (기본값: 0.75 = 75%)
         - vxx_ratio: VXX 투자 비율 (기본값: 0.25 = 25%)
         """
-        self.initial_capital = initial_capital
-        self.soxl_ratio = soxl_ratio
-        self.vxx_ratio = vxx_ratio
-        
-        # 포트폴리오 상태
-        self.cash = initial_capital
-        self.soxl_shares = 0
-        self.vxx_shares = 0
-        self.current_capital = initial_capital
-        
-        # 거래 기록
-        self.trade_history = []
-        self.portfolio_history = []
-        self.rebalance_dates = []
-        
-        # 성과 지표
-        self.total_return = 0
-        self.annual_return = 0
-        self.volatility = 0
-        self.max_drawdown = 0
-        self.sharpe_ratio = 0
-        
-    def fetch_data(self, start_date="2020-01-01", end_date=None):
-        """SOXL과 VXX 데이터를 가져옵니다 (2020-01-01부터 현재까지)"""
-        if end_date is None:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-        
-        print(f"SOXL과 VXX 데이터를 수집하는 중... ({start_date} ~ {end_date})")
-        
-        try:
-            # SOXL 데이터 수집
-            soxl_data = yf.download("SOXL", start=start_date, end=end_date, progress=False)
-            if soxl_data.empty:
-                raise ValueError("SOXL 데이터를 가져올 수 없습니다.")
-            
-            # VXX 데이터 수집
-            vxx_data = yf.download("VXX", start=start_date, end=end_date, progress=False)
-            if vxx_data.empty:
-                raise ValueError("VXX 데이터를 가져올 수 없습니다.")
-            
-            # MultiIndex 컬럼 처리
-            if isinstance(soxl_data.columns, pd.MultiIndex):
-                soxl_data.columns = soxl_data.columns.droplevel(0)
-            if isinstance(vxx_data.columns, pd.MultiIndex):
-                vxx_data.columns = vxx_data.columns.droplevel(0)
-            
-            # 컬럼명 정리
-            if len(soxl_data.columns) == 6:
-                soxl_data.columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-            elif len(soxl_data.columns) == 5:
-                soxl_data.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-                
-            if len(vxx_data.columns) == 6:
-                vxx_data.columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-            elif len(vxx_data.columns) == 5:
-                vxx_data.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-            
-            # 결합된 데이터
-            self.data = pd.DataFrame({
-                'Date': soxl_data.index,
-                'SOXL_Close': soxl_data['Close'],
-                'VXX_Close': vxx_data['Close'],
-                'SOXL_Volume': soxl_data['Volume'],
-                'VXX_Volume': vxx_data['Volume']
-            }).dropna()
-            
-            print(f"데이터 수집 완료: {len(self.data)}개 거래일")
-            print(f"기간: {self.data['Date'].iloc[0].strftime('%Y-%m-%d')} ~ {self.data['Date'].iloc[-1].strftime('%Y-%m-%d')}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"데이터 수집 중 오류 발생: {e}")
-            return False
-    
-    def initial_investment(self, date):
-        """초기 투자를 실행합니다."""
-        soxl_price = self.data[self.data['Date'] == date]['SOXL_Close'].iloc[0]
-        vxx_price = self.data[self.data['Date'] == date]['VXX_Close'].iloc[0]
-        
-        # 초기 투자금 배분
-        soxl_investment = self.cash * self.soxl_ratio
-        vxx_investment = self.cash * self.vxx_ratio
-        
-        # 주식 수 계산
-        self.soxl_shares = soxl_investment / soxl_price
-        self.vxx_shares = vxx_investment / vxx_price
-        self.cash = 0
-        
-        # 거래 기록
-        self.trade_history.append({
-            'Date': date,
-            'Type': 'Initial Investment',
-            'SOXL_Shares': self.soxl_shares,
-            'VXX_Shares': self.vxx_shares,
-            'SOXL_Price': soxl_price,
-            'VXX_Price': vxx_price,
-            'Cash': self.cash
-        })
-        
-        print(f"초기 투자 완료 ({date.strftime('%Y-%m-%d')})")
-        print(f"SOXL: {self.soxl_shares:.2f}주 @ ${soxl_price:.2f} = ${soxl_investment:,.2f}")
-        print(f"VXX: {self.vxx_shares:.2f}주 @ ${vxx_price:.2f} = ${vxx_investment:,.2f}")
-    
-    def calculate_portfolio_value(self, date):
-        """특정 날짜의 포트폴리오 가치를 계산합니다."""
-        row = self.data[self.data['Date'] == date]
-        if row.empty:
-            return 0
-        
-        soxl_price = row['SOXL_Close'].iloc[0]
-        vxx_price = row['VXX_Close'].iloc[0]
-        
-        portfolio_value = (self.soxl_shares * soxl_price + 
-                          self.vxx_shares * vxx_price + 
-                          self.cash)
+        super().__init__(initial_capital, soxl_ratio, vxx_ratio)
         
-        return portfolio_value
-    
-    def rebalance_portfolio(self, date, target_soxl_ratio=0.75, target_vxx_ratio=0.25):
-        """포트폴리오를 리밸런싱합니다."""
-        current_value = self.calculate_portfolio_value(date)
-        if current_value == 0:
-            return
-        
-        row = self.data[self.data['Date'] == date]
-        if row.empty:
-            return
-        
-        soxl_price = row['SOXL_Close'].iloc[0]
-        vxx_price = row['VXX_Close'].iloc[0]
-        
-        # 목표 주식 수 계산
-        target_soxl_value = current_value * target_soxl_ratio
-        target_vxx_value = current_value * target_vxx_ratio
-        
-        target_soxl_shares = target_soxl_value / soxl_price
-        target_vxx_shares = target_vxx_value / vxx_price
-        
-        # 거래 실행
-        soxl_diff = target_soxl_shares - self.soxl_shares
-        vxx_diff = target_vxx_shares - self.vxx_shares
-        
-        # 주식 수 업데이트
-        self.soxl_shares = target_soxl_shares
-        self.vxx_shares = target_vxx_shares
-        
-        # 거래 기록
-        self.trade_history.append({
-            'Date': date,
-            'Type': 'Rebalance',
-            'SOXL_Shares': self.soxl_shares,
-            'VXX_Shares': self.vxx_shares,
-            'SOXL_Price': soxl_price,
-            'VXX_Price': vxx_price,
-            'Cash': self.cash,
-            'SOXL_Change': soxl_diff,
-            'VXX_Change': vxx_diff
-        })
-        
-        self.rebalance_dates.append(date)
-    
-    def run_simulation(self, rebalance_frequency='monthly'):
+    def fetch_data(self, start_date="2020-01-01", end_date=None,
+                   cache_dir=DEFAULT_CACHE_DIR, offline=False, cache=None, source=None):
         """
-        모의투자 시뮬레이션을 실행합니다.
+        SOXL과 VXX 데이터를 가져옵니다 (2020-01-01부터 현재까지)
         
         Parameters:
-        - rebalance_frequency: 리밸런싱 주기 ('monthly', 'quarterly')
+        - cache_dir: 가격 캐시 디렉터리
+        - offline: True이면 네트워크 없이 캐시에서만 읽습니다
+        - cache: 여러 시뮬레이터가 공유할 PriceCache (지정하면 cache_dir/offline 무시)
+        - source: 데이터 소스 (예: SyntheticSource, 지정하면 가격 캐시를 거치지 않음)
         """
-        if not hasattr(self, 'data') or self.data.empty:
-            print("먼저 데이터를 가져와주세요.")
-            return
-        
-        print(f"\n=== SOXL-VXX 5년 모의투자 시뮬레이션 시작 ===")
-        print(f"초기 투자금: ${self.initial_capital:,.2f}")
-        print(f"포트폴리오 비율: SOXL {self.soxl_ratio:.1%}, VXX {self.vxx_ratio:.1%}")
-        print(f"리밸런싱 주기: {rebalance_frequency}")
-        
-        # 첫 번째 거래일에 초기 투자
-        first_date = self.data['Date'].iloc[0]
-        self.initial_investment(first_date)
-        
-        # 리밸런싱 날짜 계산
-        if rebalance_frequency == 'monthly':
-            rebalance_dates = pd.date_range(start=first_date, end=self.data['Date'].iloc[-1], freq='MS')[1:]
-        elif rebalance_frequency == 'quarterly':
-            rebalance_dates = pd.date_range(start=first_date, end=self.data['Date'].iloc[-1], freq='QS')[1:]
-        else:
-            rebalance_dates = []
-        
-        # 실제 거래일과 매칭
-        actual_rebalance_dates = []
-        for rebalance_date in rebalance_dates:
-            # 리밸런싱 날짜 이후의 첫 번째 거래일 찾기
-            available_dates = self.data[self.data['Date'] > rebalance_date]['Date']
-            if not available_dates.empty:
-                actual_rebalance_dates.append(available_dates.iloc[0])
-        
-        # 리밸런싱 실행
-        for rebalance_date in actual_rebalance_dates:
-            if rebalance_date in self.data['Date'].values:
-                self.rebalance_portfolio(rebalance_date)
-        
-        # 일일 포트폴리오 가치 기록
-        for _, row in self.data.iterrows():
-            date = row['Date']
-            portfolio_value = self.calculate_portfolio_value(date)
-            
-            self.portfolio_history.append({
-                'Date': date,
-                'Portfolio_Value': portfolio_value,
-                'SOXL_Value': self.soxl_shares * row['SOXL_Close'],
-                'VXX_Value': self.vxx_shares * row['VXX_Close'],
-                'Cash': self.cash,
-                'SOXL_Price': row['SOXL_Close'],
-                'VXX_Price': row['VXX_Close']
-            })
-        
-        self.portfolio_history = pd.DataFrame(self.portfolio_history)
-        
-        # 성과 지표 계산
-        self.calculate_performance_metrics()
-        
-        print(f"\n=== 시뮬레이션 완료 ===")
-        self.print_performance_summary()
-    
-    def calculate_performance_metrics(self):
-        """성과 지표를 계산합니다."""
-        if self.portfolio_history.empty:
-            return
-        
-        # 기본 지표
-        final_value = self.portfolio_history['Portfolio_Value'].iloc[-1]
-        self.total_return = (final_value - self.initial_capital) / self.initial_capital
-        
-        # 연간 수익률
-        days = (self.portfolio_history['Date'].iloc[-1] - self.portfolio_history['Date'].iloc[0]).days
-        years = days / 365.25
-        self.annual_return = (final_value / self.initial_capital) ** (1/years) - 1
-        
-        # 변동성 (일간 수익률 기준)
-        daily_returns = self.portfolio_history['Portfolio_Value'].pct_change().dropna()
-        self.volatility = daily_returns.std() * np.sqrt(252)
-        
-        # 최대 낙폭
-        cumulative = (1 + daily_returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        self.max_drawdown = drawdown.min()
+        if end_date is None:
+            end_date = datetime.now().strftime("%Y-%m-%d")
         
-        # 샤프 비율 (무위험 수익률 3% 가정)
-        risk_free_rate = 0.03
-        self.sharpe_ratio = (self.annual_return - risk_free_rate) / self.volatility if self.volatility > 0 else 0
+        return super().fetch_data(start_date, end_date, cache_dir=cache_dir, offline=offline, cache=cache,
+                                  source=source)
     
     def print_performance_summary(self):
         """성과 요약을 출력합니다."""
-        final_value = self.portfolio_history['Portfolio_Value'].iloc[-1]
+        final_value = self.final_value
         
         print(f"\n포트폴리오 성과 요약")
         print(f"{'='*50}")
@@ -290,6 +59,7 @@ class ExtendedSOXLVXXSimulation:
         print(f"\n리밸런싱 정보")
         print(f"{'='*50}")
         print(f"리밸런싱 횟수: {len(self.rebalance_dates)}회")
+        self.print_trade_costs()
         print(f"첫 리밸런싱: {self.rebalance_dates[0].strftime('%Y-%m-%d') if self.rebalance_dates else 'N/A'}")
         print(f"마지막 리밸런싱: {self.rebalance_dates[-1].strftime('%Y-%m-%d') if self.rebalance_dates else 'N/A'}")
     
@@ -299,6 +69,11 @@ class ExtendedSOXLVXXSimulation:
             print("포트폴리오 데이터가 없습니다.")
             return
         
+        # plotly는 차트를 만들 때만 불러옴 (차트 없는 실행의 시작 시간 단축)
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        from fast_plotting import line_trace, marker_trace
+        
         # 서브플롯 생성
         fig = make_subplots(
             rows=3, cols=2,
@@ -319,9 +94,9 @@ class ExtendedSOXLVXXSimulation:
         
         # 1. 포트폴리오 가치 변화
         fig.add_trace(
-            go.Scatter(
-                x=self.portfolio_history['Date'],
-                y=self.portfolio_history['Portfolio_Value'],
+            line_trace(
+                self.portfolio_history['Date'],
+                self.portfolio_history['Portfolio_Value'],
                 mode='lines',
                 name='포트폴리오 가치',
                 line=dict(color='#667eea', width=3),
@@ -331,13 +106,14 @@ class ExtendedSOXLVXXSimulation:
             row=1, col=1
         )
         
-        # 리밸런싱 날짜 표시
-        for rebalance_date in self.rebalance_dates:
-            fig.add_vline(
-                x=rebalance_date,
-                line_dash="dot",
-                line_color="gray",
-                opacity=0.5,
+        # 리밸런싱 날짜 표시 (날짜마다 도형을 추가하지 않고 하나의 마커 trace로)
+        if self.rebalance_dates:
+            fig.add_trace(
+                marker_trace(
+                    self.rebalance_dates,
+                    self.portfolio_history['Date'],
+                    self.portfolio_history['Portfolio_Value']
+                ),
                 row=1, col=1
             )
         
@@ -361,9 +137,9 @@ class ExtendedSOXLVXXSimulation:
         daily_returns = self.portfolio_history['Portfolio_Value'].pct_change().dropna() * 100
         
         fig.add_trace(
-            go.Scatter(
-                x=self.portfolio_history['Date'][1:],
-                y=daily_returns,
+            line_trace(
+                self.portfolio_history['Date'][1:],
+                daily_returns,
                 mode='lines',
                 name='일간 수익률',
                 line=dict(color='#17a2b8', width=1),
@@ -389,9 +165,9 @@ class ExtendedSOXLVXXSimulation:
         cumulative_returns = (self.portfolio_history['Portfolio_Value'] / self.initial_capital - 1) * 100
         
         fig.add_trace(
-            go.Scatter(
-                x=self.portfolio_history['Date'],
-                y=cumulative_returns,
+            line_trace(
+                self.portfolio_history['Date'],
+                cumulative_returns,
                 mode='lines',
                 name='누적 수익률',
                 line=dict(color='#ffc107', width=3),
@@ -419,9 +195,9 @@ class ExtendedSOXLVXXSimulation:
         drawdown = (cumulative - running_max) / running_max * 100
         
         fig.add_trace(
-            go.Scatter(
-                x=self.portfolio_history['Date'],
-                y=drawdown,
+            line_trace(
+                self.portfolio_history['Date'],
+                drawdown,
                 mode='lines',
                 name='Drawdown',
                 line=dict(color='#dc3545', width=2),
@@ -432,8 +208,9 @@ class ExtendedSOXLVXXSimulation:
         )
         
         # 6. 월별 수익률
-        self.portfolio_history['Year_Month'] = pd.to_datetime(self.portfolio_history['Date']).dt.to_period('M')
-        monthly_returns = self.portfolio_history.groupby('Year_Month')['Portfolio_Value'].last().pct_change().dropna() * 100
+        # 캐시된 portfolio_history에 컬럼을 추가하지 않도록 그룹 키는 지역 Series로 계산
+        year_month = pd.to_datetime(self.portfolio_history['Date']).dt.to_period('M').rename('Year_Month')
+        monthly_returns = self.portfolio_history['Portfolio_Value'].groupby(year_month).last().pct_change().dropna() * 100
         
         colors = ['#28a745' if x > 0 else '#dc3545' for x in monthly_returns.values]
         
@@ -477,19 +254,69 @@ class ExtendedSOXLVXXSimulation:
         
         return fig
     
+    def create_rolling_dashboard(self, windows=DEFAULT_WINDOWS):
+        """이동 창별 위험 지표 대시보드를 생성합니다."""
+        if self.portfolio_history.empty:
+            print("포트폴리오 데이터가 없습니다.")
+            return
+        
+        from plotly.subplots import make_subplots
+        from fast_plotting import line_trace
+        
+        rolling = self.calculate_rolling_metrics(windows)
+        panels = [
+            ('Volatility', '이동 변동성', 100),
+            ('Sharpe', '이동 샤프 비율', 1),
+            ('Sortino', '이동 소르티노 비율', 1),
+            ('Correlation', f'{"/".join(self.tickers[:2])} 상관계수', 1),
+            ('Beta', f'{self.tickers[0]} 대비 베타', 1),
+            ('Drawdown', '이동 고점 대비 낙폭 (%)', 100),
+        ]
+        # 자산이 하나이면 상관계수 없음
+        panels = [panel for panel in panels if f"{panel[0]}_{windows[0]}" in rolling]
+        
+        fig = make_subplots(rows=3, cols=2, subplot_titles=[title for _, title, _ in panels],
+                            vertical_spacing=0.08)
+        colors = ['blue', 'orange', 'green', 'red', 'purple']
+        
+        for i, (name, _, scale) in enumerate(panels):
+            row, col = i // 2 + 1, i % 2 + 1
+            for j, window in enumerate(windows):
+                fig.add_trace(
+                    line_trace(
+                        rolling['Date'],
+                        rolling[f"{name}_{window}"] * scale,
+                        mode='lines',
+                        name=f'{window}일',
+                        line=dict(color=colors[j % len(colors)], width=1),
+                        legendgroup=str(window),
+                        showlegend=i == 0
+                    ),
+                    row=row, col=col
+                )
+        
+        fig.update_layout(
+            title=f'이동 위험 지표 ({", ".join(f"{w}일" for w in windows)})',
+            height=1000,
+            template='plotly_white'
+        )
+        
+        return fig
+    
     def create_year_by_year_analysis(self):
         """연도별 분석을 생성합니다."""
         if self.portfolio_history.empty:
             return
         
-        # 연도별 데이터
-        self.portfolio_history['Year'] = pd.to_datetime(self.portfolio_history['Date']).dt.year
-        self.portfolio_history['Month'] = pd.to_datetime(self.portfolio_history['Date']).dt.month
+        # 연도별 데이터 (캐시된 portfolio_history는 바꾸지 않고 복사본에 연/월 추가)
+        history = self.portfolio_history[['Date', 'Portfolio_Value']].copy()
+        history['Year'] = pd.to_datetime(history['Date']).dt.year
+        history['Month'] = pd.to_datetime(history['Date']).dt.month
         
         year_analysis = []
         
-        for year in sorted(self.portfolio_history['Year'].unique()):
-            year_data = self.portfolio_history[self.portfolio_history['Year'] == year]
+        for year in sorted(history['Year'].unique()):
+            year_data = history[history['Year'] == year]
             
             if len(year_data) == 0:
                 continue
@@ -533,8 +360,8 @@ class ExtendedSOXLVXXSimulation:
             self.portfolio_history.to_excel(writer, sheet_name='Portfolio_History', index=False)
             
             # 거래 기록
-            if self.trade_history:
-                trade_df = pd.DataFrame(self.trade_history)
+            trade_df = self.trade_history
+            if not trade_df.empty:
                 trade_df.to_excel(writer, sheet_name='Trade_History', index=False)
             
             # 연도별 분석
@@ -542,6 +369,11 @@ class ExtendedSOXLVXXSimulation:
             if not year_analysis.empty:
                 year_analysis.to_excel(writer, sheet_name='Year_Analysis', index=False)
             
+            # 이동 위험 지표
+            rolling = pd.DataFrame(self.calculate_rolling_metrics())
+            if not rolling.empty:
+                rolling.to_excel(writer, sheet_name='Rolling_Metrics', index=False)
+            
             # 성과 요약
             summary_data = {
                 '지표': [
@@ -574,11 +406,23 @@ class ExtendedSOXLVXXSimulation:
             summary_df = pd.DataFrame(summary_data)
             summary_df.to_excel(writer, sheet_name='Performance_Summary', index=False)
         
+        count('bytes_written', os.path.getsize(filename))
         print(f"결과가 {filename}에 저장되었습니다.")
         return filename
 
-def run_5year_simulation():
-    """2020-2025년 5년 모의투자 시뮬레이션을 실행합니다."""
+def run_5year_simulation(offline=False, export_format='xlsx', charts=True, result_cache=None, source=None,
+                         costs=None):
+    """
+    2020-2025년 5년 모의투자 시뮬레이션을 실행합니다.
+
+    Parameters:
+    - offline: True이면 네트워크 없이 가격 캐시만 사용
+    - source: 데이터 소스 (예: 합성 데이터 SyntheticSource, 지정하면 가격 캐시를 거치지 않음)
+    - export_format: 결과 저장 형식 ('xlsx', 'parquet', 'arrow', 'csv', None이면 저장하지 않음)
+    - charts: False이면 대시보드를 만들지 않음 (plotly를 불러오지 않는 헤드리스 실행)
+    - result_cache: ResultCache (지정하면 같은 입력의 저장된 시뮬레이션 결과를 재사용)
+    - costs: 거래 비용 설정 (trade_ledger.DEFAULT_COSTS 항목, None이면 비용 없음)
+    """
     print("=== SOXL-VXX 5년 모의투자 시뮬레이션 (2020-2025) ===\n")
     
     # 시뮬레이션 설정
@@ -588,29 +432,41 @@ def run_5year_simulation():
     
     # 시뮬레이터 생성
     simulator = ExtendedSOXLVXXSimulation(initial_capital, soxl_ratio, vxx_ratio)
+    simulator.costs = costs
     
     # 데이터 수집 (2020-01-01부터 현재까지)
-    if simulator.fetch_data(start_date="2020-01-01"):
+    with span('fetch_data'):
+        fetched = simulator.fetch_data(start_date="2020-01-01", offline=offline, source=source)
+    if fetched:
         # 월간 리밸런싱 시뮬레이션 실행
-        simulator.run_simulation('monthly')
-        
-        # 종합 대시보드 생성
-        print("\n종합 대시보드를 생성하는 중...")
-        dashboard = simulator.create_comprehensive_dashboard()
+        with span('simulation'):
+            simulator.run_simulation('monthly', result_cache=result_cache)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        dashboard_filename = f"5year_comprehensive_dashboard_{timestamp}.html"
-        dashboard.write_html(dashboard_filename)
-        print(f"대시보드가 {dashboard_filename}에 저장되었습니다.")
         
-        # Excel 결과 저장
-        excel_filename = simulator.save_results()
+        # 종합 대시보드 생성
+        if charts:
+            print("\n종합 대시보드를 생성하는 중...")
+            with span('charts'):
+                report = HTMLReport("SOXL-VXX 5년 모의투자 보고서")
+                report.add_figure(simulator.create_comprehensive_dashboard())
+                report.add_figure(simulator.create_rolling_dashboard())
+                report.add_table(simulator.create_year_by_year_analysis(), "연도별 성과 분석")
+                report.write(f"5year_comprehensive_dashboard_{timestamp}.html")
+        
+        # 결과 저장
+        with span('export'):
+            if export_format == 'xlsx':
+                simulator.save_results()
+            elif export_format:
+                simulator.export_results(f"5year_soxl_vxx_simulation_{timestamp}", export_format)
         
         # 연도별 분석 출력
         print("\n" + "="*80)
         print("연도별 성과 분석")
         print("="*80)
-        year_analysis = simulator.create_year_by_year_analysis()
+        with span('year_analysis'):
+            year_analysis = simulator.create_year_by_year_analysis()
         print(year_analysis.to_string(index=False))
         
         return simulator
@@ -619,6 +475,51 @@ def run_5year_simulation():
         return None
 
 if __name__ == "__main__":
-    # 5년 시뮬레이션 실행
-    simulator = run_5year_simulation()
-
+    import argparse
+    import contextlib
+    
+    from result_cache import ResultCache
+    
+    parser = argparse.ArgumentParser(description="SOXL-VXX 5년 모의투자 시뮬레이션")
+    parser.add_argument('--offline', action='store_true', help="네트워크 없이 가격 캐시만 사용")
+    parser.add_argument('--format', default='xlsx', choices=['xlsx', 'parquet', 'arrow', 'csv', 'none'],
+                        help="결과 저장 형식 (none이면 저장하지 않음)")
+    parser.add_argument('--no-charts', action='store_true', help="대시보드 없이 실행 (헤드리스)")
+    parser.add_argument('--no-result-cache', action='store_true', help="저장된 시뮬레이션 결과를 사용하지 않음")
+    parser.add_argument('--synthetic', action='store_true', help="생성한 합성 가격 데이터 사용 (네트워크 없음)")
+    parser.add_argument('--seed', type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument('--panel', default=None,
+                        help="메모리 매핑 가격 패널 디렉토리 (지정하면 청크 단위로 시뮬레이션, 분봉 가능)")
+    parser.add_argument('--costs', action='store_true',
+                        help="거래량 기반 수수료/슬리피지 반영 (trade_ledger.DEFAULT_COSTS)")
+    parser.add_argument('--fee-bps', type=float, default=None, help="--costs 수수료 (bp)")
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='JSON',
+                        help="단계별 실행 시간/카운터 출력 (경로를 주면 JSON으로도 저장)")
+    parser.add_argument('--cprofile', default=None, metavar='PROF',
+                        help="--profile과 함께 시뮬레이션 핵심 cProfile 결과 저장")
+    parser.add_argument('--frequency', default='monthly', help="--panel 실행의 리밸런싱 주기 (예: hourly, daily)")
+    args = parser.parse_args()
+    
+    costs = None
+    if args.costs or args.fee_bps is not None:
+        costs = {} if args.fee_bps is None else {'fee_rate': args.fee_bps / 10000}
+    
+    source = None
+    if args.synthetic:
+        from synthetic_market import SyntheticSource
+        source = SyntheticSource(seed=args.seed)
+    
+    # --profile/--cprofile가 없으면 계측을 켜지 않음 (추가 비용 없음)
+    profile = args.profile is not None or args.cprofile is not None
+    with profiling(args.profile or None, args.cprofile) if profile else contextlib.nullcontext():
+        if args.panel:
+            from price_store import PriceStore
+            ExtendedSOXLVXXSimulation().run_chunked_simulation(PriceStore.open(args.panel), args.frequency)
+        else:
+            # 5년 시뮬레이션 실행
+            simulator = run_5year_simulation(offline=args.offline,
+                                             export_format=None if args.format == 'none' else args.format,
+                                             charts=not args.no_charts,
+                                             result_cache=None if args.no_result_cache else ResultCache(),
+                                             source=source,
+                                             costs=costs)
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# 표시할 최대 점 수 (이보다 길면 LTTB로 줄임)
+DEFAULT_MAX_POINTS = 3000
+# 이보다 점이 많으면 SVG 대신 WebGL(Scattergl)로 그림
+WEBGL_THRESHOLD = 1000
+
+
+def _as_numeric(x):
+    """날짜 축은 ns 정수로, 그 외는 float로 변환합니다."""
+    if isinstance(x, (pd.Series, pd.Index)) and pd.api.types.is_datetime64_any_dtype(x):
+        return pd.DatetimeIndex(x).as_unit('ns').asi8.astype(np.float64)
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets 방식으로 남길 점의 인덱스를 고릅니다.
+
+    양 끝점을 유지하고, 나머지를 n_out - 2개 구간으로 나누어 구간마다
+    (직전 선택점, 다음 구간 평균점)과 만드는 삼각형 넓이가 가장 큰 점을 남기므로
+    급등/급락 같은 모양이 보존됩니다. 다음 구간 평균은 reduceat으로 미리 계산합니다.
+
+    Parameters:
+    - x: 숫자 x 값 (오름차순)
+    - y: y 값 (NaN은 선택하지 않음)
+    - n_out: 남길 점 수
+
+    Returns:
+    - 정렬된 인덱스 배열
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    filled = np.where(np.isnan(y), np.nanmean(y) if np.isfinite(y).any() else 0.0, y)
+
+    # 구간 경계: [1, n - 1)을 n_out - 2개로 나눔, 마지막 점은 별도 구간
+    edges = (1 + np.arange(n_out - 1) * (n - 2) / (n_out - 2)).astype(np.int64)
+    edges[-1] = n - 1
+    bounds = np.append(edges, n)
+    sizes = np.diff(bounds)
+    avg_x = np.add.reduceat(x, bounds[:-1]) / sizes
+    avg_y = np.add.reduceat(filled, bounds[:-1]) / sizes
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        area = np.abs((x[a] - avg_x[i + 1]) * (y[start:stop] - y[a])
+                      - (x[a] - x[start:stop]) * (avg_y[i + 1] - y[a]))
+        area = np.where(np.isnan(area), -1.0, area)
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample(x, y, max_points=DEFAULT_MAX_POINTS):
+    """max_points보다 긴 시계열을 LTTB로 줄여 (x, y)를 반환합니다."""
+    y = np.asarray(y, dtype=np.float64)
+    if max_points is None or len(y) <= max_points:
+        return x, y
+    indices = lttb_indices(_as_numeric(x), y, max_points)
+    x = x.iloc[indices] if isinstance(x, pd.Series) else np.asarray(x)[indices]
+    return x, y[indices]
+
+
+def line_trace(x, y, max_points=DEFAULT_MAX_POINTS, webgl_threshold=WEBGL_THRESHOLD, **kwargs):
+    """
+    긴 시계열용 선 그래프 trace를 만듭니다.
+
+    max_points보다 길면 LTTB로 줄이고, 그린 점이 webgl_threshold보다 많으면
+    Scattergl을 사용합니다. 나머지 인자는 go.Scatter/go.Scattergl에 그대로 전달됩니다.
+    """
+    x, y = downsample(x, y, max_points)
+    kwargs.setdefault('mode', 'lines')
+    trace_type = go.Scattergl if len(y) > webgl_threshold else go.Scatter
+    return trace_type(x=x, y=y, **kwargs)
+
+
+def marker_trace(dates, series_dates, series_values, name='리밸런싱', **kwargs):
+    """
+    리밸런싱 날짜를 도형(add_vline) 대신 하나의 마커 trace로 표시합니다.
+
+    각 날짜의 y 값은 줄이기 전 원래 시계열에서 가져옵니다.
+
+    Parameters:
+    - dates: 표시할 날짜 목록
+    - series_dates: 시계열 날짜
+    - series_values: 시계열 값
+    """
+    series_dates = pd.DatetimeIndex(series_dates)
+    dates = pd.DatetimeIndex(dates)
+    positions = np.clip(series_dates.searchsorted(dates), 0, len(series_dates) - 1)
+    kwargs.setdefault('marker', dict(symbol='diamond', size=7, color='gray'))
+    return go.Scatter(x=dates, y=np.asarray(series_values, dtype=np.float64)[positions],
+                      mode='markers', name=name, **kwargs)
@@ -0,0 +1,146 @@
+import contextlib
+import json
+import threading
+import time
+
+# 실행 중인 Profiler (None이면 계측 꺼짐)
+_ACTIVE = None
+# 계측이 꺼져 있을 때 span()이 돌려주는 재사용 컨텍스트
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def span(name, core=False):
+    """
+    파이프라인 단계의 실행 시간을 잽니다 (with instrumentation.span('fetch_data'): ...).
+
+    계측이 꺼져 있으면 아무것도 하지 않는 같은 컨텍스트를 돌려주므로 추가 비용은
+    함수 호출 한 번입니다. 단계 안에서 연 단계는 'simulation/engine'처럼 경로로 기록됩니다.
+
+    Parameters:
+    - name: 단계 이름
+    - core: True이면 Profiler에 cProfile이 켜져 있을 때 이 단계를 cProfile로 프로파일링
+    """
+    if _ACTIVE is None:
+        return _NULL_SPAN
+    return _ACTIVE.span(name, core)
+
+
+def count(name, amount=1):
+    """카운터(처리 행 수, 리밸런싱 횟수, 저장 바이트, 캐시 적중 등)를 늘립니다."""
+    if _ACTIVE is not None:
+        _ACTIVE.count(name, amount)
+
+
+class Profiler:
+    def __init__(self, cprofile=False):
+        """
+        단계별 실행 시간과 카운터를 모으는 계측기
+
+        Parameters:
+        - cprofile: True이면 core=True 단계(시뮬레이션 핵심)를 cProfile로 프로파일링
+        """
+        self.spans = {}
+        self.counters = {}
+        self._stack = []
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.wall_time = 0.0
+        self.cprofile = None
+        if cprofile:
+            import cProfile
+            self.cprofile = cProfile.Profile()
+
+    @contextlib.contextmanager
+    def span(self, name, core=False):
+        # 단계는 메인 스레드에서만 중첩된다고 가정합니다 (카운터는 스레드 안전)
+        self._stack.append(name)
+        path = '/'.join(self._stack)
+        # 시작할 때 등록하여 보고서에서 상위 단계가 하위 단계보다 먼저 나오도록 함
+        entry = self.spans.setdefault(path, {'seconds': 0.0, 'calls': 0})
+        profile = self.cprofile is not None and core
+        started = time.perf_counter()
+        if profile:
+            self.cprofile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                self.cprofile.disable()
+            elapsed = time.perf_counter() - started
+            self._stack.pop()
+            entry['seconds'] += elapsed
+            entry['calls'] += 1
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def stop(self):
+        self.wall_time = time.perf_counter() - self._started
+
+    def to_dict(self):
+        return {
+            'wall_time': self.wall_time,
+            'spans': [{'stage': path, **entry} for path, entry in self.spans.items()],
+            'counters': dict(self.counters),
+        }
+
+    def write_json(self, path):
+        """단계별 시간과 카운터를 JSON 파일로 저장합니다."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def print_report(self):
+        """단계별 시간(전체 실행 시간 대비 비율)과 카운터를 출력합니다."""
+        print(f"\n단계별 실행 시간 (전체 {self.wall_time:.3f}초)")
+        print(f"{'='*70}")
+        print(f"{'단계':<40} {'호출':>6} {'시간(초)':>10} {'비율':>8}")
+        # 하위 단계를 상위 단계 바로 아래에 출력 (단계마다 처음 시작한 순서)
+        order = {path: i for i, path in enumerate(self.spans)}
+        paths = sorted(self.spans, key=lambda path: [order['/'.join(path.split('/')[:depth + 1])]
+                                                     for depth in range(path.count('/') + 1)])
+        for path in paths:
+            entry = self.spans[path]
+            depth = path.count('/')
+            label = '  ' * depth + path.rsplit('/', 1)[-1]
+            share = entry['seconds'] / self.wall_time if self.wall_time > 0 else 0.0
+            print(f"{label:<40} {entry['calls']:>6} {entry['seconds']:>10.3f} {share:>8.1%}")
+        if self.counters:
+            print(f"\n카운터")
+            print(f"{'='*70}")
+            for name, value in self.counters.items():
+                print(f"{name:<40} {value:>16,}")
+
+    def dump_cprofile(self, path, top=20):
+        """cProfile 결과를 저장하고 누적 시간 상위 함수를 출력합니다 (pstats/snakeviz로 열기)."""
+        import pstats
+
+        self.cprofile.dump_stats(path)
+        print(f"\n시뮬레이션 핵심 cProfile (누적 시간 상위 {top}개, 전체 결과: {path})")
+        pstats.Stats(self.cprofile).sort_stats('cumulative').print_stats(top)
+
+
+@contextlib.contextmanager
+def profiling(json_path=None, cprofile_path=None):
+    """
+    with 블록 동안 계측을 켜고, 끝나면 단계별 보고서를 출력/저장합니다.
+
+    Parameters:
+    - json_path: 단계별 시간과 카운터를 저장할 JSON 파일 (None이면 출력만)
+    - cprofile_path: 시뮬레이션 핵심 단계의 cProfile 결과 파일 (None이면 cProfile 끔)
+    """
+    global _ACTIVE
+    profiler = Profiler(cprofile=cprofile_path is not None)
+    previous, _ACTIVE = _ACTIVE, profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE = previous
+        profiler.stop()
+        profiler.print_report()
+        if json_path:
+            profiler.write_json(json_path)
+            print(f"\n계측 결과가 {json_path}에 저장되었습니다.")
+        if cprofile_path:
+            profiler.dump_cprofile(cprofile_path)
@@ -0,0 +1,284 @@
+import asyncio
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from portfolio_core import Portfolio
+from price_store import PriceStore
+from streaming_metrics import StreamingMetrics
+
+
+class Quote:
+    """한 시점의 자산별 가격 (tickers 순서의 배열)"""
+    __slots__ = ('timestamp', 'prices')
+
+    def __init__(self, timestamp, prices):
+        self.timestamp = timestamp
+        self.prices = prices
+
+
+class QuoteFeed(ABC):
+    """
+    시세 피드 추상 클래스: stream()은 Quote를 순서대로 내보내는 비동기 이터레이터입니다.
+
+    PaperTradingDaemon은 피드를 직접 만들지 않으므로 구현 피드를 주입해야 합니다
+    (캐시 데이터 재생은 ReplayQuoteFeed, 실시간 시세는 이 클래스를 상속하여 구현).
+    """
+
+    tickers = ()
+
+    @abstractmethod
+    def stream(self, after=None):
+        """after 이후의 시세를 내보내는 비동기 이터레이터를 반환합니다."""
+
+
+class ReplayQuoteFeed(QuoteFeed):
+    def __init__(self, store, tickers, speed=None, yield_every=1000):
+        """
+        캐시된 가격 데이터를 실시간 시세처럼 재생하는 피드
+
+        Parameters:
+        - store: PriceStore (또는 self.data 형식 DataFrame)
+        - tickers: 재생할 티커 목록
+        - speed: 초당 재생할 시세 수 (None이면 최대 속도, 처리량 측정용)
+        - yield_every: 최대 속도 재생 시 이벤트 루프에 제어를 넘기는 간격
+        """
+        if isinstance(store, pd.DataFrame):
+            store = PriceStore.from_frame(store)
+        self.store = store
+        self.tickers = list(tickers)
+        self.speed = speed
+        self.yield_every = yield_every
+
+    async def stream(self, after=None):
+        prices = self.store.slice(self.tickers)
+        timestamps = self.store.timestamps
+        start = 0 if after is None else self.store.next_trading_index(after)
+        interval = 1.0 / self.speed if self.speed else 0.0
+
+        for i in range(start, len(timestamps)):
+            yield Quote(pd.Timestamp(timestamps[i]), prices[i])
+            if interval:
+                await asyncio.sleep(interval)
+            elif (i - start) % self.yield_every == 0:
+                await asyncio.sleep(0)
+
+
+class PaperTradingDaemon:
+    def __init__(self, tickers, weights, initial_capital, feed, drift_threshold=0.05,
+                 snapshot_path=None, snapshot_every=500, trade_log_path=None):
+        """
+        시세 피드를 구독하여 가상 포트폴리오를 실시간으로 운용하는 모의투자 서비스
+
+        시세마다 보유 자산을 재평가하고, 어느 자산이든 목표 비율에서
+        drift_threshold 이상 벗어나면 가상 리밸런싱을 기록합니다.
+        상태는 snapshot_path에 주기적으로 저장되어 재시작 시 이어서 실행됩니다.
+        거래 기록은 스냅샷과 분리된 JSONL 파일에 이어 쓰고 스냅샷에는 카운터와
+        기록 파일 크기만 저장하므로, 스냅샷 한 번의 비용은 거래 수와 무관합니다.
+
+        Parameters:
+        - tickers: 자산 티커 목록
+        - weights: 자산별 목표 비율
+        - initial_capital: 초기 투자금
+        - feed: QuoteFeed 구현 (예: ReplayQuoteFeed)
+        - drift_threshold: 리밸런싱을 실행할 비율 이탈 폭 (기본값: 0.05 = 5%p)
+        - snapshot_path: 상태 저장 파일 (None이면 저장하지 않음)
+        - snapshot_every: 상태를 저장할 시세 간격
+        - trade_log_path: 거래 기록 JSONL 파일 (기본값: snapshot_path 옆 .trades.jsonl,
+          둘 다 None이면 메모리에만 보관)
+        """
+        self.tickers = list(tickers)
+        self.initial_capital = initial_capital
+        self.feed = feed
+        self.drift_threshold = drift_threshold
+        self.snapshot_path = snapshot_path
+        self.snapshot_every = snapshot_every
+        if trade_log_path is None and snapshot_path:
+            trade_log_path = f"{os.path.splitext(snapshot_path)[0]}.trades.jsonl"
+        self.trade_log_path = trade_log_path
+
+        self.portfolio = Portfolio(tickers, weights, cash=initial_capital)
+        self.metrics = StreamingMetrics(initial_capital)
+        # 아직 거래 기록 파일에 쓰지 않은 거래 (스냅샷 저장 때 이어 씀)
+        self._pending_trades = []
+        self.trades = 0
+        self.rebalances = 0
+        self.trade_log_bytes = 0
+        self.last_timestamp = None
+        self.ticks = 0
+
+        # 처리량 측정
+        self.session_ticks = 0
+        self.elapsed = 0.0
+
+        if snapshot_path and os.path.exists(snapshot_path):
+            self.restore()
+        elif trade_log_path and os.path.exists(trade_log_path):
+            # 이어서 실행할 상태가 없으면 처음부터 시작하므로 이전 거래 기록을 비움
+            open(trade_log_path, 'wb').close()
+
+    @property
+    def ticks_per_second(self):
+        return self.session_ticks / self.elapsed if self.elapsed > 0 else 0.0
+
+    def _record_trade(self, timestamp, trade_type, prices, change, value):
+        record = {'Date': timestamp.isoformat(), 'Type': trade_type, 'Portfolio_Value': float(value)}
+        for ticker, shares, price, diff in zip(self.tickers, self.portfolio.holdings, prices, change):
+            record[f"{ticker}_Shares"] = float(shares)
+            record[f"{ticker}_Price"] = float(price)
+            record[f"{ticker}_Change"] = float(diff)
+        self._pending_trades.append(record)
+        self.trades += 1
+        if trade_type == 'Rebalance':
+            self.rebalances += 1
+
+    @property
+    def trade_history(self):
+        """거래 기록 DataFrame (기록 파일 + 아직 쓰지 않은 거래)"""
+        records = []
+        if self.trade_log_path and os.path.exists(self.trade_log_path):
+            with open(self.trade_log_path, 'r', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+        return pd.DataFrame(records + self._pending_trades)
+
+    def _flush_trades(self):
+        """대기 중인 거래를 기록 파일 끝에 이어 씁니다."""
+        if not self.trade_log_path or not self._pending_trades:
+            return
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in self._pending_trades)
+        with open(self.trade_log_path, 'ab') as f:
+            f.write(lines.encode('utf-8'))
+            self.trade_log_bytes = f.tell()
+        self._pending_trades = []
+
+    def on_quote(self, quote):
+        """시세 하나를 처리합니다: 재평가, 비율 이탈 확인, 필요 시 가상 리밸런싱."""
+        prices = quote.prices
+        if self.last_timestamp is None:
+            change = self.portfolio.rebalance(prices)
+            self._record_trade(quote.timestamp, 'Initial Investment', prices, change, self.initial_capital)
+
+        value = self.portfolio.value(prices)
+        weights = self.portfolio.asset_values(prices) / value
+        drift = np.abs(weights - self.portfolio.weights).max()
+        if drift > self.drift_threshold:
+            change = self.portfolio.rebalance(prices)
+            self._record_trade(quote.timestamp, 'Rebalance', prices, change, value)
+
+        self.metrics.update(quote.timestamp, value)
+        self.last_timestamp = quote.timestamp
+        self.ticks += 1
+
+    async def run(self, max_ticks=None):
+        """피드가 끝나거나 max_ticks개를 처리할 때까지 실행합니다."""
+        started = time.perf_counter()
+        session_start = self.session_ticks
+        try:
+            async for quote in self.feed.stream(after=self.last_timestamp):
+                self.on_quote(quote)
+                self.session_ticks += 1
+                if self.snapshot_path and self.ticks % self.snapshot_every == 0:
+                    self.save_snapshot()
+                if max_ticks is not None and self.session_ticks - session_start >= max_ticks:
+                    break
+        finally:
+            self.elapsed += time.perf_counter() - started
+            if self.snapshot_path:
+                self.save_snapshot()
+
+    def save_snapshot(self):
+        """
+        현재 상태를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다.
+
+        대기 중인 거래를 먼저 기록 파일에 이어 쓰고, 그 파일 크기를 스냅샷에 남깁니다.
+        """
+        self._flush_trades()
+        state = {
+            'tickers': self.tickers,
+            'weights': self.portfolio.weights.tolist(),
+            'holdings': self.portfolio.holdings.tolist(),
+            'cash': float(self.portfolio.cash),
+            'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp is not None else None,
+            'ticks': self.ticks,
+            'metrics': self.metrics.to_state(),
+            'trades': self.trades,
+            'rebalances': self.rebalances,
+            'trade_log_bytes': self.trade_log_bytes,
+        }
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.snapshot_path)
+
+    def restore(self):
+        """
+        저장된 상태를 불러옵니다.
+
+        스냅샷 이후에 기록 파일에 쓴 거래는 마지막 시세부터 다시 처리하므로 잘라 냅니다.
+        """
+        with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state['tickers'] != self.tickers:
+            raise ValueError("저장된 상태의 티커 구성이 다릅니다.")
+        if not np.allclose(state['weights'], self.portfolio.weights):
+            raise ValueError(f"저장된 상태의 목표 비율이 다릅니다: {state['weights']} != "
+                             f"{self.portfolio.weights.tolist()}")
+
+        self.portfolio.holdings = np.asarray(state['holdings'], dtype=np.float64)
+        self.portfolio.cash = state['cash']
+        self.last_timestamp = pd.Timestamp(state['last_timestamp']) if state['last_timestamp'] else None
+        self.ticks = state['ticks']
+        self.metrics = StreamingMetrics.from_state(state['metrics'])
+        self.trades = state['trades']
+        self.rebalances = state['rebalances']
+        self.trade_log_bytes = state['trade_log_bytes']
+        self._pending_trades = []
+        if self.trade_log_path and os.path.exists(self.trade_log_path):
+            with open(self.trade_log_path, 'r+b') as f:
+                f.truncate(self.trade_log_bytes)
+
+    def print_status(self):
+        """현재 상태와 처리량을 출력합니다."""
+        metrics = self.metrics.snapshot()
+        print(f"\n모의투자 서비스 상태")
+        print(f"{'='*50}")
+        print(f"마지막 시세: {self.last_timestamp}")
+        print(f"처리한 시세: {self.ticks:,}개 (이번 실행 {self.session_ticks:,}개)")
+        print(f"처리량: {self.ticks_per_second:,.0f} ticks/s")
+        print(f"포트폴리오 가치: ${metrics['final_value']:,.2f}")
+        print(f"총 수익률: {metrics['total_return']:.2%}")
+        print(f"최대 낙폭: {metrics['max_drawdown']:.2%}")
+        print(f"샤프 비율: {metrics['sharpe_ratio']:.3f}")
+        print(f"가상 리밸런싱 횟수: {self.rebalances}회")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from price_cache import PriceCache
+    from universe_loader import load_universe
+
+    parser = argparse.ArgumentParser(description="SOXL-VXX 실시간 모의투자 서비스 (캐시 데이터 재생)")
+    parser.add_argument('--start', default="2020-01-01", help="재생 시작일")
+    parser.add_argument('--end', default=None, help="재생 종료일 (기본값: 오늘)")
+    parser.add_argument('--speed', type=float, default=None, help="초당 시세 수 (기본값: 최대 속도)")
+    parser.add_argument('--drift', type=float, default=0.05, help="리밸런싱 비율 이탈 폭")
+    parser.add_argument('--capital', type=float, default=100000, help="초기 투자금")
+    parser.add_argument('--snapshot', default="paper_trading_state.json", help="상태 저장 파일")
+    parser.add_argument('--offline', action='store_true', help="네트워크 없이 가격 캐시만 사용")
+    args = parser.parse_args()
+
+    end = args.end or pd.Timestamp.today().strftime("%Y-%m-%d")
+    universe = load_universe(["SOXL", "VXX"], args.start, end, cache=PriceCache(offline=args.offline))
+    feed = ReplayQuoteFeed(universe.panel, ["SOXL", "VXX"], speed=args.speed)
+    daemon = PaperTradingDaemon(["SOXL", "VXX"], [0.75, 0.25], args.capital, feed,
+                                drift_threshold=args.drift, snapshot_path=args.snapshot)
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        pass
+    daemon.print_status()
@@ -0,0 +1,167 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from performance import compute_performance_metrics, infer_periods_per_year
+from result_cache import cache_key, data_fingerprint
+from simulation_engine import ENGINE_VERSION, rebalance_indices, simulate_rebalancing
+
+# 워커 프로세스별 가격 데이터 (initializer에서 한 번만 설정)
+_WORKER_DATA = {}
+
+
+def _init_worker(timestamps, prices, tickers):
+    _WORKER_DATA['dates'] = pd.DatetimeIndex(timestamps.view('datetime64[ns]'))
+    _WORKER_DATA['prices'] = prices
+    _WORKER_DATA['tickers'] = tickers
+    _WORKER_DATA['periods_per_year'] = infer_periods_per_year(timestamps)
+    _WORKER_DATA['schedules'] = {}
+
+
+def _run_scenario(scenario):
+    """하나의 (기간, 주기, 비율) 시나리오를 실행하고 성과 지표를 반환합니다."""
+    window_start, window_end, frequency, band, ratio, initial_capital = scenario
+    dates = _WORKER_DATA['dates']
+    prices = _WORKER_DATA['prices']
+    first, second = _WORKER_DATA['tickers']
+
+    start = dates.searchsorted(window_start, side='left') if window_start is not None else 0
+    stop = dates.searchsorted(window_end, side='right') if window_end is not None else len(dates)
+    window_dates = dates[start:stop]
+    if len(window_dates) < 2:
+        return None
+
+    window_prices = prices[start:stop]
+    weights = [ratio, 1.0 - ratio]
+    if frequency == 'band':
+        indices = rebalance_indices(window_dates, window_prices, weights, frequency, band)
+    else:
+        # 달력 규칙의 리밸런싱 일정은 비율과 무관하므로 기간/주기별로 한 번만 계산
+        schedules = _WORKER_DATA['schedules']
+        key = (start, stop, frequency)
+        if key not in schedules:
+            schedules[key] = rebalance_indices(window_dates, window_prices, weights, frequency)
+        indices = schedules[key]
+    result = simulate_rebalancing(window_prices, weights, initial_capital, indices)
+    metrics = compute_performance_metrics(window_dates, result['portfolio_value'], initial_capital,
+                                          periods_per_year=_WORKER_DATA['periods_per_year'])
+
+    return {
+        'Window_Start': window_dates[0],
+        'Window_End': window_dates[-1],
+        'Frequency': frequency,
+        'Band': band,
+        f"{first}_Ratio": ratio,
+        f"{second}_Ratio": 1.0 - ratio,
+        'Final_Value': metrics['final_value'],
+        'Total_Return': metrics['total_return'],
+        'Annual_Return': metrics['annual_return'],
+        'Volatility': metrics['volatility'],
+        'Max_Drawdown': metrics['max_drawdown'],
+        'Sharpe_Ratio': metrics['sharpe_ratio'],
+        'Rebalances': len(result['event_indices']) - 1,
+    }
+
+
+def sweep(data, ratios=np.linspace(0, 1, 101), frequencies=('monthly', 'quarterly'), windows=(None,),
+          bands=(0.05,), initial_capital=10000, tickers=('SOXL', 'VXX'), max_workers=None, chunksize=None,
+          result_cache=None):
+    """
+    SOXL 비율 x 리밸런싱 주기 x 기간 조합을 프로세스 풀에서 병렬로 실행합니다.
+
+    가격 데이터는 워커 초기화 때 한 번만 전달되고, 각 시나리오는 벡터화된
+    simulate_rebalancing과 compute_performance_metrics만 실행합니다.
+
+    Parameters:
+    - data: 시뮬레이터의 self.data 형식 DataFrame ('Date', '{티커}_Close')
+    - ratios: 첫 번째 자산(SOXL) 비율 목록, 나머지는 두 번째 자산(VXX)
+    - frequencies: 리밸런싱 주기 목록 ('monthly', 'quarterly', 'band', 'none' 등, rebalance_schedule 참고)
+    - windows: (시작일, 종료일) 목록, None이면 전체 기간
+    - bands: 'band' 주기에서 사용할 목표 비율 이탈 폭 목록
+    - initial_capital: 초기 투자금
+    - tickers: 비율을 적용할 두 자산
+    - max_workers: 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+    - chunksize: 워커에 한 번에 전달할 시나리오 수
+    - result_cache: ResultCache (지정하면 같은 데이터/파라미터의 저장된 결과를 재사용)
+
+    Returns:
+    - DataFrame: 시나리오별 성과 지표 (tidy 형식)
+    """
+    timestamps = pd.DatetimeIndex(data['Date']).as_unit('ns').asi8
+    prices = np.ascontiguousarray(data[[f"{ticker}_Close" for ticker in tickers]].to_numpy(dtype=np.float64))
+
+    windows = [(None, None) if window is None else tuple(pd.Timestamp(d) for d in window) for window in windows]
+    settings = [(frequency, band) for frequency in frequencies
+                for band in (bands if frequency == 'band' else (np.nan,))]
+    scenarios = [(start, end, frequency, band, float(ratio), initial_capital)
+                 for (start, end), (frequency, band), ratio in itertools.product(windows, settings, ratios)]
+
+    key = None
+    if result_cache is not None:
+        key = cache_key(engine_version=ENGINE_VERSION, data=data_fingerprint(timestamps, prices),
+                        tickers=list(tickers), initial_capital=initial_capital,
+                        scenarios=[scenario[:5] for scenario in scenarios])
+        cached = result_cache.get(key)
+        if cached is not None:
+            return cached
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers == 1:
+        _init_worker(timestamps, prices, tuple(tickers))
+        rows = [_run_scenario(scenario) for scenario in scenarios]
+    else:
+        if chunksize is None:
+            chunksize = max(1, len(scenarios) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(timestamps, prices, tuple(tickers))) as executor:
+            rows = list(executor.map(_run_scenario, scenarios, chunksize=chunksize))
+
+    results = pd.DataFrame([row for row in rows if row is not None])
+    if key is not None:
+        result_cache.put(key, results)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from extended_5year_simulation import ExtendedSOXLVXXSimulation
+    from result_cache import ResultCache
+
+    parser = argparse.ArgumentParser(description="SOXL-VXX 비율/리밸런싱 주기 파라미터 스윕")
+    parser.add_argument('--start', default="2020-01-01", help="시작일")
+    parser.add_argument('--end', default=None, help="종료일 (기본값: 오늘)")
+    parser.add_argument('--offline', action='store_true', help="네트워크 없이 가격 캐시만 사용")
+    parser.add_argument('--synthetic', action='store_true', help="생성한 합성 가격 데이터 사용 (네트워크 없음)")
+    parser.add_argument('--seed', type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수")
+    parser.add_argument('--frequencies', nargs='+', default=['monthly', 'quarterly', 'band'],
+                        help="리밸런싱 주기 목록 ('monthly', 'quarterly', 'band', 'none')")
+    parser.add_argument('--bands', type=float, nargs='+', default=[0.05, 0.1, 0.2],
+                        help="'band' 주기의 목표 비율 이탈 폭 목록")
+    parser.add_argument('--no-result-cache', action='store_true', help="저장된 결과를 사용하지 않음")
+    parser.add_argument('--output', default=None, help="결과 데이터셋 디렉토리 (주기별 파티션)")
+    parser.add_argument('--format', default='parquet', choices=['parquet', 'arrow', 'csv'], help="결과 저장 형식")
+    args = parser.parse_args()
+
+    source = None
+    if args.synthetic:
+        from synthetic_market import SyntheticSource
+        source = SyntheticSource(seed=args.seed)
+
+    simulator = ExtendedSOXLVXXSimulation()
+    if simulator.fetch_data(start_date=args.start, end_date=args.end, offline=args.offline, source=source):
+        results = sweep(simulator.data, frequencies=args.frequencies, bands=args.bands,
+                        max_workers=args.workers,
+                        result_cache=None if args.no_result_cache else ResultCache())
+        print("\n샤프 비율 상위 10개 시나리오")
+        print(results.sort_values('Sharpe_Ratio', ascending=False).head(10).to_string(index=False))
+        if args.output:
+            from result_export import write_partitioned
+            paths = write_partitioned(results, args.output, ['Frequency'], args.format)
+            print(f"\n결과가 {args.output}에 저장되었습니다 ({len(paths)}개 파티션).")
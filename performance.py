@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+RISK_FREE_RATE = 0.03
+TRADING_DAYS = 252
+DAY_NS = 86400 * 10 ** 9
+# 메모리 매핑된 긴 타임스탬프 배열을 나누어 읽을 행 수
+SCAN_CHUNK_ROWS = 1 << 22
+
+
+def infer_periods_per_year(dates, chunk_rows=SCAN_CHUNK_ROWS):
+    """
+    봉 간격에서 연율화에 사용할 연간 기간 수를 추정합니다.
+
+    거래일 하나에 들어 있는 평균 봉 수 x 252 이므로 일봉은 정확히 252,
+    1분봉(하루 390개)은 약 98,280입니다. 거래일마다 봉이 하나뿐이면 주봉/월봉일 수
+    있으므로 봉 간격 중앙값으로 365.25일 / 간격을 계산하여 252와 작은 값을 씁니다
+    (주봉 약 52, 월봉 약 12). 타임스탬프는 chunk_rows개씩 읽으므로
+    메모리 매핑된 배열도 전체를 메모리에 올리지 않습니다.
+
+    Parameters:
+    - dates: 정렬된 타임스탬프 (DatetimeIndex 또는 datetime64/int64(ns) 배열)
+    """
+    if isinstance(dates, np.ndarray) and dates.dtype.kind in 'Mi':
+        timestamps = dates.astype('datetime64[ns]', copy=False).view(np.int64) if dates.dtype.kind == 'M' else dates
+    else:
+        timestamps = pd.DatetimeIndex(dates).as_unit('ns').asi8
+    n = len(timestamps)
+    if n < 2:
+        return TRADING_DAYS
+
+    sessions = 1
+    for start in range(0, n - 1, chunk_rows):
+        days = timestamps[start:start + chunk_rows + 1] // DAY_NS
+        sessions += int(np.count_nonzero(days[1:] != days[:-1]))
+    if sessions < n:
+        return TRADING_DAYS * n / sessions
+
+    # 거래일마다 봉 하나: 일봉(중앙값 1일)은 252, 더 긴 간격은 달력 기준
+    gap_days = np.median(np.diff(timestamps[:chunk_rows + 1])) / DAY_NS
+    return min(TRADING_DAYS, 365.25 / gap_days)
+
+
+def compute_performance_metrics(dates, values, initial_capital, risk_free_rate=RISK_FREE_RATE,
+                                periods_per_year=TRADING_DAYS):
+    """
+    포트폴리오 가치 시계열에서 성과 지표를 계산합니다.
+
+    PortfolioSimulator.calculate_performance_metrics와 같은 정의를 사용합니다.
+    - 연간 수익률: 달력 일수 / 365.25 기준 CAGR
+    - 변동성: 봉 수익률 표준편차(ddof=1) x sqrt(periods_per_year) (일봉 252)
+    - 최대 낙폭: 첫 일간 수익률 이후의 누적 수익 곡선 기준
+    - 샤프 비율: (연간 수익률 - 무위험 수익률) / 변동성
+
+    Returns:
+    - dict: final_value, total_return, annual_return, volatility, max_drawdown, sharpe_ratio
+    """
+    values = np.asarray(values, dtype=np.float64)
+    dates = pd.DatetimeIndex(dates)
+
+    final_value = values[-1]
+    total_return = (final_value - initial_capital) / initial_capital
+
+    days = (dates[-1] - dates[0]).days
+    years = days / 365.25
+    annual_return = (final_value / initial_capital) ** (1 / years) - 1 if years > 0 else np.nan
+
+    returns = values[1:] / values[:-1] - 1
+    returns = returns[~np.isnan(returns)]
+    volatility = returns.std(ddof=1) * np.sqrt(periods_per_year) if len(returns) > 1 else np.nan
+
+    if len(returns) > 0:
+        cumulative = np.cumprod(1 + returns)
+        running_max = np.maximum.accumulate(cumulative)
+        max_drawdown = ((cumulative - running_max) / running_max).min()
+    else:
+        max_drawdown = np.nan
+
+    sharpe_ratio = (annual_return - risk_free_rate) / volatility if volatility > 0 else 0
+
+    return {
+        'final_value': final_value,
+        'total_return': total_return,
+        'annual_return': annual_return,
+        'volatility': volatility,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe_ratio,
+    }
+
+
+def compute_performance_metrics_batch(dates, values, initial_capital, risk_free_rate=RISK_FREE_RATE,
+                                      periods_per_year=TRADING_DAYS):
+    """
+    (거래일 수, 포트폴리오 수) 가치 배열의 열마다 성과 지표를 한 번에 계산합니다.
+
+    지표 정의는 compute_performance_metrics와 같으며, 각 값은 포트폴리오 수 길이의 배열입니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    dates = pd.DatetimeIndex(dates)
+
+    final_value = values[-1]
+    total_return = (final_value - initial_capital) / initial_capital
+
+    years = (dates[-1] - dates[0]).days / 365.25
+    annual_return = (final_value / initial_capital) ** (1 / years) - 1 if years > 0 else np.full_like(final_value, np.nan)
+
+    returns = values[1:] / values[:-1] - 1
+    volatility = returns.std(axis=0, ddof=1) * np.sqrt(periods_per_year)
+
+    cumulative = np.cumprod(1 + returns, axis=0)
+    running_max = np.maximum.accumulate(cumulative, axis=0)
+    max_drawdown = ((cumulative - running_max) / running_max).min(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe_ratio = np.where(volatility > 0, (annual_return - risk_free_rate) / volatility, 0.0)
+
+    return {
+        'final_value': final_value,
+        'total_return': total_return,
+        'annual_return': annual_return,
+        'volatility': volatility,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe_ratio,
+    }
+
+
+def compute_path_metrics(values, initial_capital, periods_per_year=TRADING_DAYS, risk_free_rate=RISK_FREE_RATE):
+    """
+    날짜 없이 일정 간격의 (기간 수 + 1, 경로 수) 가치 배열에서 경로별 성과 지표를 계산합니다.
+
+    첫 행은 초기 가치이며, 연율화는 기간 수 / periods_per_year 를 연수로 사용합니다.
+    몬테카를로 시나리오처럼 달력 날짜가 없는 경로에 사용합니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_periods = values.shape[0] - 1
+
+    final_value = values[-1]
+    total_return = (final_value - initial_capital) / initial_capital
+    years = n_periods / periods_per_year
+    annual_return = (final_value / initial_capital) ** (1 / years) - 1
+
+    returns = values[1:] / values[:-1] - 1
+    volatility = returns.std(axis=0, ddof=1) * np.sqrt(periods_per_year)
+
+    running_max = np.maximum.accumulate(values, axis=0)
+    max_drawdown = ((values - running_max) / running_max).min(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe_ratio = np.where(volatility > 0, (annual_return - risk_free_rate) / volatility, 0.0)
+
+    return {
+        'final_value': final_value,
+        'total_return': total_return,
+        'annual_return': annual_return,
+        'volatility': volatility,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe_ratio,
+    }
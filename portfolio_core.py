@@ -0,0 +1,582 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import count, span
+from price_cache import DEFAULT_CACHE_DIR, PriceCache
+from portfolio_history import PortfolioHistory
+from price_store import PriceStore
+from result_export import export_tables
+from performance import TRADING_DAYS, compute_performance_metrics, infer_periods_per_year
+from rolling_analytics import DEFAULT_WINDOWS, compute_rolling_metrics
+from result_cache import cache_key, data_fingerprint
+from simulation_engine import (DEFAULT_CHUNK_ROWS, ENGINE_VERSION, apply_trade_costs, rebalance_indices,
+                               simulate_rebalancing, simulate_rebalancing_chunked)
+from streaming_metrics import StreamingMetrics
+from trade_ledger import DEFAULT_COSTS, TradeLedger
+from universe_loader import load_universe
+
+
+class Portfolio:
+    def __init__(self, tickers, weights, cash=0.0):
+        """
+        자산별 보유 수량, 목표 비율, 가격을 NumPy 벡터로 관리하는 포트폴리오
+
+        Parameters:
+        - tickers: 자산 티커 목록 (벡터 인덱스 순서)
+        - weights: 자산별 목표 비율 (합이 1보다 작으면 나머지는 현금)
+        - cash: 보유 현금
+        """
+        self.tickers = list(tickers)
+        self.weights = np.asarray(weights, dtype=np.float64).copy()
+        if self.weights.shape != (len(self.tickers),):
+            raise ValueError("목표 비율 개수가 자산 개수와 다릅니다.")
+        self.holdings = np.zeros(len(self.tickers))
+        self.cash = cash
+
+    @property
+    def cash_weight(self):
+        return 1.0 - self.weights.sum()
+
+    def index(self, ticker):
+        """티커의 벡터 인덱스를 반환합니다."""
+        return self.tickers.index(ticker)
+
+    def asset_values(self, prices):
+        """자산별 평가 금액을 반환합니다."""
+        return self.holdings * prices
+
+    def value(self, prices):
+        """포트폴리오 가치를 반환합니다."""
+        return self.holdings @ prices + self.cash
+
+    def target_holdings(self, prices, value, weights=None):
+        """목표 비율에 맞는 자산별 보유 수량을 반환합니다."""
+        if weights is None:
+            weights = self.weights
+        return value * np.asarray(weights, dtype=np.float64) / prices
+
+    def rebalance(self, prices, weights=None):
+        """
+        목표 비율로 리밸런싱하고 자산별 수량 변화를 반환합니다.
+
+        초기 투자(보유 수량 0)도 같은 연산으로 처리됩니다.
+        """
+        if weights is None:
+            weights = self.weights
+        value = self.value(prices)
+        target = self.target_holdings(prices, value, weights)
+        change = target - self.holdings
+        self.holdings = target
+        self.cash = value * (1.0 - np.sum(weights))
+        return change
+
+
+class PortfolioSimulator:
+    simulation_name = "모의투자"
+    verbose_rebalance = False
+    # 일일 기록 가치 컬럼 자료형 (np.float32이면 기록 메모리 절반)
+    history_dtype = np.float64
+
+    def __init__(self, tickers, weights, initial_capital=100000):
+        """
+        N개 자산 정기 리밸런싱 모의투자 시뮬레이터
+
+        Parameters:
+        - tickers: 자산 티커 목록
+        - weights: 자산별 목표 비율
+        - initial_capital: 초기 투자금 (기본값: $100,000)
+        """
+        self.initial_capital = initial_capital
+        self.tickers = list(tickers)
+
+        # 포트폴리오 상태
+        self.portfolio = Portfolio(tickers, weights, cash=initial_capital)
+        self.current_capital = initial_capital
+
+        # 거래 기록
+        self.ledger = TradeLedger(self.tickers, np.empty(0, dtype='datetime64[ns]'))
+        self.costs = None
+        self.history = None
+        self._history_frame = None
+        self.rebalance_dates = []
+
+        # 성과 지표 (periods_per_year: 연율화 기간 수, 일봉 252)
+        self.final_value = initial_capital
+        self.periods_per_year = TRADING_DAYS
+        self.total_return = 0
+        self.annual_return = 0
+        self.volatility = 0
+        self.max_drawdown = 0
+        self.sharpe_ratio = 0
+
+    @property
+    def cash(self):
+        return self.portfolio.cash
+
+    @cash.setter
+    def cash(self, value):
+        self.portfolio.cash = value
+
+    @property
+    def price_columns(self):
+        return [f"{ticker}_Close" for ticker in self.tickers]
+
+    @property
+    def trade_history(self):
+        """
+        거래 이벤트마다 한 행인 거래 기록 DataFrame (self.ledger.to_wide_frame 참고)
+
+        자산별 한 행인 형태(Ticker, Quantity, Notional 등)는 self.ledger.to_frame()을 사용합니다.
+        """
+        return self.ledger.to_wide_frame()
+
+    @property
+    def portfolio_history(self):
+        """일일 기록 DataFrame (처음 사용할 때 self.history에서 만들고 이후 재사용)"""
+        if self._history_frame is None:
+            self._history_frame = self.history.to_frame() if self.history is not None else pd.DataFrame()
+        return self._history_frame
+
+    def _set_history(self, history):
+        self.history = history
+        self._history_frame = None
+
+    @property
+    def price_store(self):
+        """self.data에 대한 날짜 인덱스 가격 저장소 (데이터가 바뀌면 다시 생성)"""
+        if getattr(self, '_price_store_source', None) is not self.data:
+            self._price_store = PriceStore.from_frame(self.data)
+            self._price_store_source = self.data
+        return self._price_store
+
+    def fetch_data(self, start_date, end_date, cache_dir=DEFAULT_CACHE_DIR, offline=False, cache=None,
+                   source=None):
+        """
+        자산 가격 데이터를 가져옵니다.
+
+        Parameters:
+        - cache_dir: 가격 캐시 디렉터리
+        - offline: True이면 네트워크 없이 캐시에서만 읽습니다
+        - cache: 여러 시뮬레이터가 공유할 PriceCache (지정하면 cache_dir/offline 무시)
+        - source: 데이터 소스 (예: SyntheticSource, 지정하면 가격 캐시를 거치지 않음)
+        """
+        names = "과 ".join(self.tickers) if len(self.tickers) == 2 else ", ".join(self.tickers)
+        print(f"{names} 데이터를 수집하는 중... ({start_date} ~ {end_date})")
+
+        try:
+            with span('load_universe'):
+                if source is not None:
+                    universe = load_universe(self.tickers, start_date, end_date, source=source)
+                else:
+                    # 캐시에 있는 구간은 재사용하고 부족한 구간만 동시에 내려받기
+                    if cache is None:
+                        cache = PriceCache(cache_dir, offline=offline)
+                    universe = load_universe(self.tickers, start_date, end_date, cache=cache)
+            columns = ['Date'] + self.price_columns + [f"{ticker}_Volume" for ticker in self.tickers]
+            self.data = universe.panel[columns]
+            count('rows_loaded', len(self.data))
+
+            print(f"데이터 수집 완료: {len(self.data)}개 거래일")
+            print(f"기간: {self.data['Date'].iloc[0].strftime('%Y-%m-%d')} ~ {self.data['Date'].iloc[-1].strftime('%Y-%m-%d')}")
+            universe.print_latency_report()
+
+            return True
+
+        except Exception as e:
+            print(f"데이터 수집 중 오류 발생: {e}")
+            return False
+
+    def _prices_at(self, idx):
+        return np.array([self.price_store.column(ticker)[idx] for ticker in self.tickers])
+
+    def _volumes(self, store):
+        """(거래일 수, 자산 수) 거래량 배열 (거래량 컬럼이 없으면 None)"""
+        if not all(f"{ticker}_Volume" in store.columns for ticker in self.tickers):
+            return None
+        return store.slice(self.tickers, field='Volume')
+
+    def initial_investment(self, date):
+        """초기 투자를 실행합니다 (거래 기록과 리밸런싱 날짜를 새로 시작)."""
+        store = self.price_store
+        idx = store.index_of(date)
+        prices = np.array([store.price_at(ticker, date) for ticker in self.tickers])
+
+        # 초기 투자금 배분
+        investments = self.cash * self.portfolio.weights
+        change = self.portfolio.rebalance(prices)
+
+        # 거래 기록
+        self.ledger = TradeLedger(self.tickers, store.dates())
+        self.ledger.append(idx, change, prices)
+        self.rebalance_dates = []
+
+        print(f"초기 투자 완료 ({date.strftime('%Y-%m-%d')})")
+        for ticker, shares, price, investment in zip(self.tickers, self.portfolio.holdings, prices, investments):
+            print(f"{ticker}: {shares:.2f}주 @ ${price:.2f} = ${investment:,.2f}")
+
+    def calculate_portfolio_value(self, date):
+        """특정 날짜의 포트폴리오 가치를 계산합니다."""
+        idx = self.price_store.index_of(date)
+        if idx < 0:
+            return 0
+
+        return self.portfolio.value(self._prices_at(idx))
+
+    def rebalance_portfolio(self, date, target_weights=None):
+        """포트폴리오를 리밸런싱합니다."""
+        current_value = self.calculate_portfolio_value(date)
+        if current_value == 0:
+            return
+
+        idx = self.price_store.index_of(date)
+        prices = self._prices_at(idx)
+        # 목표 비율 합이 1보다 작으면 나머지를 현금으로 (simulate_rebalancing과 같음)
+        change = self.portfolio.rebalance(prices, target_weights)
+
+        # 거래 기록
+        self.ledger.append(idx, change, prices)
+        self.rebalance_dates.append(date)
+        self._print_rebalance(date, current_value, self.portfolio.holdings, change)
+
+    def _print_rebalance(self, date, current_value, holdings, change):
+        if self.verbose_rebalance:
+            print(f"리밸런싱 완료 ({date.strftime('%Y-%m-%d')})")
+            print(f"포트폴리오 가치: ${current_value:,.2f}")
+            for ticker, shares, diff in zip(self.tickers, holdings, change):
+                print(f"{ticker}: {shares:.2f}주 ({diff:+.2f})")
+
+    def _record_events(self, store, result, costs=None):
+        """
+        시뮬레이션 결과의 거래 이벤트를 거래 기록, 리밸런싱 날짜, 보유 수량에 반영합니다.
+
+        costs(DEFAULT_COSTS 항목 일부)가 있으면 모든 거래의 수수료/슬리피지를 한 번에 계산하고
+        (trade_ledger.trade_costs 참고) 그 비용을 차감한 결과를 반환합니다.
+        비용 없는 경로 기준 비용을 비례 비용과 시장 충격 비용으로 나누어 차감 배수를 구하고
+        (simulation_engine.apply_trade_costs 참고), 거래 수량을 그 배수로 조정한 뒤 비용을
+        다시 계산하므로 거래 기록의 수수료/슬리피지 합은 차감한 비용과 같습니다.
+        """
+        events = result['event_indices']
+        event_prices = np.column_stack([store.column(ticker)[events] for ticker in self.tickers])
+        ledger = TradeLedger.from_events(self.tickers, store.dates(), events, result['event_shares'], event_prices)
+        if costs is not None:
+            costs = {**DEFAULT_COSTS, **costs}
+            volumes = self._volumes(store)
+            linear = ledger.apply_costs(volumes, **{**costs, 'impact': 0.0}).event_costs(len(events))
+            total = ledger.apply_costs(volumes, **costs).event_costs(len(events))
+            result = apply_trade_costs(result, linear, total - linear if volumes is not None else None)
+            ledger.scale_events(result['event_factors']).apply_costs(volumes, **costs)
+        self.ledger = ledger
+
+        self.rebalance_dates = [store.date_at(idx) for idx in events[1:]]
+        if self.verbose_rebalance:
+            changes = np.diff(result['event_shares'], axis=0)
+            for k, date in enumerate(self.rebalance_dates, 1):
+                self._print_rebalance(date, result['event_values'][k], result['event_shares'][k], changes[k - 1])
+        self.portfolio.holdings = result['event_shares'][-1].copy()
+        return result
+
+    def simulation_key(self, rebalance_frequency, band=0.05):
+        """가격 데이터 지문과 시뮬레이션 파라미터로 결과 캐시 키를 만듭니다."""
+        store = self.price_store
+        volumes = self._volumes(store) if self.costs is not None else None
+        return cache_key(
+            engine_version=ENGINE_VERSION,
+            data=data_fingerprint(store.timestamps, store.slice(self.tickers)),
+            start=str(store.date_at(0)),
+            end=str(store.date_at(len(store) - 1)),
+            tickers=self.tickers,
+            weights=self.portfolio.weights.tolist(),
+            initial_capital=self.initial_capital,
+            rebalance_frequency=rebalance_frequency,
+            band=band if rebalance_frequency == 'band' else None,
+            costs={**DEFAULT_COSTS, **self.costs} if self.costs is not None else None,
+            volumes=data_fingerprint(volumes) if volumes is not None else None,
+            history_dtype=np.dtype(self.history_dtype).str,
+        )
+
+    def _result_state(self):
+        return {
+            'history': self.history,
+            'ledger': self.ledger,
+            'rebalance_dates': self.rebalance_dates,
+            'holdings': self.portfolio.holdings.copy(),
+            'cash': self.cash,
+        }
+
+    def _restore_result_state(self, state):
+        self._set_history(state['history'])
+        self.ledger = state['ledger']
+        self.rebalance_dates = state['rebalance_dates']
+        self.portfolio.holdings = state['holdings'].copy()
+        self.cash = state['cash']
+        self.calculate_performance_metrics()
+
+    def run_simulation(self, rebalance_frequency='monthly', band=0.05, result_cache=None):
+        """
+        모의투자 시뮬레이션을 실행합니다.
+
+        Parameters:
+        - rebalance_frequency: 리밸런싱 주기 ('monthly', 'quarterly', 'month_end', 'weekly', 정수 N 거래일, 'band' 등)
+        - band: 'band' 방식에서 리밸런싱을 실행할 목표 비율 이탈 폭 (기본값: 0.05 = ±5%p)
+        - result_cache: ResultCache (지정하면 같은 데이터/파라미터의 저장된 결과를 재사용)
+
+        self.costs(예: {'fee_rate': 0.001}, 나머지는 DEFAULT_COSTS)를 지정하면 거래량 기반
+        수수료/슬리피지를 차감합니다. None이면 거래 비용 없이 종가에 체결합니다.
+        """
+        if not hasattr(self, 'data') or self.data.empty:
+            print("먼저 데이터를 가져와주세요.")
+            return
+
+        print(f"\n=== {'-'.join(self.tickers)} {self.simulation_name} 시뮬레이션 시작 ===")
+        print(f"초기 투자금: ${self.initial_capital:,.2f}")
+        ratios = ", ".join(f"{ticker} {weight:.1%}" for ticker, weight in zip(self.tickers, self.portfolio.weights))
+        print(f"포트폴리오 비율: {ratios}")
+        if rebalance_frequency == 'band':
+            print(f"리밸런싱 주기: {rebalance_frequency} (목표 비율 ±{band:.1%})")
+        else:
+            print(f"리밸런싱 주기: {rebalance_frequency}")
+
+        key = self.simulation_key(rebalance_frequency, band) if result_cache is not None else None
+        if key is not None:
+            state = result_cache.get(key)
+            count('result_cache_hits' if state is not None else 'result_cache_misses')
+            if state is not None:
+                self._restore_result_state(state)
+                print(f"\n=== 저장된 결과 사용 (캐시 키 {key[:12]}) ===")
+                self.print_performance_summary()
+                return
+
+        # 첫 번째 거래일에 초기 투자
+        first_date = self.data['Date'].iloc[0]
+        self.initial_investment(first_date)
+
+        # 리밸런싱 거래일 인덱스
+        store = self.price_store
+        prices = store.slice(self.tickers)
+        with span('rebalance_schedule'):
+            indices = rebalance_indices(store.dates(), prices, self.portfolio.weights,
+                                        rebalance_frequency, band)
+
+        with span('engine', core=True):
+            # 일일 포트폴리오 가치 기록 (날짜/가격은 가격 저장소 배열을 참조)
+            history = PortfolioHistory(store.dates(), self.tickers,
+                                       {ticker: store.column(ticker) for ticker in self.tickers},
+                                       self.history_dtype)
+            # 보유 수량을 구간별로 forward-fill 하여 일일 가치를 기록 버퍼에 바로 계산
+            result = simulate_rebalancing(prices, self.portfolio.weights,
+                                          self.initial_capital, indices, out=history.buffers())
+
+            # 거래 기록 (거래 비용이 있으면 기록 버퍼에서 차감)
+            result = self._record_events(store, result, self.costs)
+            self.cash = float(result['cash'][-1])
+            self._set_history(history)
+        count('rows', len(store))
+        count('rebalances', len(self.rebalance_dates))
+
+        # 성과 지표 계산
+        with span('metrics'):
+            self.calculate_performance_metrics()
+        if key is not None:
+            result_cache.put(key, self._result_state())
+
+        print(f"\n=== 시뮬레이션 완료 ===")
+        self.print_performance_summary()
+
+    def calculate_performance_metrics(self):
+        """성과 지표를 계산합니다."""
+        if self.history is None or self.history.empty:
+            return
+
+        self.periods_per_year = infer_periods_per_year(self.history.dates)
+        metrics = compute_performance_metrics(self.history.dates, self.history.portfolio_value,
+                                              self.initial_capital,
+                                              periods_per_year=self.periods_per_year)
+        self.final_value = metrics['final_value']
+        self.total_return = metrics['total_return']
+        self.annual_return = metrics['annual_return']
+        self.volatility = metrics['volatility']
+        self.max_drawdown = metrics['max_drawdown']
+        self.sharpe_ratio = metrics['sharpe_ratio']
+
+    def calculate_rolling_metrics(self, windows=DEFAULT_WINDOWS):
+        """
+        이동 창별 위험 지표를 계산합니다 (rolling_analytics.compute_rolling_metrics 참고).
+
+        Returns:
+        - dict: 'Date'와 '{지표}_{창}' 배열 (DataFrame으로 바로 변환 가능)
+        """
+        if self.history is None or self.history.empty:
+            return {}
+
+        store = self.price_store
+        return compute_rolling_metrics(store.dates(), self.history.portfolio_value,
+                                       store.slice(self.tickers), windows, tuple(self.tickers),
+                                       periods_per_year=self.periods_per_year)
+
+    def run_chunked_simulation(self, store, rebalance_frequency='monthly', band=0.05,
+                               chunk_rows=DEFAULT_CHUNK_ROWS, history_dir=None):
+        """
+        메모리에 올릴 수 없는 긴 분봉/시간봉 패널을 청크 단위로 시뮬레이션합니다.
+
+        가격은 PriceStore(예: PriceStore.open으로 메모리 매핑한 디스크 패널)에서
+        chunk_rows 행씩 읽고, 성과 지표는 StreamingMetrics로 누적하므로 메모리 사용량은
+        청크 크기에 비례합니다. 연율화 기간 수는 봉 간격에서 추정합니다.
+        portfolio_history는 만들지 않으며, history_dir을 지정하면 봉별 가치를 디스크 패널로 저장합니다.
+
+        Parameters:
+        - store: PriceStore
+        - rebalance_frequency: 리밸런싱 주기 ('hourly', 'daily', 'monthly', 정수 N 봉, 'band' 등)
+        - band: 'band' 방식의 허용 이탈 폭
+        - chunk_rows: 한 번에 처리할 행 수
+        - history_dir: 봉별 포트폴리오 가치를 저장할 패널 디렉토리 (PriceStore.open으로 읽기)
+        """
+        from price_store import append_panel
+
+        if len(store) == 0:
+            print("먼저 데이터를 가져와주세요.")
+            return
+
+        print(f"\n=== {'-'.join(self.tickers)} {self.simulation_name} 청크 시뮬레이션 시작 ===")
+        print(f"초기 투자금: ${self.initial_capital:,.2f}")
+        print(f"봉 수: {len(store):,}개 ({store.date_at(0)} ~ {store.date_at(len(store) - 1)})")
+        print(f"리밸런싱 주기: {rebalance_frequency}")
+
+        self._set_history(None)
+        self.periods_per_year = infer_periods_per_year(store.timestamps)
+        metrics = StreamingMetrics(self.initial_capital, periods_per_year=self.periods_per_year)
+
+        def on_chunk(start, dates, result):
+            metrics.update_many(dates, result['portfolio_value'])
+            if history_dir is not None:
+                history = {'Date': dates, 'Portfolio_Value': result['portfolio_value']}
+                for i, ticker in enumerate(self.tickers):
+                    history[f"{ticker}_Value"] = result['asset_values'][:, i]
+                history['Cash'] = result['cash']
+                append_panel(history_dir, pd.DataFrame(history))
+
+        with span('engine', core=True):
+            result = simulate_rebalancing_chunked(store, self.tickers, self.portfolio.weights, self.initial_capital,
+                                                  rebalance_frequency, band, chunk_rows, on_chunk)
+
+        # 초기 투자와 리밸런싱 기록 (거래 비용은 반영하지 않음)
+        self._record_events(store, result)
+        self.cash = result['final_cash']
+        count('rows', len(store))
+        count('rebalances', len(self.rebalance_dates))
+
+        snapshot = metrics.snapshot()
+        self.final_value = snapshot['final_value']
+        self.total_return = snapshot['total_return']
+        self.annual_return = snapshot['annual_return']
+        self.volatility = snapshot['volatility']
+        self.max_drawdown = snapshot['max_drawdown']
+        self.sharpe_ratio = snapshot['sharpe_ratio']
+
+        print(f"\n=== 시뮬레이션 완료 (연율화 기간 수 {self.periods_per_year:,.0f}) ===")
+        self.print_performance_summary()
+
+    def result_tables(self):
+        """
+        저장할 결과 표를 반환합니다.
+
+        Returns:
+        - dict: Portfolio_History, Trade_History, Performance_Summary (숫자 값)
+        """
+        metrics = ['initial_capital', 'final_value', 'total_return', 'annual_return',
+                   'volatility', 'max_drawdown', 'sharpe_ratio', 'rebalances']
+        values = [self.initial_capital, self.final_value,
+                  self.total_return, self.annual_return, self.volatility, self.max_drawdown,
+                  self.sharpe_ratio, len(self.rebalance_dates)]
+        if self.history is not None and not self.history.empty:
+            value = self.history.portfolio_value
+            metrics += ['trades_per_year', 'turnover', 'trade_costs', 'cost_drag']
+            values += [self.ledger.trades_per_year(len(value), self.periods_per_year),
+                       self.ledger.turnover(value, self.periods_per_year), self.ledger.costs.sum(),
+                       self.ledger.cost_drag(value, self.periods_per_year)]
+        summary = pd.DataFrame({'Metric': metrics, 'Value': values})
+        return {
+            'Portfolio_History': self.portfolio_history,
+            'Trade_History': self.trade_history,
+            'Performance_Summary': summary,
+        }
+
+    def export_results(self, directory, fmt='parquet'):
+        """
+        결과 표를 빠른 컬럼 형식으로 저장합니다 (result_export.export_tables 참고).
+
+        Parameters:
+        - directory: 저장 디렉토리
+        - fmt: 'parquet', 'arrow', 'csv' (Excel은 save_results 사용)
+        """
+        paths = export_tables(self.result_tables(), directory, fmt)
+        count('bytes_written', sum(os.path.getsize(path) for path in paths))
+        print(f"결과가 {directory}에 저장되었습니다 ({fmt}, {len(paths)}개 파일).")
+        return paths
+
+    def print_performance_summary(self):
+        """성과 요약을 출력합니다."""
+        final_value = self.final_value
+
+        print(f"\n포트폴리오 성과 요약")
+        print(f"{'='*50}")
+        print(f"초기 투자금: ${self.initial_capital:,.2f}")
+        print(f"최종 가치: ${final_value:,.2f}")
+        print(f"총 수익률: {self.total_return:.2%}")
+        print(f"연간 수익률: {self.annual_return:.2%}")
+        print(f"샤프 비율: {self.sharpe_ratio:.3f}")
+        self.print_trade_costs()
+
+    def print_trade_costs(self):
+        """거래 비용을 반영한 경우 비용 합계를 출력합니다."""
+        if self.costs is not None and len(self.ledger):
+            print(f"거래 비용: ${self.ledger.costs.sum():,.2f} (수수료 ${self.ledger.records['fee'].sum():,.2f}, "
+                  f"슬리피지 ${self.ledger.records['slippage'].sum():,.2f})")
+
+
+class SOXLVXXSimulator(PortfolioSimulator):
+    def __init__(self, initial_capital=100000, soxl_ratio=0.75, vxx_ratio=0.25):
+        """
+        SOXL/VXX 2자산 구성의 시뮬레이터
+
+        기존 속성 이름(soxl_shares, vxx_shares, soxl_ratio, vxx_ratio)은
+        포트폴리오 벡터의 해당 원소를 가리킵니다.
+        """
+        super().__init__(['SOXL', 'VXX'], [soxl_ratio, vxx_ratio], initial_capital)
+
+    @property
+    def soxl_ratio(self):
+        return self.portfolio.weights[0]
+
+    @soxl_ratio.setter
+    def soxl_ratio(self, value):
+        self.portfolio.weights[0] = value
+
+    @property
+    def vxx_ratio(self):
+        return self.portfolio.weights[1]
+
+    @vxx_ratio.setter
+    def vxx_ratio(self, value):
+        self.portfolio.weights[1] = value
+
+    @property
+    def soxl_shares(self):
+        return self.portfolio.holdings[0]
+
+    @soxl_shares.setter
+    def soxl_shares(self, value):
+        self.portfolio.holdings[0] = value
+
+    @property
+    def vxx_shares(self):
+        return self.portfolio.holdings[1]
+
+    @vxx_shares.setter
+    def vxx_shares(self, value):
+        self.portfolio.holdings[1] = value
+
+    def rebalance_portfolio(self, date, target_soxl_ratio=0.75, target_vxx_ratio=0.25):
+        """포트폴리오를 리밸런싱합니다."""
+        super().rebalance_portfolio(date, [target_soxl_ratio, target_vxx_ratio])
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+
+class PortfolioHistory:
+    def __init__(self, dates, tickers, prices, dtype=np.float64):
+        """
+        일일 포트폴리오 기록을 미리 할당한 타입 지정 컬럼으로 보관합니다.
+
+        - 가치 컬럼(Portfolio_Value, 자산별 가치, Cash)은 (컬럼 수, 거래일 수) 블록 하나로
+          미리 할당하므로 컬럼마다 연속된 배열이며, dtype=np.float32이면 메모리가 절반입니다
+        - 날짜와 가격은 PriceStore 배열을 참조만 하고 복사하지 않습니다
+        - DataFrame은 to_frame()을 호출할 때만 만듭니다
+
+        Parameters:
+        - dates: 거래일 datetime64[ns] 배열 (참조)
+        - tickers: 자산 티커 목록
+        - prices: 티커 -> 가격 배열 (참조)
+        - dtype: 가치 컬럼 자료형 (np.float64 또는 np.float32)
+        """
+        self.dates = dates
+        self.tickers = list(tickers)
+        self.prices = prices
+        self.values = np.empty((len(self.tickers) + 2, len(dates)), dtype=dtype)
+
+    def buffers(self):
+        """simulate_rebalancing(out=...)에 넘길 가치 컬럼 뷰 (복사 없음)"""
+        return {'portfolio_value': self.values[0], 'asset_values': self.values[1:-1].T, 'cash': self.values[-1]}
+
+    @classmethod
+    def from_result(cls, dates, tickers, prices, result, dtype=np.float64):
+        """simulate_rebalancing 결과를 복사하여 기록을 채웁니다."""
+        history = cls(dates, tickers, prices, dtype)
+        history.values[0] = result['portfolio_value']
+        history.values[1:-1] = result['asset_values'].T
+        history.values[-1] = result['cash']
+        return history
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def empty(self):
+        return len(self.dates) == 0
+
+    @property
+    def portfolio_value(self):
+        return self.values[0]
+
+    @property
+    def cash(self):
+        return self.values[-1]
+
+    def asset_value(self, ticker):
+        return self.values[1 + self.tickers.index(ticker)]
+
+    @property
+    def nbytes(self):
+        """이 기록이 소유한 메모리 (참조하는 날짜/가격 제외)."""
+        return self.values.nbytes
+
+    def to_frame(self):
+        """기존 portfolio_history와 같은 컬럼 구성의 DataFrame을 만듭니다."""
+        columns = {'Date': self.dates, 'Portfolio_Value': self.portfolio_value}
+        for ticker in self.tickers:
+            columns[f"{ticker}_Value"] = self.asset_value(ticker)
+        columns['Cash'] = self.cash
+        for ticker in self.tickers:
+            columns[f"{ticker}_Price"] = self.prices[ticker]
+        return pd.DataFrame(columns)
@@ -0,0 +1,151 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import count
+from universe_loader import YFinanceSource
+
+DEFAULT_CACHE_DIR = os.environ.get('ETF_PRICE_CACHE', '.price_cache')
+MANIFEST_FILE = 'manifest.json'
+OHLCV_FIELDS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+
+
+def download_ohlcv(ticker, start, end):
+    """yfinance에서 티커의 일봉 OHLCV 데이터를 내려받습니다."""
+    return YFinanceSource().fetch(ticker, start, end)
+
+
+class PriceCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, offline=False, downloader=download_ohlcv):
+        """
+        티커별 가격 데이터를 로컬 .npy 파일로 보관하는 캐시
+
+        manifest.json에 티커별로 캐시가 포함하는 날짜 범위([start, end), end 미포함)를
+        기록합니다. 요청 범위가 캐시에 포함되면 네트워크 호출 없이 반환하고,
+        그렇지 않으면 부족한 앞/뒤 구간만 내려받아 합칩니다.
+
+        Parameters:
+        - cache_dir: 캐시 디렉터리 (기본값: 환경 변수 ETF_PRICE_CACHE 또는 .price_cache)
+        - offline: True이면 캐시만 읽고 네트워크를 사용하지 않습니다
+        - downloader: (ticker, start, end) -> OHLCV DataFrame 함수
+        """
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self.downloader = downloader
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.manifest = self._read_manifest()
+
+    def _path(self, ticker, kind):
+        return os.path.join(self.cache_dir, f"{ticker}.{kind}.npy")
+
+    def _read_manifest(self):
+        path = os.path.join(self.cache_dir, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self):
+        path = os.path.join(self.cache_dir, MANIFEST_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def coverage(self, ticker):
+        """캐시가 포함하는 날짜 범위 (start, end)를 반환합니다. 없으면 None."""
+        entry = self.manifest.get(ticker)
+        if entry is None:
+            return None
+        return pd.Timestamp(entry['start']), pd.Timestamp(entry['end'])
+
+    def load(self, ticker):
+        """캐시된 전체 데이터를 DataFrame으로 반환합니다. 없으면 None."""
+        entry = self.manifest.get(ticker)
+        if entry is None:
+            return None
+        dates = np.load(self._path(ticker, 'dates'))
+        values = np.load(self._path(ticker, 'values'))
+        index = pd.DatetimeIndex(dates.view('datetime64[ns]'), name='Date')
+        return pd.DataFrame(values, index=index, columns=entry['fields'])
+
+    def store(self, ticker, frame, start, end):
+        """데이터와 포함 범위 [start, end)를 캐시에 기록합니다."""
+        fields = [field for field in OHLCV_FIELDS if field in frame.columns]
+        frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+        dates = pd.DatetimeIndex(frame.index).as_unit('ns').asi8
+        np.save(self._path(ticker, 'dates'), dates)
+        np.save(self._path(ticker, 'values'), frame[fields].to_numpy(dtype=np.float64))
+
+        with self._lock:
+            self.manifest[ticker] = {
+                'start': pd.Timestamp(start).strftime('%Y-%m-%d'),
+                'end': pd.Timestamp(end).strftime('%Y-%m-%d'),
+                'rows': int(len(frame)),
+                'fields': fields,
+                'updated': datetime.now().isoformat(timespec='seconds'),
+            }
+            self._write_manifest()
+
+    def _download(self, ticker, start, end, downloader=None):
+        downloader = downloader or self.downloader
+        frame = downloader(ticker, start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+        frame.index = pd.DatetimeIndex(frame.index).tz_localize(None)
+        return frame[(frame.index >= start) & (frame.index < end)]
+
+    def get(self, ticker, start, end, downloader=None):
+        """
+        [start, end) 구간의 OHLCV 데이터를 반환합니다.
+
+        오늘 이후 구간은 장중 데이터가 섞일 수 있으므로 캐시 범위를 오늘 이전까지로
+        제한합니다. 다음 실행 때는 마지막으로 캐시된 날짜 이후만 내려받습니다.
+        downloader를 지정하면 이 호출에서만 self.downloader 대신 사용합니다.
+        """
+        start = pd.Timestamp(start).normalize()
+        end = min(pd.Timestamp(end).normalize(), pd.Timestamp.today().normalize())
+        covered = self.coverage(ticker)
+
+        if covered is not None and covered[0] <= start and end <= covered[1]:
+            with self._lock:
+                self.hits += 1
+            count('price_cache_hits')
+            frame = self.load(ticker)
+            return frame[(frame.index >= start) & (frame.index < end)]
+
+        if self.offline:
+            raise ValueError(f"오프라인 모드: {ticker} 캐시에 {start:%Y-%m-%d} ~ {end:%Y-%m-%d} 데이터가 없습니다.")
+
+        with self._lock:
+            self.misses += 1
+        count('price_cache_misses')
+        if covered is None:
+            frame = self._download(ticker, start, end, downloader)
+            if frame.empty:
+                raise ValueError(f"{ticker} 데이터를 가져올 수 없습니다.")
+            self.store(ticker, frame, start, end)
+            return frame
+
+        cache_start, cache_end = covered
+        pieces = [self.load(ticker)]
+
+        # 캐시 앞/뒤 부족분: 내려받기에 성공하면 (휴장일만 있어 빈 결과여도)
+        # 처음 내려받을 때와 같이 요청 범위 [start, end)를 포함 범위로 기록합니다
+        if start < cache_start:
+            pieces.insert(0, self._download(ticker, start, cache_start, downloader))
+            cache_start = start
+
+        if end > cache_end:
+            pieces.append(self._download(ticker, cache_end, end, downloader))
+            cache_end = end
+
+        merged = pd.concat([piece for piece in pieces if not piece.empty])
+        self.store(ticker, merged, cache_start, cache_end)
+        merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        return merged[(merged.index >= start) & (merged.index < end)]
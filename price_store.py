@@ -0,0 +1,176 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+PANEL_MANIFEST = 'panel.json'
+TIMESTAMP_FILE = 'Date.i8'
+
+
+def _panel_path(directory, name):
+    return os.path.join(directory, f"{name}.f8" if name != 'Date' else TIMESTAMP_FILE)
+
+
+def _read_panel_manifest(directory):
+    path = os.path.join(directory, PANEL_MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def append_panel(directory, data, date_column='Date'):
+    """
+    self.data 형식 DataFrame 청크를 디스크 가격 패널 끝에 추가합니다.
+
+    컬럼마다 헤더 없는 연속 바이너리 파일(타임스탬프 int64 ns, 값 float64)에
+    이어 쓰고 panel.json에 행 수를 기록하므로, 전체 데이터를 메모리에 올리지
+    않고 청크 단위로 몇 억 개 값의 분봉 패널을 만들 수 있습니다.
+    PriceStore.open으로 메모리 매핑하여 읽습니다.
+
+    Parameters:
+    - directory: 패널 디렉토리 (없으면 생성)
+    - data: 'Date'와 가격/거래량 컬럼을 가진 DataFrame (이전 청크 이후 시각)
+    - date_column: 날짜 컬럼 이름
+
+    Returns:
+    - 추가 후 전체 행 수
+    """
+    os.makedirs(directory, exist_ok=True)
+    timestamps = pd.DatetimeIndex(data[date_column]).as_unit('ns').asi8
+    columns = [name for name in data.columns if name != date_column]
+    manifest = _read_panel_manifest(directory) or {'rows': 0, 'columns': columns, 'last_timestamp': None}
+    if manifest['columns'] != columns:
+        raise ValueError(f"패널 컬럼이 다릅니다: {manifest['columns']} != {columns}")
+    if len(timestamps) == 0:
+        return manifest['rows']
+    if np.any(np.diff(timestamps) <= 0) or (manifest['last_timestamp'] is not None
+                                            and timestamps[0] <= manifest['last_timestamp']):
+        raise ValueError("거래일이 오름차순으로 정렬되어 있지 않습니다.")
+
+    with open(_panel_path(directory, 'Date'), 'ab') as f:
+        f.write(np.ascontiguousarray(timestamps, dtype=np.int64).tobytes())
+    for name in columns:
+        with open(_panel_path(directory, name), 'ab') as f:
+            f.write(np.ascontiguousarray(data[name].to_numpy(), dtype=np.float64).tobytes())
+
+    manifest['rows'] += len(timestamps)
+    manifest['last_timestamp'] = int(timestamps[-1])
+    path = os.path.join(directory, PANEL_MANIFEST)
+    with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(f"{path}.tmp", path)
+    return manifest['rows']
+
+
+class PriceStore:
+    def __init__(self, dates, columns):
+        """
+        날짜 인덱스 기반 가격 저장소
+
+        타임스탬프는 int64(ns) 배열로, 각 컬럼은 연속된 float64 배열로 보관하여
+        특정 날짜 가격 조회를 이진 탐색(O(log n))으로 처리합니다.
+
+        Parameters:
+        - dates: 오름차순으로 정렬된 거래일 (datetime-like)
+        - columns: 컬럼명 -> 값 배열 딕셔너리 (예: {'SOXL_Close': ...})
+        """
+        self.timestamps = np.ascontiguousarray(pd.DatetimeIndex(dates).as_unit('ns').asi8, dtype=np.int64)
+        if len(self.timestamps) > 1 and np.any(np.diff(self.timestamps) <= 0):
+            raise ValueError("거래일이 오름차순으로 정렬되어 있지 않습니다.")
+
+        self.columns = {}
+        for name, values in columns.items():
+            values = np.ascontiguousarray(values, dtype=np.float64)
+            if len(values) != len(self.timestamps):
+                raise ValueError(f"{name} 컬럼 길이가 거래일 수와 다릅니다.")
+            self.columns[name] = values
+
+    @classmethod
+    def from_frame(cls, data, date_column='Date'):
+        """시뮬레이터의 self.data 형식 DataFrame에서 저장소를 생성합니다."""
+        columns = {name: data[name].to_numpy() for name in data.columns if name != date_column}
+        return cls(data[date_column].to_numpy(), columns)
+
+    @classmethod
+    def open(cls, directory):
+        """
+        append_panel로 만든 디스크 패널을 메모리 매핑으로 엽니다 (읽기 전용).
+
+        가격 조회와 slice는 필요한 구간만 디스크에서 읽습니다.
+        """
+        manifest = _read_panel_manifest(directory)
+        if manifest is None:
+            raise FileNotFoundError(f"가격 패널이 없습니다: {directory}")
+        rows = manifest['rows']
+
+        def mapped(name, dtype):
+            if rows == 0:
+                return np.empty(0, dtype=dtype)
+            return np.memmap(_panel_path(directory, name), dtype=dtype, mode='r', shape=(rows,))
+
+        store = cls.__new__(cls)
+        store.timestamps = mapped('Date', np.int64)
+        store.columns = {name: mapped(name, np.float64) for name in manifest['columns']}
+        return store
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @staticmethod
+    def _to_timestamp(date):
+        return pd.Timestamp(date).as_unit('ns').value
+
+    def column(self, ticker, field='Close'):
+        """티커의 가격 배열을 반환합니다 ('SOXL' 또는 'SOXL_Close' 모두 허용)."""
+        if ticker in self.columns:
+            return self.columns[ticker]
+        return self.columns[f"{ticker}_{field}"]
+
+    def index_of(self, date):
+        """거래일의 위치를 반환합니다. 거래일이 아니면 -1을 반환합니다."""
+        ts = self._to_timestamp(date)
+        idx = int(np.searchsorted(self.timestamps, ts, side='left'))
+        if idx < len(self.timestamps) and self.timestamps[idx] == ts:
+            return idx
+        return -1
+
+    def price_at(self, ticker, date, field='Close'):
+        """특정 거래일의 가격을 반환합니다. 거래일이 아니면 KeyError를 발생시킵니다."""
+        idx = self.index_of(date)
+        if idx < 0:
+            raise KeyError(f"{pd.Timestamp(date).strftime('%Y-%m-%d')}는 거래일이 아닙니다.")
+        return self.column(ticker, field)[idx]
+
+    def next_trading_index(self, date, inclusive=False):
+        """
+        주어진 날짜 이후 첫 번째 거래일의 위치를 반환합니다.
+
+        inclusive=True이면 날짜 자체가 거래일인 경우 그 날을 반환합니다.
+        해당하는 거래일이 없으면 len(self)를 반환합니다. date에 배열을 넘기면
+        searchsorted 한 번으로 모든 날짜를 처리합니다.
+        """
+        side = 'left' if inclusive else 'right'
+        if np.ndim(date) == 0:
+            return int(np.searchsorted(self.timestamps, self._to_timestamp(date), side=side))
+        ts = pd.DatetimeIndex(date).as_unit('ns').asi8
+        return np.searchsorted(self.timestamps, ts, side=side)
+
+    def date_at(self, idx):
+        """위치에 해당하는 거래일을 Timestamp로 반환합니다."""
+        return pd.Timestamp(self.timestamps[idx])
+
+    def dates(self, start=0, stop=None):
+        """거래일 구간을 datetime64 배열로 반환합니다."""
+        return self.timestamps[start:stop].view('datetime64[ns]')
+
+    def slice(self, tickers, start=0, stop=None, field='Close'):
+        """여러 티커의 가격 구간을 (거래일 수, 티커 수) 배열로 반환합니다."""
+        return np.column_stack([self.column(ticker, field)[start:stop] for ticker in tickers])
+
+    def slice_dates(self, start_date, end_date, tickers, field='Close'):
+        """날짜 범위 [start_date, end_date]의 가격 구간을 반환합니다."""
+        start = self.next_trading_index(start_date, inclusive=True)
+        stop = self.next_trading_index(end_date)
+        return self.slice(tickers, start, stop, field)
@@ -0,0 +1,196 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# 기간 시작 규칙: 각 기간 첫 거래일(분봉이면 첫 봉)에 리밸런싱
+PERIOD_START_RULES = {'hourly': 'h', 'daily': 'D', 'weekly': 'W-MON', 'monthly': 'MS', 'quarterly': 'QS'}
+# 기간 종료 규칙: 각 기간 마지막 거래일에 리밸런싱
+PERIOD_END_RULES = {'month_end': 'ME', 'quarter_end': 'QE'}
+
+# 규칙으로 계산할 수 없는 NYSE 임시 휴장일
+NYSE_SPECIAL_CLOSURES = (
+    '1994-04-27',  # 닉슨 전 대통령 장례
+    '2001-09-11', '2001-09-12', '2001-09-13', '2001-09-14',  # 9/11
+    '2004-06-11',  # 레이건 전 대통령 장례
+    '2007-01-02',  # 포드 전 대통령 장례
+    '2012-10-29', '2012-10-30',  # 허리케인 샌디
+    '2018-12-05',  # 부시 전 대통령 장례
+    '2025-01-09',  # 카터 전 대통령 장례
+)
+CALENDAR_START_YEAR = 1990
+CALENDAR_END_YEAR = 2040
+
+
+def _easter(year):
+    """그레고리력 부활절 날짜 (Anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return pd.Timestamp(year, month, day + 1)
+
+
+def _nth_weekday(year, month, weekday, n):
+    """month의 n번째 weekday (n=-1이면 마지막)"""
+    if n > 0:
+        first = pd.Timestamp(year, month, 1)
+        return first + pd.Timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = pd.Timestamp(year, month, 1) + pd.offsets.MonthEnd(0)
+    return last - pd.Timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(date):
+    """토요일 휴일은 전날 금요일, 일요일 휴일은 다음 날 월요일에 휴장합니다."""
+    if date.weekday() == 5:
+        return date - pd.Timedelta(days=1)
+    if date.weekday() == 6:
+        return date + pd.Timedelta(days=1)
+    return date
+
+
+def nyse_holidays(start_year=CALENDAR_START_YEAR, end_year=CALENDAR_END_YEAR):
+    """
+    NYSE 정규 휴장일을 규칙으로 계산합니다 (임시 휴장일 포함).
+
+    거래일 달력은 이 결과를 프로세스당 한 번만 계산하여 휴장일 표로 재사용합니다
+    (_holiday_calendar, _business_calendar).
+
+    Returns:
+    - 정렬된 DatetimeIndex
+    """
+    holidays = []
+    for year in range(start_year, end_year + 1):
+        # 새해: 토요일이면 전년도 12/31에 휴장하지 않음
+        new_year = pd.Timestamp(year, 1, 1)
+        if new_year.weekday() != 5:
+            holidays.append(_observed(new_year))
+        if year >= 1998:
+            holidays.append(_nth_weekday(year, 1, 0, 3))  # 마틴 루터 킹 데이
+        holidays.append(_nth_weekday(year, 2, 0, 3))  # 대통령의 날
+        holidays.append(_easter(year) - pd.Timedelta(days=2))  # 성금요일
+        holidays.append(_nth_weekday(year, 5, 0, -1))  # 메모리얼 데이
+        if year >= 2022:
+            holidays.append(_observed(pd.Timestamp(year, 6, 19)))  # 준틴스
+        holidays.append(_observed(pd.Timestamp(year, 7, 4)))  # 독립기념일
+        holidays.append(_nth_weekday(year, 9, 0, 1))  # 노동절
+        holidays.append(_nth_weekday(year, 11, 3, 4))  # 추수감사절
+        holidays.append(_observed(pd.Timestamp(year, 12, 25)))  # 크리스마스
+
+    special = [pd.Timestamp(d) for d in NYSE_SPECIAL_CLOSURES if start_year <= int(d[:4]) <= end_year]
+    return pd.DatetimeIndex(sorted(set(holidays + special)))
+
+
+@lru_cache(maxsize=1)
+def _holiday_calendar():
+    return nyse_holidays().as_unit('ns')
+
+
+@lru_cache(maxsize=1)
+def _business_calendar():
+    return np.busdaycalendar(holidays=_holiday_calendar().values.astype('datetime64[D]'))
+
+
+def trading_days(start, end):
+    """
+    가격 데이터 없이 NYSE 거래일 달력을 생성합니다.
+
+    평일에서 휴장일 달력(CALENDAR_START_YEAR ~ CALENDAR_END_YEAR)을 제외합니다.
+    """
+    start = np.datetime64(pd.Timestamp(start).normalize().date(), 'D')
+    end = np.datetime64(pd.Timestamp(end).normalize().date(), 'D')
+    days = np.arange(start, end + 1, dtype='datetime64[D]')
+    days = days[np.is_busday(days, busdaycal=_business_calendar())]
+    return pd.DatetimeIndex(days.astype('datetime64[ns]'))
+
+
+def rebalance_schedule(dates, rule):
+    """
+    리밸런싱 규칙을 거래일 인덱스로 변환합니다.
+
+    규칙이 정하는 달력 날짜를 만든 뒤 searchsorted 한 번으로 거래일에 대응시킵니다.
+    일봉뿐 아니라 분봉/시간봉 시각에도 그대로 적용됩니다.
+    - 'hourly', 'daily', 'weekly', 'monthly', 'quarterly': 각 기간 시작 시각 또는 이후 첫 봉
+    - 'month_end', 'quarter_end': 각 기간 마지막 거래일의 마지막 봉 (끝나지 않은 마지막 기간 제외)
+    - 정수 N: N 봉마다
+    - 날짜 목록: 각 날짜 당일 또는 이후 첫 거래일
+    - None, 'none', 그 밖의 문자열: 리밸런싱 없음
+
+    datetime64[ns] 배열(예: 메모리 매핑된 PriceStore.dates())은 복사하지 않고
+    이진 탐색만 하므로 전체를 메모리에 올리지 않습니다.
+
+    Parameters:
+    - dates: 정렬된 거래일 (DatetimeIndex, datetime64 배열 또는 trading_days 결과)
+    - rule: 리밸런싱 규칙
+
+    Returns:
+    - 리밸런싱 거래일 인덱스 배열 (초기 투자일 0 제외, 중복 없음)
+    """
+    timestamps = _timestamps(dates)
+    n_days = len(timestamps)
+    if rule is None or (isinstance(rule, str) and rule == 'none') or n_days == 0:
+        return np.array([], dtype=np.int64)
+
+    if isinstance(rule, (int, np.integer)):
+        if rule <= 0:
+            raise ValueError(f"리밸런싱 간격은 1 이상이어야 합니다: {rule}")
+        return np.arange(rule, n_days, rule, dtype=np.int64)
+
+    first, last = pd.Timestamp(timestamps[0]), pd.Timestamp(timestamps[-1])
+    if isinstance(rule, str):
+        if rule in PERIOD_START_RULES:
+            anchor = first.floor('h') if rule == 'hourly' else first.normalize()
+            targets = pd.date_range(start=anchor, end=last, freq=PERIOD_START_RULES[rule])
+            indices = np.searchsorted(timestamps, targets.as_unit('ns').asi8, side='left')
+        elif rule in PERIOD_END_RULES:
+            offset = pd.tseries.frequencies.to_offset(PERIOD_END_RULES[rule])
+            targets = pd.date_range(start=first.normalize(), end=offset.rollforward(last.normalize()), freq=offset)
+            # 마지막 기간은 거래일 달력상 남은 거래일이 없을 때만 끝난 것으로 봅니다
+            if len(targets) and targets[-1] > last and len(trading_days(last, targets[-1])) > 1:
+                targets = targets[:-1]
+            # 기간 마지막 날 다음 자정 직전의 봉 (일봉이면 그 날 자체)
+            next_midnight = (targets + pd.Timedelta(days=1)).as_unit('ns').asi8
+            indices = np.searchsorted(timestamps, next_midnight, side='left') - 1
+        else:
+            # 기존 동작과 같이 알 수 없는 규칙은 리밸런싱 없음
+            return np.array([], dtype=np.int64)
+    else:
+        targets = pd.DatetimeIndex(rule).sort_values()
+        indices = np.searchsorted(timestamps, targets.as_unit('ns').asi8, side='left')
+
+    indices = indices[(indices > 0) & (indices < n_days)]
+    return np.unique(indices).astype(np.int64)
+
+
+def _timestamps(dates):
+    """날짜를 int64(ns) 배열로 바꿉니다 (datetime64[ns] 배열은 복사하지 않음)."""
+    if isinstance(dates, np.ndarray) and dates.dtype == np.dtype('datetime64[ns]'):
+        return dates.view(np.int64)
+    return pd.DatetimeIndex(dates).as_unit('ns').asi8
+
+
+def schedule_dates(rule, start, end):
+    """
+    가격 데이터 없이 거래일 달력으로 리밸런싱 날짜를 생성합니다.
+
+    같은 기간의 여러 시나리오에서 재사용할 수 있도록 결과를 캐시합니다.
+    캐시 키가 같도록 NumPy 정수는 int로, 날짜 목록은 Timestamp 튜플로 바꿉니다.
+    """
+    if isinstance(rule, (int, np.integer)):
+        rule = int(rule)
+    elif not isinstance(rule, (str, type(None))):
+        rule = tuple(pd.DatetimeIndex(rule))
+    return _schedule_dates(rule, pd.Timestamp(start), pd.Timestamp(end))
+
+
+@lru_cache(maxsize=256)
+def _schedule_dates(rule, start, end):
+    days = trading_days(start, end)
+    rule = list(rule) if isinstance(rule, tuple) else rule
+    return days[rebalance_schedule(days, rule)]
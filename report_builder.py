@@ -0,0 +1,172 @@
+import base64
+import html
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import count, span
+
+# plotly.js는 2.28.0부터 {"dtype", "bdata"} 형식의 base64 typed array를 읽을 수 있음
+TYPED_ARRAY_MIN_PLOTLYJS = (2, 28)
+
+_PAGE_STYLE = """
+body { font-family: -apple-system, 'Segoe UI', 'Malgun Gothic', sans-serif; margin: 24px; color: #222; }
+h1 { font-size: 24px; } h2 { font-size: 18px; margin-top: 32px; }
+table { border-collapse: collapse; font-size: 13px; }
+th, td { border: 1px solid #ddd; padding: 4px 10px; text-align: right; }
+th { background: #f5f5f5; }
+"""
+
+
+def _plotlyjs_supports_typed_arrays():
+    from plotly.offline import get_plotlyjs_version
+    version = tuple(int(part) for part in get_plotlyjs_version().split('.')[:2])
+    return version >= TYPED_ARRAY_MIN_PLOTLYJS
+
+
+def _typed_array(values):
+    values = np.ascontiguousarray(values)
+    dtypes = {np.dtype(np.float64): 'f8', np.dtype(np.float32): 'f4', np.dtype(np.int32): 'i4',
+              np.dtype(np.int16): 'i2', np.dtype(np.int8): 'i1', np.dtype(np.uint8): 'u1'}
+    if values.dtype == np.int64:
+        values = values.astype(np.float64)
+    if values.dtype not in dtypes:
+        values = values.astype(np.float64)
+    return {'dtype': dtypes[values.dtype], 'bdata': base64.b64encode(values.tobytes()).decode('ascii')}
+
+
+def _compact(value, typed_arrays):
+    """figure JSON의 NumPy 배열을 base64 typed array(또는 리스트)로 바꿉니다."""
+    if isinstance(value, dict):
+        return {key: _compact(item, typed_arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_compact(item, typed_arrays) for item in value]
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in 'fiu' and value.ndim == 1 and typed_arrays:
+            return _typed_array(value)
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    return value
+
+
+def _date_axes_to_numbers(figure_json):
+    """
+    날짜 배열을 epoch 밀리초 숫자 배열로 바꾸고 해당 축을 date 형식으로 지정합니다.
+
+    ISO 문자열 대신 8바이트 숫자로 저장되므로 typed array로 압축할 수 있습니다.
+    """
+    layout = figure_json.setdefault('layout', {})
+    for trace in figure_json.get('data', []):
+        for axis in ('x', 'y'):
+            values = trace.get(axis)
+            if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+                trace[axis] = values.astype('datetime64[ms]').astype(np.int64).astype(np.float64)
+                trace[axis][np.isnat(values)] = np.nan
+                axis_name = trace.get(f"{axis}axis", axis)
+                axis_key = f"{axis}axis{axis_name[1:]}"
+                layout.setdefault(axis_key, {})['type'] = 'date'
+    return figure_json
+
+
+class HTMLReport:
+    def __init__(self, title):
+        """
+        여러 차트와 표를 plotly.js 한 벌만 포함한 HTML 파일 하나로 묶는 보고서
+
+        - 차트 데이터는 base64 typed array로 저장합니다 (날짜 축은 epoch 밀리초)
+        - 같은 레이아웃 템플릿은 한 번만 저장합니다
+
+        Parameters:
+        - title: 보고서 제목
+        """
+        self.title = title
+        self.sections = []
+
+    def add_heading(self, text):
+        self.sections.append(('heading', text))
+
+    def add_figure(self, fig, title=None):
+        """plotly Figure를 추가합니다."""
+        if title:
+            self.add_heading(title)
+        self.sections.append(('figure', fig))
+
+    def add_table(self, frame, title=None, float_format='{:,.4f}'.format):
+        """DataFrame 표를 추가합니다."""
+        if title:
+            self.add_heading(title)
+        self.sections.append(('table', frame.to_html(index=False, float_format=float_format,
+                                                      border=0, na_rep='-')))
+
+    def to_html(self, include_plotlyjs=True):
+        """
+        보고서 HTML 문자열을 만듭니다.
+
+        Parameters:
+        - include_plotlyjs: True이면 plotly.js를 파일에 포함, 'cdn'이면 CDN 링크 사용
+        """
+        typed_arrays = _plotlyjs_supports_typed_arrays()
+        templates = {}
+        body = []
+        scripts = []
+
+        for kind, content in self.sections:
+            if kind == 'heading':
+                body.append(f"<h2>{html.escape(content)}</h2>")
+            elif kind == 'table':
+                body.append(content)
+            else:
+                figure_json = _date_axes_to_numbers(content.to_plotly_json())
+                layout = figure_json['layout']
+                template = json.dumps(_compact(layout.pop('template', {}), typed_arrays), separators=(',', ':'))
+                template_id = templates.setdefault(template, len(templates))
+                div_id = f"figure-{len(scripts)}"
+                body.append(f'<div id="{div_id}"></div>')
+                scripts.append(
+                    f"draw('{div_id}', {json.dumps(_compact(figure_json['data'], typed_arrays), separators=(',', ':'))}, "
+                    f"{json.dumps(_compact(layout, typed_arrays), separators=(',', ':'))}, {template_id});"
+                )
+
+        if include_plotlyjs == 'cdn':
+            from plotly.offline import get_plotlyjs_version
+            plotlyjs = f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+        elif include_plotlyjs:
+            from plotly.offline import get_plotlyjs
+            plotlyjs = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+        else:
+            plotlyjs = ''
+
+        template_list = ','.join(sorted(templates, key=templates.get))
+        return "\n".join([
+            '<!DOCTYPE html>',
+            '<html><head><meta charset="utf-8">',
+            f'<title>{html.escape(self.title)}</title>',
+            f'<style>{_PAGE_STYLE}</style>',
+            plotlyjs,
+            '</head><body>',
+            f'<h1>{html.escape(self.title)}</h1>',
+            *body,
+            '<script>',
+            f'const TEMPLATES = [{template_list}];',
+            'function draw(id, data, layout, template) {',
+            '  layout.template = TEMPLATES[template];',
+            "  Plotly.newPlot(id, data, layout, {responsive: true});",
+            '}',
+            *scripts,
+            '</script>',
+            '</body></html>',
+        ])
+
+    def write(self, path, include_plotlyjs=True):
+        """보고서를 HTML 파일 하나로 저장합니다."""
+        with span('report_write'):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.to_html(include_plotlyjs))
+        count('bytes_written', os.path.getsize(path))
+        print(f"보고서가 {path}에 저장되었습니다.")
+        return path
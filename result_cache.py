@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+import numpy as np
+
+DEFAULT_RESULT_CACHE_DIR = os.environ.get('ETF_RESULT_CACHE', '.result_cache')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def data_fingerprint(*arrays):
+    """가격/날짜 배열 내용의 해시를 반환합니다 (데이터가 같으면 같은 값)."""
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.dtype.str, array.shape)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def cache_key(**parts):
+    """
+    데이터 지문과 파라미터로 결과 캐시 키를 만듭니다.
+
+    값은 JSON으로 정렬 직렬화하여 해시하므로 인자 순서와 무관합니다.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, cache_dir=DEFAULT_RESULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        시뮬레이션 결과를 내용 해시 키로 저장하는 디스크 캐시
+
+        키가 같으면 (같은 가격 데이터, 같은 파라미터, 같은 엔진 버전) 저장된 결과를
+        그대로 반환합니다. 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은
+        항목부터 삭제합니다 (파일 수정 시각을 마지막 사용 시각으로 사용).
+        항목은 pickle로 저장하므로 신뢰할 수 있는 로컬 디렉터리에만 사용하세요.
+
+        Parameters:
+        - cache_dir: 캐시 디렉터리 (기본값: 환경 변수 ETF_RESULT_CACHE 또는 .result_cache)
+        - max_bytes: 최대 캐시 크기 (기본값: 512MB)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key):
+        """저장된 결과를 반환합니다. 없으면 None."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """결과를 저장하고 크기 제한을 넘으면 오래된 항목을 삭제합니다."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목을 삭제합니다."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.pkl'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """모든 항목을 삭제합니다."""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(self.cache_dir, name))
@@ -0,0 +1,183 @@
+import os
+import uuid
+
+import pandas as pd
+
+# 형식 이름 -> (확장자, 저장 함수)
+EXPORT_FORMATS = {}
+CSV_CHUNK_ROWS = 100000
+
+
+def register_format(name, extension, writer):
+    """
+    결과 저장 형식을 등록합니다.
+
+    Parameters:
+    - name: 형식 이름 (export_frame의 fmt)
+    - extension: 파일 확장자 (점 제외)
+    - writer: writer(frame, path, **options) 함수
+    """
+    EXPORT_FORMATS[name] = (extension, writer)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet/Arrow 저장에는 pyarrow가 필요합니다: pip install pyarrow")
+    return pyarrow
+
+
+def _write_parquet(frame, path, compression='zstd'):
+    _require_pyarrow()
+    frame.to_parquet(path, index=False, compression=compression)
+
+
+def _write_arrow(frame, path):
+    """Arrow IPC 파일 형식으로 저장합니다 (메모리 매핑으로 바로 읽을 수 있음)."""
+    pa = _require_pyarrow()
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _write_csv(frame, path, chunk_rows=CSV_CHUNK_ROWS):
+    """chunk_rows 행씩 나누어 이어 쓰므로 큰 결과도 메모리 사용량이 일정합니다."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for start in range(0, max(len(frame), 1), chunk_rows):
+            frame.iloc[start:start + chunk_rows].to_csv(f, index=False, header=start == 0)
+
+
+def _write_excel(frame, path, sheet_name='Sheet1'):
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        frame.to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+register_format('parquet', 'parquet', _write_parquet)
+register_format('arrow', 'arrow', _write_arrow)
+register_format('csv', 'csv', _write_csv)
+register_format('xlsx', 'xlsx', _write_excel)
+
+
+def _format_for(path, fmt):
+    if fmt is None:
+        extension = os.path.splitext(path)[1].lstrip('.').lower()
+        matches = [name for name, (ext, _) in EXPORT_FORMATS.items() if ext == extension]
+        if not matches:
+            raise ValueError(f"확장자로 저장 형식을 알 수 없습니다: {path}")
+        fmt = matches[0]
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {fmt} (지원: {', '.join(EXPORT_FORMATS)})")
+    return fmt
+
+
+def export_frame(frame, path, fmt=None, **options):
+    """
+    DataFrame 하나를 저장합니다.
+
+    Parameters:
+    - frame: 저장할 DataFrame
+    - path: 저장 경로
+    - fmt: 저장 형식 ('parquet', 'arrow', 'csv', 'xlsx', None이면 확장자로 판단)
+    - options: 형식별 저장 함수에 전달할 옵션
+
+    Returns:
+    - 저장한 경로
+    """
+    fmt = _format_for(path, fmt)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    EXPORT_FORMATS[fmt][1](frame, path, **options)
+    return path
+
+
+def export_tables(tables, directory, fmt='parquet'):
+    """
+    여러 결과 표를 표 이름별 파일로 저장합니다.
+
+    'xlsx' 형식은 표마다 시트를 가진 통합 문서 하나로 저장합니다.
+
+    Parameters:
+    - tables: 표 이름 -> DataFrame
+    - directory: 저장 디렉토리 (xlsx이면 통합 문서 경로)
+    - fmt: 저장 형식
+
+    Returns:
+    - 저장한 경로 목록
+    """
+    if fmt == 'xlsx':
+        os.makedirs(os.path.dirname(directory) or '.', exist_ok=True)
+        with pd.ExcelWriter(directory, engine='openpyxl') as writer:
+            for name, frame in tables.items():
+                frame.to_excel(writer, sheet_name=name, index=False)
+        return [directory]
+
+    extension = EXPORT_FORMATS[_format_for('', fmt)][0]
+    return [export_frame(frame, os.path.join(directory, f"{name}.{extension}"), fmt)
+            for name, frame in tables.items() if not frame.empty]
+
+
+def _partition_value(value):
+    return str(value).replace(os.sep, '_')
+
+
+def append_partition(frame, root, partition, fmt='parquet'):
+    """
+    시나리오 하나의 결과를 Hive 방식 파티션 디렉토리에 새 파일로 추가합니다.
+
+    root/키=값/.../part-<uuid>.<확장자> 경로에 저장하므로 여러 실행(프로세스)이
+    같은 데이터셋에 동시에 추가해도 서로 덮어쓰지 않습니다.
+
+    Parameters:
+    - frame: 저장할 결과
+    - root: 데이터셋 루트 디렉토리
+    - partition: 파티션 키 -> 값 (예: {'Frequency': 'monthly'})
+    - fmt: 저장 형식 ('parquet', 'arrow', 'csv')
+
+    Returns:
+    - 저장한 경로
+    """
+    fmt = _format_for('', fmt)
+    directory = os.path.join(root, *[f"{key}={_partition_value(value)}" for key, value in partition.items()])
+    frame = frame.drop(columns=[key for key in partition if key in frame.columns])
+    path = os.path.join(directory, f"part-{uuid.uuid4().hex}.{EXPORT_FORMATS[fmt][0]}")
+    return export_frame(frame, path, fmt)
+
+
+def write_partitioned(frame, root, partition_cols, fmt='parquet'):
+    """partition_cols 값 조합마다 append_partition으로 나누어 저장합니다."""
+    paths = []
+    for values, group in frame.groupby(list(partition_cols), sort=False, dropna=False):
+        values = values if isinstance(values, tuple) else (values,)
+        paths.append(append_partition(group, root, dict(zip(partition_cols, values)), fmt))
+    return paths
+
+
+def read_dataset(root, fmt='parquet'):
+    """
+    append_partition으로 만든 데이터셋을 파티션 키 컬럼과 함께 읽습니다.
+
+    파티션 값은 문자열로 복원됩니다.
+    """
+    fmt = _format_for('', fmt)
+    extension = EXPORT_FORMATS[fmt][0]
+    frames = []
+    for directory, _, files in sorted(os.walk(root)):
+        keys = dict(part.split('=', 1) for part in os.path.relpath(directory, root).split(os.sep) if '=' in part)
+        for name in sorted(files):
+            if not name.endswith(f".{extension}"):
+                continue
+            path = os.path.join(directory, name)
+            if fmt == 'parquet':
+                frame = pd.read_parquet(path)
+            elif fmt == 'arrow':
+                pa = _require_pyarrow()
+                with pa.memory_map(path) as source:
+                    frame = pa.ipc.open_file(source).read_all().to_pandas()
+            elif fmt == 'csv':
+                frame = pd.read_csv(path)
+            else:
+                raise ValueError(f"데이터셋으로 읽을 수 없는 형식입니다: {fmt}")
+            frames.append(frame.assign(**keys))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+from performance import RISK_FREE_RATE, TRADING_DAYS
+
+DEFAULT_WINDOWS = (63, 126, 252)
+
+
+def sliding_max(values, window):
+    """
+    길이 window 구간의 이동 최대값을 O(N)으로 계산합니다 (van Herk/Gil-Werman).
+
+    배열을 window 길이 블록으로 나누어 블록 내 누적 최대(앞에서/뒤에서)를 구하면
+    구간 [i, i + window)의 최대는 max(뒤에서 누적[i], 앞에서 누적[i + window - 1])입니다.
+
+    Returns:
+    - 길이 len(values) - window + 1 배열 (i번째 값 = values[i:i + window]의 최대)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if window <= 1:
+        return values.copy()
+    if n < window:
+        return np.array([])
+
+    padded_length = -(-n // window) * window
+    padded = np.full(padded_length, -np.inf)
+    padded[:n] = values
+    blocks = padded.reshape(-1, window)
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    starts = np.arange(n - window + 1)
+    return np.maximum(suffix[starts], prefix[starts + window - 1])
+
+
+def _window_sums(series, window):
+    """누적합 차이로 길이 window 구간의 합을 구합니다 (마지막 원소 기준 정렬)."""
+    cumulative = np.concatenate(([0.0], np.cumsum(series)))
+    return cumulative[window:] - cumulative[:-window]
+
+
+def compute_rolling_metrics(dates, values, asset_prices, windows=DEFAULT_WINDOWS, tickers=('SOXL', 'VXX'),
+                            risk_free_rate=RISK_FREE_RATE, periods_per_year=TRADING_DAYS, pair=(0, 1)):
+    """
+    이동 창별 위험 지표를 누적합과 이동 최대값으로 한 번에 계산합니다.
+
+    창마다 rolling().apply 콜백을 호출하지 않고, 수익률/제곱/교차곱의 누적합 차이로
+    평균/분산/공분산을, sliding_max로 이동 고점을 구하므로 창 하나당 O(N)입니다.
+    - Volatility_{w}: 일간 수익률 표준편차(ddof=1) x sqrt(연간 기간 수)
+    - Sharpe_{w}: (연율화 평균 수익률 - 무위험 수익률) / 변동성
+    - Sortino_{w}: (연율화 평균 수익률 - 무위험 수익률) / 하방 편차
+    - Correlation_{w}: pair 두 자산의 일간 수익률 상관계수 (자산이 2개 이상일 때만)
+    - Beta_{w}: 첫 번째 자산 대비 포트폴리오 베타
+    - Drawdown_{w}: 최근 w 거래일 고점 대비 현재 낙폭
+
+    Parameters:
+    - dates: 거래일
+    - values: 포트폴리오 가치
+    - asset_prices: (거래일 수, 자산 수) 자산 가격 (tickers 순서)
+    - windows: 창 길이 목록 (거래일)
+    - pair: 상관계수를 계산할 두 자산의 열 위치 (tickers 순서)
+
+    Returns:
+    - dict: 'Date'와 지표별 (거래일 수,) 배열, 창이 다 차기 전은 NaN
+    """
+    values = np.asarray(values, dtype=np.float64)
+    asset_prices = np.asarray(asset_prices, dtype=np.float64)
+    if asset_prices.ndim == 1:
+        asset_prices = asset_prices[:, None]
+    n_days = len(values)
+    has_pair = asset_prices.shape[1] >= 2
+
+    # 수익률을 전체 평균으로 중심화하여 누적합의 정밀도 손실을 줄임
+    returns = values[1:] / values[:-1] - 1
+    asset_returns = asset_prices[1:] / asset_prices[:-1] - 1
+    centered = returns - returns.mean()
+    # 베타는 첫 번째 자산 기준, 상관계수는 pair 두 자산
+    first = asset_returns[:, 0]
+    first_centered = first - first.mean()
+    if has_pair:
+        a, b = asset_returns[:, pair[0]], asset_returns[:, pair[1]]
+        a_centered, b_centered = a - a.mean(), b - b.mean()
+    downside = np.minimum(returns, 0.0) ** 2
+
+    metrics = {'Date': pd.DatetimeIndex(dates).to_numpy()}
+    for window in windows:
+        names = ('Volatility', 'Sharpe', 'Sortino') + (('Correlation',) if has_pair else ()) + ('Beta', 'Drawdown')
+        columns = {name: np.full(n_days, np.nan) for name in names}
+        if len(returns) >= window:
+            sum_r = _window_sums(centered, window)
+            variance = (_window_sums(centered * centered, window) - sum_r * sum_r / window) / (window - 1)
+            mean = sum_r / window + returns.mean()
+
+            sum_f = _window_sums(first_centered, window)
+            var_f = _window_sums(first_centered * first_centered, window) - sum_f * sum_f / window
+            cov_pf = _window_sums(centered * first_centered, window) - sum_r * sum_f / window
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                volatility = np.sqrt(np.maximum(variance, 0.0)) * np.sqrt(periods_per_year)
+                downside_deviation = np.sqrt(_window_sums(downside, window) / window * periods_per_year)
+                excess = mean * periods_per_year - risk_free_rate
+                columns['Volatility'][window:] = volatility
+                columns['Sharpe'][window:] = np.where(volatility > 0, excess / volatility, np.nan)
+                columns['Sortino'][window:] = np.where(downside_deviation > 0, excess / downside_deviation, np.nan)
+                columns['Beta'][window:] = np.where(var_f > 0, cov_pf / var_f, np.nan)
+                if has_pair:
+                    sum_a = _window_sums(a_centered, window)
+                    sum_b = _window_sums(b_centered, window)
+                    var_a = _window_sums(a_centered * a_centered, window) - sum_a * sum_a / window
+                    var_b = _window_sums(b_centered * b_centered, window) - sum_b * sum_b / window
+                    cov_ab = _window_sums(a_centered * b_centered, window) - sum_a * sum_b / window
+                    columns['Correlation'][window:] = cov_ab / np.sqrt(np.maximum(var_a * var_b, 0.0))
+
+            # 최근 window 개 수익률 = window + 1 개 가치의 고점
+            columns['Drawdown'][window:] = values[window:] / sliding_max(values, window + 1) - 1
+
+        for name, column in columns.items():
+            metrics[f"{name}_{window}"] = column
+
+    return metrics
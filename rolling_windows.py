@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+
+from performance import RISK_FREE_RATE, TRADING_DAYS
+from simulation_engine import calendar_rebalance_indices, simulate_rebalancing
+
+
+def _sparse_tables(values):
+    """
+    길이 2^j 구간별 (최대값, 최소값, 구간 내 최대 낙폭) 표를 만듭니다.
+
+    인접한 두 구간 L, R을 합친 구간의 최대 낙폭은
+    min(낙폭(L), 낙폭(R), 최소(R) / 최대(L) - 1)이므로 길이를 두 배씩 늘려 가며 계산합니다.
+    """
+    n = len(values)
+    levels = max(1, int(np.log2(n)) + 1) if n else 1
+    highs = np.empty((levels, n))
+    lows = np.empty((levels, n))
+    drawdowns = np.empty((levels, n))
+    highs[0] = lows[0] = values
+    drawdowns[0] = 0.0
+    for j in range(1, levels):
+        half = 1 << (j - 1)
+        valid = n - (1 << j) + 1
+        left, right = slice(0, valid), slice(half, half + valid)
+        highs[j, :valid] = np.maximum(highs[j - 1, left], highs[j - 1, right])
+        lows[j, :valid] = np.minimum(lows[j - 1, left], lows[j - 1, right])
+        drawdowns[j, :valid] = np.minimum(np.minimum(drawdowns[j - 1, left], drawdowns[j - 1, right]),
+                                          lows[j - 1, right] / highs[j - 1, left] - 1)
+    return highs, lows, drawdowns
+
+
+def rolling_window_backtest(data, window_years=3, weights=(0.75, 0.25), rebalance_frequency='monthly',
+                            initial_capital=10000, tickers=('SOXL', 'VXX'), step=1,
+                            risk_free_rate=RISK_FREE_RATE):
+    """
+    모든 시작일에서 window_years 기간 동안 전략을 실행한 성과를 한 번에 계산합니다.
+
+    달력 규칙의 리밸런싱 일정은 시작일과 무관하므로, 창 안의 리밸런싱은 전체 기간
+    실행과 같은 날에 일어납니다. 시작일 s 이후 첫 리밸런싱 e1부터 창의 가치는 전체
+    실행 가치 V에 비례하므로 (c_s * V), 시뮬레이션은 전체 기간에 한 번만 실행합니다.
+    - 최종 가치/CAGR: c_s * V[t]
+    - 수익률 합/제곱합: 누적합 차이
+    - 최대 낙폭: 2^j 구간 표를 이어 붙여 창마다 O(log N)
+    s부터 e1까지의 구간만 창마다 직접 계산하며, 그 길이는 리밸런싱 간격 이내입니다
+    (전체 비용 O(창 수 x 리밸런싱 간격), 'none'이면 O(창 수 x 창 길이)).
+    결과는 각 창을 새로 시뮬레이션한 compute_performance_metrics 값과 같습니다.
+
+    Parameters:
+    - data: 시뮬레이터의 self.data 형식 DataFrame
+    - window_years: 창 길이 (년, 월 단위로 반올림)
+    - weights: 자산별 목표 비율
+    - rebalance_frequency: 달력 리밸런싱 규칙 ('monthly', 'quarterly', 'month_end' 등, 'none')
+    - initial_capital: 창별 초기 투자금
+    - tickers: 자산 티커
+    - step: 시작일 간격 (거래일)
+
+    Returns:
+    - DataFrame: 창별 Window_Start, Window_End, Final_Value, Total_Return, Annual_Return,
+      Volatility, Max_Drawdown, Sharpe_Ratio, Rebalances
+    """
+    if not isinstance(rebalance_frequency, str) or rebalance_frequency == 'band':
+        raise ValueError("창별 계산은 시작일과 무관한 달력 리밸런싱 규칙만 지원합니다.")
+
+    dates = pd.DatetimeIndex(data['Date'])
+    prices = data[[f"{ticker}_Close" for ticker in tickers]].to_numpy(dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    cash_weight = 1.0 - weights.sum()
+    n_days = len(dates)
+
+    full = simulate_rebalancing(prices, weights, 1.0,
+                                calendar_rebalance_indices(dates, rebalance_frequency))
+    values = full['portfolio_value']
+    events = full['event_indices']
+
+    # 창 시작/종료 인덱스
+    window_ends = dates + pd.DateOffset(months=int(round(window_years * 12)))
+    ends = dates.searchsorted(window_ends, side='right') - 1
+    starts = np.arange(0, n_days, step)
+    starts = starts[(window_ends[starts] <= dates[-1]) & (ends[starts] > starts)]
+    ends = ends[starts]
+    if len(starts) == 0:
+        return pd.DataFrame()
+
+    # 시작일 이후 첫 리밸런싱 (없으면 n_days)
+    next_event = np.searchsorted(events, starts, side='right')
+    first_event = np.where(next_event < len(events), events[np.minimum(next_event, len(events) - 1)], n_days)
+    head_end = np.minimum(first_event, ends)
+
+    # 첫 리밸런싱까지: 창별 매수 후 보유 가치 C * (상대 가격 @ 비율 + 현금 비율)
+    # 수익률이 시작일 가격에 따라 달라지는 비율이므로 누적합으로 구할 수 없어 날짜를 따라가며
+    # 계산합니다. 아직 첫 리밸런싱 전인 창만 처리하므로(머리 길이 내림차순 정렬의 앞부분)
+    # 전체 비용은 머리 길이의 합, 즉 O(창 수 x 리밸런싱 간격)이며 리밸런싱이 없으면 O(N x W)입니다.
+    start_prices = prices[starts]
+    head_length = head_end - starts
+    order = np.argsort(-head_length, kind='stable')
+    descending = -head_length[order]
+    head_sum = np.zeros(len(starts))
+    head_sum2 = np.zeros(len(starts))
+    peak = np.full(len(starts), -np.inf)
+    max_drawdown = np.zeros(len(starts))
+    previous = np.full(len(starts), float(initial_capital))
+    head_value = previous.copy()
+    for offset in range(1, int(head_length.max()) + 1):
+        active = order[:np.searchsorted(descending, -offset, side='right')]
+        current = initial_capital * ((prices[starts[active] + offset] / start_prices[active]) @ weights
+                                     + cash_weight)
+        ret = current / previous[active] - 1
+        head_sum[active] += ret
+        head_sum2[active] += ret * ret
+        peak[active] = np.maximum(peak[active], current)
+        max_drawdown[active] = np.minimum(max_drawdown[active], current / peak[active] - 1)
+        head_value[active] = current
+        previous[active] = current
+
+    # 첫 리밸런싱 이후: 전체 실행 가치의 상수배
+    has_tail = first_event <= ends
+    scale = np.where(has_tail, head_value / values[np.minimum(first_event, n_days - 1)], 1.0)
+    final_value = np.where(has_tail, scale * values[ends], head_value)
+
+    returns = np.zeros(n_days)
+    returns[1:] = values[1:] / values[:-1] - 1
+    cum_returns = np.cumsum(returns)
+    cum_returns2 = np.cumsum(returns * returns)
+    tail_start = np.minimum(first_event, n_days - 1)
+    tail_sum = np.where(has_tail, cum_returns[ends] - cum_returns[tail_start], 0.0)
+    tail_sum2 = np.where(has_tail, cum_returns2[ends] - cum_returns2[tail_start], 0.0)
+
+    # 꼬리 구간 최대 낙폭: 길이의 이진 표현대로 2^j 구간을 시간 순서로 이어 붙임
+    highs, lows, drawdowns = _sparse_tables(values)
+    position = tail_start + 1
+    remaining = np.where(has_tail, ends - first_event, 0)
+    running_high = peak / scale
+    for j in range(highs.shape[0] - 1, -1, -1):
+        take = (remaining >> j) & 1 == 1
+        if not take.any():
+            continue
+        rows = np.minimum(position, n_days - 1)
+        block_dd = np.minimum(drawdowns[j, rows], lows[j, rows] / running_high - 1)
+        max_drawdown = np.where(take, np.minimum(max_drawdown, block_dd), max_drawdown)
+        running_high = np.where(take, np.maximum(running_high, highs[j, rows]), running_high)
+        position = np.where(take, position + (1 << j), position)
+
+    # 지표 (compute_performance_metrics와 같은 정의)
+    count = ends - starts
+    total = head_sum + tail_sum
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = (head_sum2 + tail_sum2 - total * total / count) / (count - 1)
+        volatility = np.where(count > 1, np.sqrt(np.maximum(variance, 0.0)) * np.sqrt(TRADING_DAYS), np.nan)
+        years = (dates[ends] - dates[starts]).days.to_numpy() / 365.25
+        annual_return = (final_value / initial_capital) ** (1 / years) - 1
+        sharpe_ratio = np.where(volatility > 0, (annual_return - risk_free_rate) / volatility, 0.0)
+
+    return pd.DataFrame({
+        'Window_Start': dates[starts],
+        'Window_End': dates[ends],
+        'Final_Value': final_value,
+        'Total_Return': (final_value - initial_capital) / initial_capital,
+        'Annual_Return': annual_return,
+        'Volatility': volatility,
+        'Max_Drawdown': max_drawdown,
+        'Sharpe_Ratio': sharpe_ratio,
+        'Rebalances': np.searchsorted(events, ends, side='right') - next_event,
+    })
+
+
+def summarize_windows(results, percentiles=(5, 25, 50, 75, 95)):
+    """창별 결과의 지표별 평균과 분위수 분포를 반환합니다 (진입 시점 민감도)."""
+    rows = {}
+    for name in ['Final_Value', 'Total_Return', 'Annual_Return', 'Volatility', 'Max_Drawdown', 'Sharpe_Ratio']:
+        values = results[name].to_numpy(dtype=np.float64)
+        row = {'mean': np.nanmean(values)}
+        for q, value in zip(percentiles, np.nanpercentile(values, percentiles)):
+            row[f"p{q}"] = value
+        rows[name] = row
+    return pd.DataFrame(rows).T
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from extended_5year_simulation import ExtendedSOXLVXXSimulation
+
+    parser = argparse.ArgumentParser(description="SOXL-VXX 롤링 창 (진입 시점별) 백테스트")
+    parser.add_argument('--start', default="2010-01-01", help="시작일")
+    parser.add_argument('--end', default=None, help="종료일 (기본값: 오늘)")
+    parser.add_argument('--years', type=float, default=3, help="창 길이 (년)")
+    parser.add_argument('--frequency', default='monthly', help="리밸런싱 주기")
+    parser.add_argument('--offline', action='store_true', help="네트워크 없이 가격 캐시만 사용")
+    args = parser.parse_args()
+
+    simulator = ExtendedSOXLVXXSimulation()
+    if simulator.fetch_data(start_date=args.start, end_date=args.end, offline=args.offline):
+        results = rolling_window_backtest(simulator.data, window_years=args.years,
+                                          rebalance_frequency=args.frequency)
+        print(f"\n{args.years}년 창 {len(results)}개 성과 분포")
+        print(summarize_windows(results).to_string())
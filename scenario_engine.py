@@ -0,0 +1,170 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from performance import TRADING_DAYS, compute_path_metrics
+
+# 워커 프로세스별 과거 수익률 (initializer에서 한 번만 설정)
+_WORKER_DATA = {}
+
+
+def historical_returns(data, tickers=('SOXL', 'VXX')):
+    """시뮬레이터의 self.data에서 (거래일 수 - 1, 자산 수) 일간 수익률 배열을 만듭니다."""
+    prices = data[[f"{ticker}_Close" for ticker in tickers]].to_numpy(dtype=np.float64)
+    return prices[1:] / prices[:-1] - 1
+
+
+def stationary_bootstrap_indices(n_obs, n_paths, n_steps, mean_block, rng):
+    """
+    Politis-Romano stationary bootstrap 표본 인덱스를 (경로 수, 기간 수) 배열로 생성합니다.
+
+    각 기간마다 확률 1/mean_block로 새 블록을 임의 위치에서 시작하고, 그렇지 않으면
+    직전 인덱스 다음 날을 이어 붙입니다(원형). 블록 시작 위치를 누적 최대값으로
+    전파하므로 경로 생성에 파이썬 루프가 없습니다.
+    """
+    steps = np.arange(n_steps)
+    new_block = rng.random((n_paths, n_steps)) < 1.0 / mean_block
+    new_block[:, 0] = True
+    starts = rng.integers(0, n_obs, size=(n_paths, n_steps))
+
+    block_start = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+    return (np.take_along_axis(starts, block_start, axis=1) + (steps - block_start)) % n_obs
+
+
+def block_bootstrap_indices(n_obs, n_paths, n_steps, block_size, rng):
+    """고정 길이(block_size) 원형 블록 부트스트랩 표본 인덱스를 생성합니다."""
+    steps = np.arange(n_steps)
+    n_blocks = -(-n_steps // block_size)
+    starts = rng.integers(0, n_obs, size=(n_paths, n_blocks))
+    return (starts[:, steps // block_size] + steps % block_size) % n_obs
+
+
+def simulate_strategy_paths(returns, weights, initial_capital, rebalance_every):
+    """
+    (경로 수, 기간 수, 자산 수) 수익률 경로에서 정기 리밸런싱 가치 경로를 계산합니다.
+
+    rebalance_every 기간마다 목표 비율로 되돌리며, 구간 내 가치는
+    구간 시작 대비 누적 로그수익률로 모든 경로를 한 번에 계산합니다.
+
+    Returns:
+    - (기간 수 + 1, 경로 수) 가치 배열 (첫 행은 초기 투자금)
+    """
+    n_paths, n_steps, _ = returns.shape
+    weights = np.asarray(weights, dtype=np.float64)
+    cash_weight = 1.0 - weights.sum()
+
+    log_prices = np.zeros((n_paths, n_steps + 1, returns.shape[2]))
+    np.cumsum(np.log1p(returns), axis=1, out=log_prices[:, 1:])
+
+    steps = np.arange(n_steps + 1)
+    event_indices = np.arange(0, n_steps + 1, rebalance_every) if rebalance_every else np.array([0])
+    segment = np.searchsorted(event_indices, steps, side='right') - 1
+    # 리밸런싱일 당일 가치는 직전 구간 기준으로 계산한 뒤 다시 목표 비율로 배분
+    segment_at_close = np.maximum(segment - (np.isin(steps, event_indices) & (steps > 0)), 0)
+
+    relative = np.exp(log_prices - log_prices[:, event_indices[segment_at_close]])
+    growth = relative @ weights + cash_weight
+
+    event_growth = np.ones((n_paths, len(event_indices)))
+    event_growth[:, 1:] = growth[:, event_indices[1:]]
+    event_values = initial_capital * np.cumprod(event_growth, axis=1)
+
+    values = event_values[:, segment_at_close] * growth
+    return values.T
+
+
+def _init_worker(returns):
+    _WORKER_DATA['returns'] = returns
+
+
+def _run_chunk(task):
+    """하나의 경로 묶음을 생성하고 시뮬레이션하여 경로별 지표를 반환합니다."""
+    seed, n_paths, n_steps, weights, initial_capital, rebalance_every, method, block, periods_per_year = task
+    returns = _WORKER_DATA['returns']
+    rng = np.random.default_rng(seed)
+
+    if method == 'stationary':
+        indices = stationary_bootstrap_indices(len(returns), n_paths, n_steps, block, rng)
+    elif method == 'block':
+        indices = block_bootstrap_indices(len(returns), n_paths, n_steps, block, rng)
+    else:
+        raise ValueError(f"지원하지 않는 부트스트랩 방식입니다: {method}")
+
+    values = simulate_strategy_paths(returns[indices], weights, initial_capital, rebalance_every)
+    return compute_path_metrics(values, initial_capital, periods_per_year)
+
+
+class ScenarioResults:
+    def __init__(self, metrics, n_paths, n_steps):
+        """
+        시나리오 엔진 결과
+
+        - metrics: 지표명 -> (경로 수,) 배열 (final_value, max_drawdown, sharpe_ratio 등)
+        """
+        self.metrics = metrics
+        self.n_paths = n_paths
+        self.n_steps = n_steps
+
+    def to_frame(self):
+        """경로별 지표를 DataFrame으로 반환합니다."""
+        return pd.DataFrame(self.metrics)
+
+    def summary(self, percentiles=(5, 25, 50, 75, 95)):
+        """지표별 평균과 분위수 분포를 반환합니다."""
+        rows = {}
+        for name, values in self.metrics.items():
+            row = {'mean': np.nanmean(values)}
+            for q, value in zip(percentiles, np.nanpercentile(values, percentiles)):
+                row[f"p{q}"] = value
+            rows[name] = row
+        return pd.DataFrame(rows).T
+
+
+def run_scenarios(returns, weights=(0.75, 0.25), n_paths=10000, n_steps=TRADING_DAYS * 5,
+                  initial_capital=100000, rebalance_every=21, method='stationary', block=20,
+                  seed=None, chunk_size=2000, max_workers=1, periods_per_year=TRADING_DAYS):
+    """
+    과거 일간 수익률을 부트스트랩으로 재표본하여 리밸런싱 전략의 성과 분포를 구합니다.
+
+    모든 자산에 같은 날짜 인덱스를 사용하므로 자산 간 상관관계가, 연속된 블록을
+    사용하므로 변동성 군집이 유지됩니다. 경로는 chunk_size개씩 생성/시뮬레이션하고
+    SeedSequence로 청크별 시드를 나누므로 결과는 워커 수와 관계없이 재현됩니다.
+
+    Parameters:
+    - returns: (관측일 수, 자산 수) 일간 수익률 (historical_returns 참고)
+    - weights: 자산별 목표 비율
+    - n_paths: 생성할 경로 수
+    - n_steps: 경로 길이 (기간 수)
+    - initial_capital: 초기 투자금
+    - rebalance_every: 리밸런싱 간격 (기간 수, 0이면 리밸런싱 없음)
+    - method: 'stationary' (평균 블록 길이 block) 또는 'block' (고정 블록 길이 block)
+    - seed: 난수 시드
+    - chunk_size: 한 번에 메모리에 올릴 경로 수
+    - max_workers: 프로세스 수 (1이면 현재 프로세스에서 실행, None이면 CPU 수)
+
+    Returns:
+    - ScenarioResults
+    """
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    n_chunks = -(-n_paths // chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    tasks = [(seeds[i], min(chunk_size, n_paths - i * chunk_size), n_steps, weights, initial_capital,
+              rebalance_every, method, block, periods_per_year) for i in range(n_chunks)]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers == 1:
+        _init_worker(returns)
+        chunks = [_run_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(returns,)) as executor:
+            chunks = list(executor.map(_run_chunk, tasks))
+
+    metrics = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+    return ScenarioResults(metrics, n_paths, n_steps)
@@ -0,0 +1,273 @@
+import numpy as np
+
+from rebalance_schedule import rebalance_schedule
+
+# 계산 결과가 달라지는 엔진 변경 시 올려서 결과 캐시를 무효화합니다
+ENGINE_VERSION = 5
+# simulate_rebalancing_chunked가 한 번에 메모리로 읽는 행 수
+DEFAULT_CHUNK_ROWS = 1 << 20
+
+
+def simulate_rebalancing(prices, weights, initial_capital, rebalance_indices, out=None):
+    """
+    정기 리밸런싱 포트폴리오를 한 번의 NumPy 연산으로 계산합니다.
+
+    리밸런싱 사이에는 보유 주식 수가 변하지 않으므로(구간별 상수), 각 리밸런싱
+    시점의 포트폴리오 가치는 구간 성장률의 누적곱으로 구할 수 있습니다.
+    이렇게 구한 보유 주식 수를 다음 리밸런싱 전까지 forward-fill 한 뒤
+    가격 행렬과 곱해 일일 가치 컬럼을 만듭니다.
+
+    Parameters:
+    - prices: (거래일 수, 자산 수) 종가 배열
+    - weights: 자산별 목표 비율 (합이 1보다 작으면 나머지는 현금으로 보유)
+    - initial_capital: 초기 투자금
+    - rebalance_indices: 리밸런싱을 실행할 거래일 인덱스 (0은 초기 투자일)
+    - out: 일일 값을 채울 배열 dict (portfolio_value, asset_values (거래일 수, 자산 수), cash,
+      예: PortfolioHistory.buffers()). 지정하면 자산별로 한 열씩 계산하여 바로 쓰므로
+      (거래일 수, 자산 수) 크기의 중간 배열을 만들지 않으며 holdings는 반환하지 않습니다.
+
+    Returns:
+    - dict: holdings, asset_values, cash, portfolio_value, event_indices,
+      event_shares, event_values
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if prices.ndim == 1:
+        prices = prices[:, None]
+    weights = np.asarray(weights, dtype=np.float64)
+    n_days = prices.shape[0]
+
+    rebalance_indices = np.asarray(rebalance_indices, dtype=np.int64)
+    rebalance_indices = rebalance_indices[(rebalance_indices > 0) & (rebalance_indices < n_days)]
+    event_indices = np.concatenate(([0], np.unique(rebalance_indices)))
+
+    # 리밸런싱 구간별 성장률: 직전 리밸런싱 이후 가격 변화의 가중합
+    cash_weight = 1.0 - weights.sum()
+    event_prices = prices[event_indices]
+    growth = np.ones(len(event_indices))
+    if len(event_indices) > 1:
+        growth[1:] = (event_prices[1:] / event_prices[:-1]) @ weights + cash_weight
+    event_values = initial_capital * np.cumprod(growth)
+
+    # 리밸런싱 직후 주식 수와 현금
+    event_shares = event_values[:, None] * weights / event_prices
+    event_cash = event_values * cash_weight
+
+    # 거래일별 소속 구간을 찾아 보유 수량을 forward-fill (구간 번호를 구간 길이만큼 반복)
+    segment = np.repeat(np.arange(len(event_indices)), np.diff(event_indices, append=n_days))
+    result = {
+        'event_indices': event_indices,
+        'event_shares': event_shares,
+        'event_values': event_values,
+    }
+    if out is None:
+        holdings = event_shares[segment]
+        cash = event_cash[segment]
+        asset_values = holdings * prices
+        result.update(holdings=holdings, asset_values=asset_values, cash=cash,
+                      portfolio_value=asset_values.sum(axis=1) + cash)
+        return result
+
+    # 합계는 float64로 누적한 뒤 out 자료형(예: float32)으로 한 번만 변환
+    total = event_cash[segment]
+    out['cash'][:] = total
+    for j in range(prices.shape[1]):
+        column = event_shares[segment, j] * prices[:, j]
+        out['asset_values'][:, j] = column
+        total += column
+    out['portfolio_value'][:] = total
+    result.update(asset_values=out['asset_values'], cash=out['cash'], portfolio_value=out['portfolio_value'])
+    return result
+
+
+def apply_trade_costs(result, event_costs, impact_costs=None):
+    """
+    거래 이벤트별 비용을 simulate_rebalancing 결과에 반영합니다.
+
+    목표 비율 리밸런싱은 포트폴리오 규모와 무관하게 같은 비율로 거래하므로, 비용 차감 후
+    경로는 비용 없는 경로의 이후 모든 가치에 누적 배수 F_k를 곱한 것과 같습니다.
+    이벤트 k는 직전 배수 F_(k-1) 규모로 거래하며, 수수료/스프레드는 거래 규모에 비례하고
+    제곱근 시장 충격은 규모의 1.5제곱에 비례하므로
+    F_k = F_(k-1) - (a_k * F_(k-1) + b_k * F_(k-1) ** 1.5) / V_k 입니다
+    (a_k, b_k: 비용 없는 경로 기준 비례 비용과 충격 비용, V_k: 비용 없는 경로의 이벤트 가치).
+    충격 비용이 없으면 F_k = cumprod(1 - a_k / V_k) 입니다.
+    비용은 거래 직후 보유 비율대로 차감합니다. 일일 배열은 제자리에서 조정하므로
+    simulate_rebalancing(out=...)으로 채운 기록 버퍼를 복사하지 않습니다.
+
+    Parameters:
+    - result: simulate_rebalancing 결과 (비용 없는 경로)
+    - event_costs: 이벤트별 거래 규모에 비례하는 비용 (비용 없는 경로 기준)
+    - impact_costs: 이벤트별 시장 충격 비용 (비용 없는 경로 기준, None이면 없음)
+
+    Returns:
+    - dict: 비용을 차감한 같은 result (event_factors: 이벤트 직전까지의 누적 배수 추가,
+      거래 기록은 이 배수로 수량을 조정한 뒤 비용을 다시 계산하면 차감한 비용과 같습니다)
+    """
+    linear = np.asarray(event_costs, dtype=np.float64) / result['event_values']
+    if impact_costs is None:
+        factors = np.cumprod(1 - linear)
+    else:
+        impact = np.asarray(impact_costs, dtype=np.float64) / result['event_values']
+        factors = np.empty_like(linear)
+        factor = 1.0
+        for k in range(len(factors)):
+            factor -= linear[k] * factor + impact[k] * factor ** 1.5
+            factors[k] = factor
+    # 이벤트 직전 배수 (이벤트 k의 실제 거래 규모)
+    event_factors = np.concatenate(([1.0], factors[:-1]))
+
+    segment = np.searchsorted(result['event_indices'], np.arange(len(result['portfolio_value'])), side='right') - 1
+    scale = factors[segment]
+    for key in ('holdings', 'asset_values'):
+        if key in result:
+            result[key] *= scale[:, None]
+    result['cash'] *= scale
+    result['portfolio_value'] *= scale
+    result['event_shares'] = result['event_shares'] * factors[:, None]
+    result['event_values'] = result['event_values'] * factors
+    result['event_factors'] = event_factors
+    return result
+
+
+def calendar_rebalance_indices(dates, rebalance_frequency):
+    """
+    달력 기준 리밸런싱 주기를 거래일 인덱스로 변환합니다.
+
+    각 주기 시작일 당일(거래일인 경우) 또는 이후 첫 번째 거래일을 찾습니다.
+    주기 규칙은 rebalance_schedule.rebalance_schedule을 참고하세요.
+    """
+    return rebalance_schedule(dates, rebalance_frequency)
+
+
+def band_rebalance_indices(prices, weights, band, initial_window=32):
+    """
+    비율 이탈 밴드 방식의 리밸런싱 거래일 인덱스를 찾습니다.
+
+    리밸런싱 직후 시점 e부터 각 자산의 비율은 w * (p_t / p_e)를 정규화한 값이므로,
+    이후 구간의 비율 이탈 폭을 한 번에 계산하여 처음으로 band를 넘는 날을 찾습니다.
+    탐색 구간은 initial_window(또는 직전 리밸런싱 간격)부터 두 배씩 늘려 가므로
+    매일을 파이썬으로 확인하지 않고 리밸런싱 사이를 건너뜁니다.
+
+    Parameters:
+    - prices: (거래일 수, 자산 수) 종가 배열
+    - weights: 자산별 목표 비율
+    - band: 허용 이탈 폭 (예: 0.05 = 목표 비율 ±5%p)
+    - initial_window: 첫 탐색 구간 길이
+
+    Returns:
+    - 리밸런싱 거래일 인덱스 배열 (초기 투자일 0 제외)
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if prices.ndim == 1:
+        prices = prices[:, None]
+    weights = np.asarray(weights, dtype=np.float64)
+    cash_weight = 1.0 - weights.sum()
+    n_days = prices.shape[0]
+
+    events = []
+    event = 0
+    window = initial_window
+    while True:
+        lo = event + 1
+        found = None
+        search_window = window
+        while lo < n_days:
+            hi = min(n_days, lo + search_window)
+            values = prices[lo:hi] / prices[event] * weights
+            current = values / (values.sum(axis=1) + cash_weight)[:, None]
+            hits = np.flatnonzero(np.abs(current - weights).max(axis=1) > band)
+            if len(hits):
+                found = lo + hits[0]
+                break
+            lo = hi
+            search_window *= 2
+        if found is None:
+            break
+        window = max(initial_window, found - event)
+        events.append(found)
+        event = found
+
+    return np.array(events, dtype=np.int64)
+
+
+def rebalance_indices(dates, prices, weights, rebalance_frequency, band=0.05):
+    """
+    리밸런싱 방식에 따라 거래일 인덱스를 계산합니다.
+
+    - 'band': 목표 비율 ±band 이탈 시 (band_rebalance_indices)
+    - 그 외: 달력/거래일 규칙 (rebalance_schedule 참고)
+    """
+    if rebalance_frequency == 'band':
+        return band_rebalance_indices(prices, weights, band)
+    return calendar_rebalance_indices(dates, rebalance_frequency)
+
+
+def simulate_rebalancing_chunked(store, tickers, weights, initial_capital, rebalance_frequency='monthly',
+                                 band=0.05, chunk_rows=DEFAULT_CHUNK_ROWS, on_chunk=None):
+    """
+    PriceStore(메모리 매핑 패널 포함)를 chunk_rows 행씩 나누어 시뮬레이션합니다.
+
+    두 번째 청크부터는 직전 리밸런싱 시점의 가격을 첫 행으로 붙이고 그 시점의
+    가치를 초기 투자금으로 simulate_rebalancing을 실행하므로, 보유 수량이 그대로
+    이어져 전체를 한 번에 계산한 결과와 같습니다. 메모리 사용량은 청크 크기에 비례합니다.
+    - 달력/거래일 규칙: 전체 타임스탬프에서 이진 탐색으로 리밸런싱 인덱스를 한 번 계산
+    - 'band': 청크마다 직전 리밸런싱 가격 기준으로 이탈을 탐색
+
+    Parameters:
+    - store: PriceStore (PriceStore.open으로 연 디스크 패널 가능)
+    - tickers: 자산 티커 목록
+    - weights: 자산별 목표 비율
+    - initial_capital: 초기 투자금
+    - rebalance_frequency: 리밸런싱 규칙 (rebalance_indices 참고)
+    - band: 'band' 방식의 허용 이탈 폭
+    - chunk_rows: 한 번에 처리할 행 수
+    - on_chunk: on_chunk(start, dates, result) 콜백 (result는 청크 구간의 holdings,
+      asset_values, cash, portfolio_value)
+
+    Returns:
+    - dict: event_indices, event_shares, event_values (전체 인덱스 기준), final_value, final_cash
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    n_rows = len(store)
+    scheduled = None
+    if rebalance_frequency != 'band':
+        scheduled = rebalance_schedule(store.dates(), rebalance_frequency)
+
+    event_indices, event_shares, event_values = [], [], []
+    base_prices, base_value = None, initial_capital
+    final_value, final_cash = initial_capital, initial_capital
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(n_rows, start + chunk_rows)
+        prices = store.slice(tickers, start, stop)
+        # 첫 청크는 0행이 초기 투자일, 이후 청크는 0행이 직전 리밸런싱 시점
+        offset = 0 if base_prices is None else 1
+        if offset:
+            prices = np.vstack([base_prices, prices])
+
+        if scheduled is None:
+            local = band_rebalance_indices(prices, weights, band)
+        else:
+            lo, hi = np.searchsorted(scheduled, [start, stop])
+            local = scheduled[lo:hi] - start + offset
+        result = simulate_rebalancing(prices, weights, base_value, local)
+
+        events = result['event_indices']
+        event_indices.append(events[offset:] - offset + start)
+        event_shares.append(result['event_shares'][offset:])
+        event_values.append(result['event_values'][offset:])
+        base_prices = prices[events[-1]]
+        base_value = result['event_values'][-1]
+        final_value = result['portfolio_value'][-1]
+        final_cash = result['cash'][-1]
+
+        if on_chunk is not None:
+            on_chunk(start, store.dates(start, stop), {
+                key: result[key][offset:] for key in ('holdings', 'asset_values', 'cash', 'portfolio_value')
+            })
+
+    return {
+        'event_indices': np.concatenate(event_indices) if event_indices else np.array([0], dtype=np.int64),
+        'event_shares': np.concatenate(event_shares) if event_shares else np.empty((0, len(weights))),
+        'event_values': np.concatenate(event_values) if event_values else np.array([initial_capital]),
+        'final_value': final_value,
+        'final_cash': final_cash,
+    }
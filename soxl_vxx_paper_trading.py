@@ -1,16 +1,16 @@
-import yfinance as yf
+import os
+
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-import warnings
-warnings.filterwarnings('ignore')
+from datetime import datetime
+from instrumentation import count, profiling, span
+from portfolio_core import SOXLVXXSimulator
+from report_builder import HTMLReport
+from price_cache import DEFAULT_CACHE_DIR, PriceCache
 
-class SOXLVXXPaperTrading:
+class SOXLVXXPaperTrading(SOXLVXXSimulator):
+    simulation_name = "모의투자"
+    verbose_rebalance = True
+    
     def __init__(self, initial_capital=100000, soxl_ratio=0.75, vxx_ratio=0.25):
         """
         SOXL-VXX 모의투자 시뮬레이터
@@ -20,265 +20,25 @@ class SOXLVXXPaperTrading:
         - soxl_ratio: SOXL 투자 비율 (기본값: 0.75 = 75%)
         - vxx_ratio: VXX 투자 비율 (기본값: 0.25 = 25%)
         """
-        self.initial_capital = initial_capital
-        self.soxl_ratio = soxl_ratio
-        self.vxx_ratio = vxx_ratio
-        
-        # 포트폴리오 상태
-        self.cash = initial_capital
-        self.soxl_shares = 0
-        self.vxx_shares = 0
-        self.current_capital = initial_capital
-        
-        # 거래 기록
-        self.trade_history = []
-        self.portfolio_history = []
-        self.rebalance_dates = []
-        
-        # 성과 지표
-        self.total_return = 0
-        self.annual_return = 0
-        self.volatility = 0
-        self.max_drawdown = 0
-        self.sharpe_ratio = 0
-        
-    def fetch_data(self, start_date="2025-01-01", end_date="2025-12-31"):
-        """SOXL과 VXX 데이터를 가져옵니다."""
-        print(f"SOXL과 VXX 데이터를 수집하는 중... ({start_date} ~ {end_date})")
-        
-        try:
-            # SOXL 데이터 수집
-            soxl_data = yf.download("SOXL", start=start_date, end=end_date, progress=False)
-            if soxl_data.empty:
-                raise ValueError("SOXL 데이터를 가져올 수 없습니다.")
-            
-            # VXX 데이터 수집
-            vxx_data = yf.download("VXX", start=start_date, end=end_date, progress=False)
-            if vxx_data.empty:
-                raise ValueError("VXX 데이터를 가져올 수 없습니다.")
-            
-            # MultiIndex 컬럼 처리
-            if isinstance(soxl_data.columns, pd.MultiIndex):
-                soxl_data.columns = soxl_data.columns.droplevel(0)
-            if isinstance(vxx_data.columns, pd.MultiIndex):
-                vxx_data.columns = vxx_data.columns.droplevel(0)
-            
-            # 컬럼명 정리
-            if len(soxl_data.columns) == 6:
-                soxl_data.columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-            elif len(soxl_data.columns) == 5:
-                soxl_data.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-                
-            if len(vxx_data.columns) == 6:
-                vxx_data.columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
-            elif len(vxx_data.columns) == 5:
-                vxx_data.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-            
-            # 결합된 데이터
-            self.data = pd.DataFrame({
-                'Date': soxl_data.index,
-                'SOXL_Close': soxl_data['Close'],
-                'VXX_Close': vxx_data['Close'],
-                'SOXL_Volume': soxl_data['Volume'],
-                'VXX_Volume': vxx_data['Volume']
-            }).dropna()
-            
-            print(f"데이터 수집 완료: {len(self.data)}개 거래일")
-            print(f"기간: {self.data['Date'].iloc[0].strftime('%Y-%m-%d')} ~ {self.data['Date'].iloc[-1].strftime('%Y-%m-%d')}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"데이터 수집 중 오류 발생: {e}")
-            return False
-    
-    def initial_investment(self, date):
-        """초기 투자를 실행합니다."""
-        soxl_price = self.data[self.data['Date'] == date]['SOXL_Close'].iloc[0]
-        vxx_price = self.data[self.data['Date'] == date]['VXX_Close'].iloc[0]
-        
-        # 초기 투자금 배분
-        soxl_investment = self.cash * self.soxl_ratio
-        vxx_investment = self.cash * self.vxx_ratio
-        
-        # 주식 수 계산
-        self.soxl_shares = soxl_investment / soxl_price
-        self.vxx_shares = vxx_investment / vxx_price
-        self.cash = 0
-        
-        # 거래 기록
-        self.trade_history.append({
-            'Date': date,
-            'Type': 'Initial Investment',
-            'SOXL_Shares': self.soxl_shares,
-            'VXX_Shares': self.vxx_shares,
-            'SOXL_Price': soxl_price,
-            'VXX_Price': vxx_price,
-            'Cash': self.cash
-        })
-        
-        print(f"초기 투자 완료 ({date.strftime('%Y-%m-%d')})")
-        print(f"SOXL: {self.soxl_shares:.2f}주 @ ${soxl_price:.2f} = ${soxl_investment:,.2f}")
-        print(f"VXX: {self.vxx_shares:.2f}주 @ ${vxx_price:.2f} = ${vxx_investment:,.2f}")
-    
-    def calculate_portfolio_value(self, date):
-        """특정 날짜의 포트폴리오 가치를 계산합니다."""
-        row = self.data[self.data['Date'] == date]
-        if row.empty:
-            return 0
+        super().__init__(initial_capital, soxl_ratio, vxx_ratio)
         
-        soxl_price = row['SOXL_Close'].iloc[0]
-        vxx_price = row['VXX_Close'].iloc[0]
-        
-        portfolio_value = (self.soxl_shares * soxl_price + 
-                          self.vxx_shares * vxx_price + 
-                          self.cash)
-        
-        return portfolio_value
-    
-    def rebalance_portfolio(self, date, target_soxl_ratio=0.75, target_vxx_ratio=0.25):
-        """포트폴리오를 리밸런싱합니다."""
-        current_value = self.calculate_portfolio_value(date)
-        if current_value == 0:
-            return
-        
-        row = self.data[self.data['Date'] == date]
-        if row.empty:
-            return
-        
-        soxl_price = row['SOXL_Close'].iloc[0]
-        vxx_price = row['VXX_Close'].iloc[0]
-        
-        # 목표 주식 수 계산
-        target_soxl_value = current_value * target_soxl_ratio
-        target_vxx_value = current_value * target_vxx_ratio
-        
-        target_soxl_shares = target_soxl_value / soxl_price
-        target_vxx_shares = target_vxx_value / vxx_price
-        
-        # 거래 실행
-        soxl_diff = target_soxl_shares - self.soxl_shares
-        vxx_diff = target_vxx_shares - self.vxx_shares
-        
-        # 주식 수 업데이트
-        self.soxl_shares = target_soxl_shares
-        self.vxx_shares = target_vxx_shares
-        
-        # 거래 기록
-        self.trade_history.append({
-            'Date': date,
-            'Type': 'Rebalance',
-            'SOXL_Shares': self.soxl_shares,
-            'VXX_Shares': self.vxx_shares,
-            'SOXL_Price': soxl_price,
-            'VXX_Price': vxx_price,
-            'Cash': self.cash,
-            'SOXL_Change': soxl_diff,
-            'VXX_Change': vxx_diff
-        })
-        
-        self.rebalance_dates.append(date)
-        
-        print(f"리밸런싱 완료 ({date.strftime('%Y-%m-%d')})")
-        print(f"포트폴리오 가치: ${current_value:,.2f}")
-        print(f"SOXL: {self.soxl_shares:.2f}주 ({soxl_diff:+.2f})")
-        print(f"VXX: {self.vxx_shares:.2f}주 ({vxx_diff:+.2f})")
-    
-    def run_simulation(self, rebalance_frequency='monthly'):
+    def fetch_data(self, start_date="2025-01-01", end_date="2025-12-31",
+                   cache_dir=DEFAULT_CACHE_DIR, offline=False, cache=None, source=None):
         """
-        모의투자 시뮬레이션을 실행합니다.
+        SOXL과 VXX 데이터를 가져옵니다.
         
         Parameters:
-        - rebalance_frequency: 리밸런싱 주기 ('monthly', 'quarterly')
+        - cache_dir: 가격 캐시 디렉터리
+        - offline: True이면 네트워크 없이 캐시에서만 읽습니다
+        - cache: 여러 시뮬레이터가 공유할 PriceCache (지정하면 cache_dir/offline 무시)
+        - source: 데이터 소스 (예: SyntheticSource, 지정하면 가격 캐시를 거치지 않음)
         """
-        if not hasattr(self, 'data') or self.data.empty:
-            print("먼저 데이터를 가져와주세요.")
-            return
-        
-        print(f"\n=== SOXL-VXX 모의투자 시뮬레이션 시작 ===")
-        print(f"초기 투자금: ${self.initial_capital:,.2f}")
-        print(f"포트폴리오 비율: SOXL {self.soxl_ratio:.1%}, VXX {self.vxx_ratio:.1%}")
-        print(f"리밸런싱 주기: {rebalance_frequency}")
-        
-        # 첫 번째 거래일에 초기 투자
-        first_date = self.data['Date'].iloc[0]
-        self.initial_investment(first_date)
-        
-        # 리밸런싱 날짜 계산
-        if rebalance_frequency == 'monthly':
-            rebalance_dates = pd.date_range(start=first_date, end=self.data['Date'].iloc[-1], freq='MS')[1:]
-        elif rebalance_frequency == 'quarterly':
-            rebalance_dates = pd.date_range(start=first_date, end=self.data['Date'].iloc[-1], freq='QS')[1:]
-        else:
-            rebalance_dates = []
-        
-        # 실제 거래일과 매칭
-        actual_rebalance_dates = []
-        for rebalance_date in rebalance_dates:
-            # 리밸런싱 날짜 이후의 첫 번째 거래일 찾기
-            available_dates = self.data[self.data['Date'] > rebalance_date]['Date']
-            if not available_dates.empty:
-                actual_rebalance_dates.append(available_dates.iloc[0])
-        
-        # 리밸런싱 실행
-        for rebalance_date in actual_rebalance_dates:
-            if rebalance_date in self.data['Date'].values:
-                self.rebalance_portfolio(rebalance_date)
-        
-        # 일일 포트폴리오 가치 기록
-        for _, row in self.data.iterrows():
-            date = row['Date']
-            portfolio_value = self.calculate_portfolio_value(date)
-            
-            self.portfolio_history.append({
-                'Date': date,
-                'Portfolio_Value': portfolio_value,
-                'SOXL_Value': self.soxl_shares * row['SOXL_Close'],
-                'VXX_Value': self.vxx_shares * row['VXX_Close'],
-                'Cash': self.cash,
-                'SOXL_Price': row['SOXL_Close'],
-                'VXX_Price': row['VXX_Close']
-            })
-        
-        self.portfolio_history = pd.DataFrame(self.portfolio_history)
-        
-        # 성과 지표 계산
-        self.calculate_performance_metrics()
-        
-        print(f"\n=== 시뮬레이션 완료 ===")
-        self.print_performance_summary()
-    
-    def calculate_performance_metrics(self):
-        """성과 지표를 계산합니다."""
-        if self.portfolio_history.empty:
-            return
-        
-        # 기본 지표
-        final_value = self.portfolio_history['Portfolio_Value'].iloc[-1]
-        self.total_return = (final_value - self.initial_capital) / self.initial_capital
-        
-        # 연간 수익률
-        days = (self.portfolio_history['Date'].iloc[-1] - self.portfolio_history['Date'].iloc[0]).days
-        years = days / 365.25
-        self.annual_return = (final_value / self.initial_capital) ** (1/years) - 1
-        
-        # 변동성 (일간 수익률 기준)
-        daily_returns = self.portfolio_history['Portfolio_Value'].pct_change().dropna()
-        self.volatility = daily_returns.std() * np.sqrt(252)
-        
-        # 최대 낙폭
-        cumulative = (1 + daily_returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        self.max_drawdown = drawdown.min()
-        
-        # 샤프 비율 (무위험 수익률 3% 가정)
-        risk_free_rate = 0.03
-        self.sharpe_ratio = (self.annual_return - risk_free_rate) / self.volatility if self.volatility > 0 else 0
+        return super().fetch_data(start_date, end_date, cache_dir=cache_dir, offline=offline, cache=cache,
+                                  source=source)
     
     def print_performance_summary(self):
         """성과 요약을 출력합니다."""
-        final_value = self.portfolio_history['Portfolio_Value'].iloc[-1]
+        final_value = self.final_value
         
         print(f"\n포트폴리오 성과 요약")
         print(f"{'='*50}")
@@ -295,6 +55,7 @@ class SOXLVXXPaperTrading:
         print(f"\n리밸런싱 정보")
         print(f"{'='*50}")
         print(f"리밸런싱 횟수: {len(self.rebalance_dates)}회")
+        self.print_trade_costs()
         for i, date in enumerate(self.rebalance_dates, 1):
             print(f"{i}. {date.strftime('%Y-%m-%d')}")
     
@@ -304,20 +65,30 @@ class SOXLVXXPaperTrading:
             print("포트폴리오 데이터가 없습니다.")
             return
         
+        # plotly는 차트를 만들 때만 불러옴 (차트 없는 실행의 시작 시간 단축)
+        import plotly.graph_objects as go
+        from fast_plotting import line_trace, marker_trace
+        
         figures = []
         
         # 1. 포트폴리오 가치 변화
         fig1 = go.Figure()
         
-        fig1.add_trace(go.Scatter(
-            x=self.portfolio_history['Date'],
-            y=self.portfolio_history['Portfolio_Value'],
+        fig1.add_trace(line_trace(
+            self.portfolio_history['Date'],
+            self.portfolio_history['Portfolio_Value'],
             mode='lines',
             name='포트폴리오 가치',
             line=dict(color='blue', width=3)
         ))
         
-        # 리밸런싱 날짜는 별도로 표시하지 않음 (Plotly 호환성 문제)
+        # 리밸런싱 날짜 (하나의 마커 trace)
+        if self.rebalance_dates:
+            fig1.add_trace(marker_trace(
+                self.rebalance_dates,
+                self.portfolio_history['Date'],
+                self.portfolio_history['Portfolio_Value']
+            ))
         
         fig1.update_layout(
             title='SOXL-VXX 포트폴리오 가치 변화 (75% SOXL, 25% VXX)',
@@ -331,17 +102,17 @@ class SOXLVXXPaperTrading:
         # 2. 자산별 가치 변화
         fig2 = go.Figure()
         
-        fig2.add_trace(go.Scatter(
-            x=self.portfolio_history['Date'],
-            y=self.portfolio_history['SOXL_Value'],
+        fig2.add_trace(line_trace(
+            self.portfolio_history['Date'],
+            self.portfolio_history['SOXL_Value'],
             mode='lines',
             name='SOXL 가치 (75%)',
             line=dict(color='green', width=2)
         ))
         
-        fig2.add_trace(go.Scatter(
-            x=self.portfolio_history['Date'],
-            y=self.portfolio_history['VXX_Value'],
+        fig2.add_trace(line_trace(
+            self.portfolio_history['Date'],
+            self.portfolio_history['VXX_Value'],
             mode='lines',
             name='VXX 가치 (25%)',
             line=dict(color='red', width=2)
@@ -361,9 +132,9 @@ class SOXLVXXPaperTrading:
         
         fig3 = go.Figure()
         
-        fig3.add_trace(go.Scatter(
-            x=self.portfolio_history['Date'][1:],
-            y=daily_returns,
+        fig3.add_trace(line_trace(
+            self.portfolio_history['Date'][1:],
+            daily_returns,
             mode='lines',
             name='일간 수익률',
             line=dict(color='purple', width=1)
@@ -385,9 +156,9 @@ class SOXLVXXPaperTrading:
         
         fig4 = go.Figure()
         
-        fig4.add_trace(go.Scatter(
-            x=self.portfolio_history['Date'],
-            y=cumulative_returns,
+        fig4.add_trace(line_trace(
+            self.portfolio_history['Date'],
+            cumulative_returns,
             mode='lines',
             name='누적 수익률',
             line=dict(color='orange', width=3)
@@ -417,8 +188,8 @@ class SOXLVXXPaperTrading:
             self.portfolio_history.to_excel(writer, sheet_name='Portfolio_History', index=False)
             
             # 거래 기록
-            if self.trade_history:
-                trade_df = pd.DataFrame(self.trade_history)
+            trade_df = self.trade_history
+            if not trade_df.empty:
                 trade_df.to_excel(writer, sheet_name='Trade_History', index=False)
             
             # 성과 요약
@@ -449,11 +220,20 @@ class SOXLVXXPaperTrading:
             summary_df = pd.DataFrame(summary_data)
             summary_df.to_excel(writer, sheet_name='Performance_Summary', index=False)
         
+        count('bytes_written', os.path.getsize(filename))
         print(f"결과가 {filename}에 저장되었습니다.")
         return filename
 
-def run_comparison_simulation():
-    """다양한 리밸런싱 주기로 시뮬레이션을 비교 실행합니다."""
+def run_comparison_simulation(offline=False, export_format='xlsx', charts=True, result_cache=None):
+    """
+    다양한 리밸런싱 주기로 시뮬레이션을 비교 실행합니다.
+
+    Parameters:
+    - offline: True이면 네트워크 없이 가격 캐시만 사용
+    - export_format: 결과 저장 형식 ('xlsx', 'parquet', 'arrow', 'csv', None이면 저장하지 않음)
+    - charts: False이면 차트/보고서를 만들지 않음 (plotly를 불러오지 않는 헤드리스 실행)
+    - result_cache: ResultCache (지정하면 같은 입력의 저장된 시뮬레이션 결과를 재사용)
+    """
     print("=== SOXL-VXX 모의투자 시뮬레이션 비교 ===\n")
     
     # 시뮬레이션 설정
@@ -463,27 +243,37 @@ def run_comparison_simulation():
     
     results = {}
     
+    # 두 시뮬레이션이 같은 가격 캐시를 공유 (두 번째는 네트워크 호출 없음)
+    cache = PriceCache(offline=offline)
+    
+    # 모든 차트와 비교표를 보고서 하나로 저장
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report = HTMLReport("SOXL-VXX 모의투자 리밸런싱 주기 비교")
+    chart_names = ['포트폴리오 가치', '자산별 가치', '일간 수익률', '누적 수익률']
+    
     # 1개월 리밸런싱
     print("1. 1개월 리밸런싱 시뮬레이션")
     simulator_monthly = SOXLVXXPaperTrading(initial_capital, soxl_ratio, vxx_ratio)
     
-    if simulator_monthly.fetch_data():
-        simulator_monthly.run_simulation('monthly')
+    with span('fetch_data'):
+        fetched = simulator_monthly.fetch_data(cache=cache)
+    if fetched:
+        with span('simulation'):
+            simulator_monthly.run_simulation('monthly', result_cache=result_cache)
         results['monthly'] = simulator_monthly
         
-        # 시각화 저장
-        figures = simulator_monthly.create_visualizations()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        for i, fig in enumerate(figures):
-            chart_names = ['portfolio_value', 'asset_values', 'daily_returns', 'cumulative_returns']
-            filename = f"monthly_{chart_names[i]}_{timestamp}.html"
-            fig.write_html(filename)
-            print(f"차트가 {filename}에 저장되었습니다.")
-        
-        # Excel 저장
-        excel_filename = f"monthly_results_{timestamp}.xlsx"
-        simulator_monthly.save_results(excel_filename)
+        # 시각화를 보고서에 추가
+        if charts:
+            with span('charts'):
+                for chart_name, fig in zip(chart_names, simulator_monthly.create_visualizations()):
+                    report.add_figure(fig, f"1개월 리밸런싱 - {chart_name}")
+        
+        # 결과 저장
+        with span('export'):
+            if export_format == 'xlsx':
+                simulator_monthly.save_results(f"monthly_results_{timestamp}.xlsx")
+            elif export_format:
+                simulator_monthly.export_results(f"monthly_results_{timestamp}", export_format)
     
     print("\n" + "="*80 + "\n")
     
@@ -491,22 +281,25 @@ def run_comparison_simulation():
     print("2. 3개월 리밸런싱 시뮬레이션")
     simulator_quarterly = SOXLVXXPaperTrading(initial_capital, soxl_ratio, vxx_ratio)
     
-    if simulator_quarterly.fetch_data():
-        simulator_quarterly.run_simulation('quarterly')
+    with span('fetch_data'):
+        fetched = simulator_quarterly.fetch_data(cache=cache)
+    if fetched:
+        with span('simulation'):
+            simulator_quarterly.run_simulation('quarterly', result_cache=result_cache)
         results['quarterly'] = simulator_quarterly
         
-        # 시각화 저장
-        figures = simulator_quarterly.create_visualizations()
-        
-        for i, fig in enumerate(figures):
-            chart_names = ['portfolio_value', 'asset_values', 'daily_returns', 'cumulative_returns']
-            filename = f"quarterly_{chart_names[i]}_{timestamp}.html"
-            fig.write_html(filename)
-            print(f"차트가 {filename}에 저장되었습니다.")
-        
-        # Excel 저장
-        excel_filename = f"quarterly_results_{timestamp}.xlsx"
-        simulator_quarterly.save_results(excel_filename)
+        # 시각화를 보고서에 추가
+        if charts:
+            with span('charts'):
+                for chart_name, fig in zip(chart_names, simulator_quarterly.create_visualizations()):
+                    report.add_figure(fig, f"3개월 리밸런싱 - {chart_name}")
+        
+        # 결과 저장
+        with span('export'):
+            if export_format == 'xlsx':
+                simulator_quarterly.save_results(f"quarterly_results_{timestamp}.xlsx")
+            elif export_format:
+                simulator_quarterly.export_results(f"quarterly_results_{timestamp}", export_format)
     
     # 비교 결과 출력
     print("\n" + "="*80)
@@ -527,8 +320,46 @@ def run_comparison_simulation():
         print(f"{'샤프 비율':<20} {monthly.sharpe_ratio:.3f} {quarterly.sharpe_ratio:.3f} {(quarterly.sharpe_ratio - monthly.sharpe_ratio):.3f}")
         print(f"{'리밸런싱 횟수':<20} {len(monthly.rebalance_dates)}회 {len(quarterly.rebalance_dates)}회 {len(quarterly.rebalance_dates) - len(monthly.rebalance_dates)}회")
     
+    if results and charts:
+        labels = {'monthly': '1개월', 'quarterly': '3개월'}
+        report.add_table(pd.DataFrame([{
+            '리밸런싱 주기': labels[frequency],
+            '최종 가치': simulator.portfolio_history['Portfolio_Value'].iloc[-1],
+            '총 수익률': simulator.total_return,
+            '연간 수익률': simulator.annual_return,
+            '연간 변동성': simulator.volatility,
+            '최대 낙폭': simulator.max_drawdown,
+            '샤프 비율': simulator.sharpe_ratio,
+            '리밸런싱 횟수': len(simulator.rebalance_dates),
+        } for frequency, simulator in results.items()]), "리밸런싱 주기별 성과 비교")
+        with span('charts'):
+            report.write(f"comparison_report_{timestamp}.html")
+    
     return results
 
 if __name__ == "__main__":
-    # 비교 시뮬레이션 실행
-    results = run_comparison_simulation()
+    import argparse
+    import contextlib
+    
+    from result_cache import ResultCache
+    
+    parser = argparse.ArgumentParser(description="SOXL-VXX 모의투자 시뮬레이션 비교")
+    parser.add_argument('--offline', action='store_true', help="네트워크 없이 가격 캐시만 사용")
+    parser.add_argument('--format', default='xlsx', choices=['xlsx', 'parquet', 'arrow', 'csv', 'none'],
+                        help="결과 저장 형식 (none이면 저장하지 않음)")
+    parser.add_argument('--no-charts', action='store_true', help="차트/보고서 없이 실행 (헤드리스)")
+    parser.add_argument('--no-result-cache', action='store_true', help="저장된 시뮬레이션 결과를 사용하지 않음")
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='JSON',
+                        help="단계별 실행 시간/카운터 출력 (경로를 주면 JSON으로도 저장)")
+    parser.add_argument('--cprofile', default=None, metavar='PROF',
+                        help="--profile과 함께 시뮬레이션 핵심 cProfile 결과 저장")
+    args = parser.parse_args()
+    
+    # --profile/--cprofile가 없으면 계측을 켜지 않음 (추가 비용 없음)
+    profile = args.profile is not None or args.cprofile is not None
+    with profiling(args.profile or None, args.cprofile) if profile else contextlib.nullcontext():
+        # 비교 시뮬레이션 실행
+        results = run_comparison_simulation(offline=args.offline,
+                                            export_format=None if args.format == 'none' else args.format,
+                                            charts=not args.no_charts,
+                                            result_cache=None if args.no_result_cache else ResultCache())
@@ -0,0 +1,178 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from performance import RISK_FREE_RATE, TRADING_DAYS
+
+
+class StreamingMetrics:
+    def __init__(self, initial_capital, risk_free_rate=RISK_FREE_RATE, periods_per_year=TRADING_DAYS):
+        """
+        새 가치가 들어올 때마다 O(1)로 갱신되는 성과 지표 누산기
+
+        compute_performance_metrics와 같은 정의를 사용하므로 같은 가치 시계열을
+        넣으면 배치 계산과 같은 결과를 냅니다.
+        - 수익률 평균/분산: Welford 알고리즘
+        - 최대 낙폭: 첫 수익률 이후 누적 수익 곡선의 고점 대비 (배치 계산과 동일)
+
+        Parameters:
+        - initial_capital: 초기 투자금
+        - risk_free_rate: 무위험 수익률 (기본값: 3%)
+        - periods_per_year: 연율화에 사용할 연간 기간 수 (기본값: 252)
+        """
+        self.initial_capital = initial_capital
+        self.risk_free_rate = risk_free_rate
+        self.periods_per_year = periods_per_year
+
+        self.first_date = None
+        self.last_date = None
+        self.last_value = None
+
+        # 수익률 통계 (Welford)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+        # 누적 수익 곡선과 낙폭
+        self.cumulative = 1.0
+        self.peak = None
+        self.max_drawdown = 0.0
+
+    def update(self, date, value):
+        """새 가치 하나를 반영합니다."""
+        if self.last_value is None:
+            self.first_date = pd.Timestamp(date)
+            self.last_date = self.first_date
+            self.last_value = value
+            return
+
+        ret = value / self.last_value - 1
+        self.last_date = pd.Timestamp(date)
+        self.last_value = value
+        if math.isnan(ret):
+            return
+
+        self.count += 1
+        delta = ret - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (ret - self.mean)
+
+        self.cumulative *= 1 + ret
+        if self.peak is None or self.cumulative > self.peak:
+            self.peak = self.cumulative
+        drawdown = (self.cumulative - self.peak) / self.peak
+        if drawdown < self.max_drawdown:
+            self.max_drawdown = drawdown
+
+    def update_many(self, dates, values):
+        """
+        여러 가치를 한 번에 반영합니다.
+
+        청크 내부는 NumPy로 계산하고 청크 간에는 평균/분산(Chan 병합)과
+        누적 고점을 이어 받으므로, 한 개씩 update한 결과와 같습니다.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        dates = pd.DatetimeIndex(dates)
+
+        if self.last_value is None:
+            self.update(dates[0], values[0])
+            dates, values = dates[1:], values[1:]
+            if len(values) == 0:
+                return
+
+        previous = np.concatenate(([self.last_value], values[:-1]))
+        returns = values / previous - 1
+        self.last_date = dates[-1]
+        self.last_value = values[-1]
+        returns = returns[~np.isnan(returns)]
+        if len(returns) == 0:
+            return
+
+        # 평균/분산 병합
+        n = len(returns)
+        chunk_mean = returns.mean()
+        chunk_m2 = ((returns - chunk_mean) ** 2).sum()
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+
+        # 누적 곡선과 고점 이어 받기
+        cumulative = self.cumulative * np.cumprod(1 + returns)
+        running_max = np.maximum.accumulate(cumulative)
+        if self.peak is not None:
+            running_max = np.maximum(running_max, self.peak)
+        drawdown = ((cumulative - running_max) / running_max).min()
+
+        self.cumulative = cumulative[-1]
+        self.peak = running_max[-1]
+        self.max_drawdown = min(self.max_drawdown, drawdown)
+
+    @property
+    def total_return(self):
+        return (self.last_value - self.initial_capital) / self.initial_capital
+
+    @property
+    def annual_return(self):
+        years = (self.last_date - self.first_date).days / 365.25
+        if years <= 0:
+            return np.nan
+        return (self.last_value / self.initial_capital) ** (1 / years) - 1
+
+    @property
+    def volatility(self):
+        if self.count < 2:
+            return np.nan
+        return math.sqrt(self.m2 / (self.count - 1)) * math.sqrt(self.periods_per_year)
+
+    @property
+    def sharpe_ratio(self):
+        volatility = self.volatility
+        return (self.annual_return - self.risk_free_rate) / volatility if volatility > 0 else 0
+
+    def snapshot(self):
+        """현재 지표를 compute_performance_metrics와 같은 형식의 딕셔너리로 반환합니다."""
+        return {
+            'final_value': self.last_value,
+            'total_return': self.total_return,
+            'annual_return': self.annual_return,
+            'volatility': self.volatility,
+            'max_drawdown': self.max_drawdown,
+            'sharpe_ratio': self.sharpe_ratio,
+        }
+
+    def to_state(self):
+        """재시작 후 이어서 갱신할 수 있도록 누산기 상태를 JSON 직렬화 가능한 딕셔너리로 반환합니다."""
+        return {
+            'initial_capital': self.initial_capital,
+            'risk_free_rate': self.risk_free_rate,
+            'periods_per_year': self.periods_per_year,
+            'first_date': self.first_date.isoformat() if self.first_date is not None else None,
+            'last_date': self.last_date.isoformat() if self.last_date is not None else None,
+            'last_value': None if self.last_value is None else float(self.last_value),
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'cumulative': float(self.cumulative),
+            'peak': None if self.peak is None else float(self.peak),
+            'max_drawdown': float(self.max_drawdown),
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """to_state()로 저장한 상태에서 누산기를 복원합니다."""
+        metrics = cls(state['initial_capital'], state['risk_free_rate'], state['periods_per_year'])
+        metrics.first_date = pd.Timestamp(state['first_date']) if state['first_date'] else None
+        metrics.last_date = pd.Timestamp(state['last_date']) if state['last_date'] else None
+        metrics.last_value = state['last_value']
+        metrics.count = state['count']
+        metrics.mean = state['mean']
+        metrics.m2 = state['m2']
+        metrics.cumulative = state['cumulative']
+        metrics.peak = state['peak']
+        metrics.max_drawdown = state['max_drawdown']
+        return metrics
@@ -0,0 +1,315 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from rebalance_schedule import trading_days
+
+TRADING_DAYS_PER_YEAR = 252
+SESSION_MINUTES = 390
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+# 레버리지 상품의 일간 총수익률 하한 (가격이 0 이하로 떨어지지 않도록)
+MIN_GROSS_RETURN = 1e-4
+# 블록 내 phi^-k가 exp(AR1_MAX_EXPONENT)를 넘지 않도록 AR(1) 블록 길이를 정함
+AR1_MAX_EXPONENT = 20.0
+AR1_MAX_BLOCK = 4096
+
+DEFAULT_PARAMS = {
+    'leverage': 3.0,              # 일간 리셋 레버리지 배수
+    'expense_ratio': 0.0095,      # 레버리지 ETF 연 보수
+    'underlying_drift': 0.15,     # 기초 지수 연 기대수익률
+    'vol_multiplier': 1.2,        # 기초 지수 변동성 = vol_multiplier * VIX / 100
+    'vix_mean': 16.0,             # VIX 기준 수준 (급등 포함 평균은 약 19)
+    'vix_reversion': 6.0,         # VIX 평균 회귀 속도 (연)
+    'vix_volatility': 1.1,        # log VIX 연 변동성
+    'correlation': -0.7,          # 기초 지수 수익률과 VIX 변화의 상관계수
+    'spike_rate': 2.0,            # VIX 급등 연 발생 횟수
+    'spike_size': 0.35,           # VIX 급등 크기 (log, 지수분포 평균)
+    'crash_beta': 0.06,           # VIX 급등 시 기초 지수 하락폭 (급등 크기 대비)
+    'vxx_beta': 0.55,             # VIX 선물의 VIX 현물 민감도
+    'roll_base': 0.55,            # VIX 기준 수준일 때 선물 롤오버 손실 (연)
+    'roll_slope': 0.5,            # VIX가 기준보다 낮을수록(콘탱고) 늘어나는 롤오버 손실
+    'leveraged_price': 30.0,
+    'volatility_price': 50.0,
+    'leveraged_volume': 5e7,      # 일평균 거래량
+    'volatility_volume': 2e7,
+    'volume_dispersion': 0.3,
+}
+
+
+def _ar1(shocks, phi, x0=0.0):
+    """
+    x_t = phi * x_{t-1} + shocks_t를 블록 단위로 계산합니다.
+
+    블록 안에서는 x_k = phi^k * cumsum(e_j * phi^-j)로 한 번에 구하고,
+    블록 사이의 이월값만 순차적으로 전파합니다 (블록 수만큼만 반복).
+    """
+    n = len(shocks)
+    decay = -np.log(phi) if phi > 0 else np.inf
+    block = int(min(AR1_MAX_BLOCK, max(1, AR1_MAX_EXPONENT / decay))) if decay > 0 else AR1_MAX_BLOCK
+    n_blocks = -(-n // block)
+
+    padded = np.zeros(n_blocks * block)
+    padded[:n] = shocks
+    padded = padded.reshape(n_blocks, block)
+    powers = phi ** np.arange(block)
+    local = np.cumsum(padded / powers, axis=1) * powers
+
+    carry = np.empty(n_blocks)
+    previous = x0
+    step = phi ** block
+    for b, last in enumerate(local[:, -1]):
+        carry[b] = previous
+        previous = last + step * previous
+    local += carry[:, None] * (phi * powers)[None, :]
+    return local.ravel()[:n]
+
+
+def bars_per_session(bar_minutes=None):
+    """하루 봉 수 (bar_minutes가 None이면 일봉 1개)."""
+    if bar_minutes is None:
+        return 1
+    return -(-SESSION_MINUTES // int(bar_minutes))
+
+
+def market_index(start, end=None, periods=None, bar_minutes=None):
+    """
+    NYSE 거래일 기준 일봉 또는 분봉 시각을 만듭니다.
+
+    Parameters:
+    - start: 시작일
+    - end: 종료일 (포함, periods를 지정하지 않을 때)
+    - periods: 봉 수 (지정하면 start부터 periods개)
+    - bar_minutes: 분봉 간격 (None이면 일봉, 봉 시각은 구간 시작 시각)
+    """
+    per_day = bars_per_session(bar_minutes)
+    start = pd.Timestamp(start).normalize()
+    if periods is not None:
+        n_days = -(-int(periods) // per_day)
+        days = trading_days(start, start + pd.Timedelta(days=int(n_days * 1.5) + 10))[:n_days]
+    else:
+        days = trading_days(start, end)
+    if bar_minutes is None:
+        index = days
+    else:
+        offsets = SESSION_OPEN.value + np.arange(per_day, dtype=np.int64) * pd.Timedelta(minutes=int(bar_minutes)).value
+        index = pd.DatetimeIndex((days.asi8[:, None] + offsets[None, :]).ravel().view('datetime64[ns]'))
+    return index[:periods] if periods is not None else index
+
+
+def simulate_market(n_periods, bars_per_day=1, seed=None, state=None, **params):
+    """
+    레버리지 ETF와 VIX 선물 ETF의 결합 가격/거래량 경로를 생성합니다.
+
+    - VIX: 평균 회귀하는 log VIX (AR(1)) + 포아송 급등
+    - 기초 지수: 직전 VIX에 비례하는 변동성, VIX 변화와 음의 상관, 급등 시 하락
+    - 레버리지 ETF: 기초 지수 일간 수익률의 leverage배를 매일 리셋 (변동성 손실 발생)
+      분봉에서는 전일 종가 대비 수익률의 leverage배로 장중 가격을 계산
+    - VIX 선물 ETF: VIX 변화의 vxx_beta배 - 콘탱고 수준에 따른 롤오버 손실
+
+    Parameters:
+    - n_periods: 봉 수
+    - bars_per_day: 하루 봉 수 (1이면 일봉)
+    - seed: 난수 시드 또는 np.random.Generator
+    - state: 이전 호출의 결과 'state' (지정하면 그 끝에서 이어서 생성,
+      이전 호출의 n_periods는 bars_per_day의 배수여야 함)
+    - params: DEFAULT_PARAMS 값 변경
+
+    Returns:
+    - dict: 'leveraged_close', 'volatility_close', 'leveraged_volume', 'volatility_volume', 'vix', 'state'
+    """
+    unknown = set(params) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"알 수 없는 파라미터입니다: {', '.join(sorted(unknown))}")
+    p = {**DEFAULT_PARAMS, **params}
+    n = int(n_periods)
+    rng = np.random.default_rng(seed)
+    dt = 1.0 / (TRADING_DAYS_PER_YEAR * bars_per_day)
+    if state is None:
+        state = {'log_vix': 0.0, 'underlying': 1.0, 'leveraged': p['leveraged_price'],
+                 'volatility': p['volatility_price']}
+
+    # VIX: 기초 지수 충격과 상관된 충격 + 급등
+    z_market, z_vix = rng.standard_normal((2, n))
+    rho = p['correlation']
+    vix_shocks = p['vix_volatility'] * np.sqrt(dt) * (rho * z_market + np.sqrt(1 - rho ** 2) * z_vix)
+    spikes = np.zeros(n)
+    spike_at = np.flatnonzero(rng.random(n) < p['spike_rate'] * dt)
+    spikes[spike_at] = rng.exponential(p['spike_size'], len(spike_at))
+    log_vix = _ar1(vix_shocks + spikes, np.exp(-p['vix_reversion'] * dt), state['log_vix'])
+    vix = p['vix_mean'] * np.exp(log_vix)
+    prev_vix = np.concatenate(([p['vix_mean'] * np.exp(state['log_vix'])], vix[:-1]))
+
+    # 기초 지수 (처음 시작값 1)
+    sigma = prev_vix * (p['vol_multiplier'] / 100.0)
+    log_returns = (p['underlying_drift'] * dt - 0.5 * dt * sigma * sigma) + (np.sqrt(dt) * sigma) * z_market
+    log_returns -= p['crash_beta'] * spikes
+    underlying = state['underlying'] * np.exp(np.cumsum(log_returns))
+
+    # 레버리지 ETF: 전일 종가 기준 일간 리셋 (하루 단위 값은 np.repeat로 봉에 펼침)
+    n_days = -(-n // bars_per_day)
+    close_at = np.minimum(np.arange(1, n_days + 1) * bars_per_day - 1, n - 1)
+    reference = np.concatenate(([state['underlying']], underlying[close_at[:-1]]))
+    daily_fee = p['expense_ratio'] / TRADING_DAYS_PER_YEAR
+    leverage = p['leverage']
+    session_gross = np.maximum(1 + leverage * (underlying[close_at] / reference - 1) - daily_fee, MIN_GROSS_RETURN)
+    session_close = state['leveraged'] * np.cumprod(session_gross)
+    previous_close = np.concatenate(([state['leveraged']], session_close[:-1]))
+    if bars_per_day == 1:
+        leveraged = session_close
+    else:
+        elapsed = np.tile(np.arange(1, bars_per_day + 1) / bars_per_day, n_days)[:n]
+        intraday_gross = underlying / np.repeat(reference, bars_per_day)[:n]
+        intraday_gross -= 1
+        intraday_gross *= leverage
+        intraday_gross += 1 - daily_fee * elapsed
+        leveraged = np.repeat(previous_close, bars_per_day)[:n] * np.maximum(intraday_gross, MIN_GROSS_RETURN)
+
+    # VIX 선물 ETF: VIX가 기준 수준보다 낮으면 콘탱고로 롤오버 손실, 높으면 백워데이션으로 이익
+    roll = p['roll_base'] + p['roll_slope'] * (p['vix_mean'] - prev_vix) / p['vix_mean']
+    volatility_log_returns = p['vxx_beta'] * np.diff(log_vix, prepend=state['log_vix']) - roll * dt
+    volatility = state['volatility'] * np.exp(np.cumsum(volatility_log_returns))
+
+    # 거래량: VIX가 높을수록 증가, 분봉은 장 시작/마감에 몰리는 U자형
+    activity = prev_vix * (1.0 / (p['vix_mean'] * bars_per_day))
+    if bars_per_day > 1:
+        shape = 1 + 6 * (np.linspace(0.0, 1.0, bars_per_day) - 0.5) ** 2
+        activity *= np.tile(shape / shape.mean(), n_days)[:n]
+    # 거래량 잡음은 정밀도가 필요 없으므로 float32로 생성 (lognormal보다 빠름)
+    noise = rng.standard_normal((2, n), dtype=np.float32)
+    noise *= p['volume_dispersion']
+    np.exp(noise, out=noise)
+    noise = noise * activity
+
+    return {
+        'leveraged_close': leveraged,
+        'volatility_close': volatility,
+        'leveraged_volume': np.floor(p['leveraged_volume'] * noise[0]),
+        'volatility_volume': np.floor(p['volatility_volume'] * noise[1]),
+        'vix': vix,
+        'state': {'log_vix': log_vix[-1], 'underlying': underlying[-1], 'leveraged': leveraged[-1],
+                  'volatility': volatility[-1]},
+    }
+
+
+def generate_market(start="2000-01-03", end=None, periods=None, bar_minutes=None, seed=0,
+                    leveraged_ticker='SOXL', volatility_ticker='VXX', **params):
+    """
+    self.data와 같은 컬럼 구성의 합성 가격 패널을 생성합니다 (네트워크 사용 없음).
+
+    Parameters:
+    - start, end: 기간 (end 포함, periods를 지정하면 무시)
+    - periods: 봉 수
+    - bar_minutes: 분봉 간격 (None이면 일봉)
+    - seed: 난수 시드 (같은 시드와 기간이면 같은 데이터)
+    - leveraged_ticker, volatility_ticker: 컬럼에 사용할 티커
+    - params: simulate_market 파라미터
+
+    Returns:
+    - DataFrame: Date, {레버리지}_Close, {변동성}_Close, {레버리지}_Volume, {변동성}_Volume
+    """
+    if periods is None and end is None:
+        raise ValueError("end 또는 periods를 지정해야 합니다.")
+    index = market_index(start, end, periods, bar_minutes)
+    paths = simulate_market(len(index), bars_per_session(bar_minutes), seed, **params)
+    return pd.DataFrame({
+        'Date': index,
+        f"{leveraged_ticker}_Close": paths['leveraged_close'],
+        f"{volatility_ticker}_Close": paths['volatility_close'],
+        f"{leveraged_ticker}_Volume": paths['leveraged_volume'],
+        f"{volatility_ticker}_Volume": paths['volatility_volume'],
+    }, index=index)
+
+
+def write_market_panel(directory, start="2000-01-03", periods=None, end=None, bar_minutes=None, seed=0,
+                       chunk_days=250, leveraged_ticker='SOXL', volatility_ticker='VXX', **params):
+    """
+    합성 가격 패널을 chunk_days 거래일씩 생성하여 디스크 패널(append_panel)로 저장합니다.
+
+    청크마다 이전 청크의 끝 상태에서 이어서 생성하므로 메모리 사용량은 청크 크기에
+    비례하고, 몇 년치 분봉도 PriceStore.open으로 메모리 매핑하여 사용할 수 있습니다.
+
+    Returns:
+    - 저장한 행 수
+    """
+    from price_store import append_panel
+
+    if periods is None and end is None:
+        raise ValueError("end 또는 periods를 지정해야 합니다.")
+    per_day = bars_per_session(bar_minutes)
+    index = market_index(start, end, None if periods is None else -(-int(periods) // per_day))
+    n_days = len(index)
+    rng = np.random.default_rng(seed)
+    state = None
+    rows = 0
+    for first in range(0, n_days, chunk_days):
+        days = index[first:first + chunk_days]
+        chunk = market_index(days[0], days[-1], bar_minutes=bar_minutes)
+        if periods is not None:
+            chunk = chunk[:int(periods) - rows]
+        paths = simulate_market(len(chunk), per_day, rng, state, **params)
+        state = paths['state']
+        rows = append_panel(directory, pd.DataFrame({
+            'Date': chunk,
+            f"{leveraged_ticker}_Close": paths['leveraged_close'],
+            f"{volatility_ticker}_Close": paths['volatility_close'],
+            f"{leveraged_ticker}_Volume": paths['leveraged_volume'],
+            f"{volatility_ticker}_Volume": paths['volatility_volume'],
+        }))
+    return rows
+
+
+class SyntheticSource:
+    def __init__(self, bar_minutes=None, seed=0, leveraged_ticker='SOXL', volatility_ticker='VXX', **params):
+        """
+        generate_market 데이터를 반환하는 데이터 소스 (load_universe/fetch_data의 source)
+
+        두 티커를 한 번에 생성하여 공유하므로 티커별로 따로 요청해도 상관 구조가 유지됩니다.
+        """
+        self.bar_minutes = bar_minutes
+        self.seed = seed
+        self.tickers = (leveraged_ticker, volatility_ticker)
+        self.params = params
+        self._panels = {}
+        self._lock = threading.Lock()
+
+    def _panel(self, start, end):
+        key = (pd.Timestamp(start), pd.Timestamp(end))
+        with self._lock:
+            if key not in self._panels:
+                panel = generate_market(key[0], key[1], bar_minutes=self.bar_minutes, seed=self.seed,
+                                        leveraged_ticker=self.tickers[0], volatility_ticker=self.tickers[1],
+                                        **self.params)
+                self._panels[key] = panel[panel.index < key[1]]
+            return self._panels[key]
+
+    def fetch(self, ticker, start, end):
+        """한 티커의 [start, end) 구간 Close/Volume 데이터를 반환합니다."""
+        if ticker not in self.tickers:
+            raise ValueError(f"합성 데이터에 없는 티커입니다: {ticker} (지원: {', '.join(self.tickers)})")
+        if end is None:
+            end = pd.Timestamp.today().normalize()
+        panel = self._panel(start, end)
+        frame = pd.DataFrame({'Close': panel[f"{ticker}_Close"].to_numpy(),
+                              'Volume': panel[f"{ticker}_Volume"].to_numpy()},
+                             index=pd.DatetimeIndex(panel.index, name='Date'))
+        return frame
+
+    def fetch_many(self, tickers, start, end):
+        return {ticker: self.fetch(ticker, start, end) for ticker in tickers}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="합성 SOXL-VXX 가격 패널을 디스크에 생성 (메모리 매핑용)")
+    parser.add_argument('directory', help="패널 디렉토리")
+    parser.add_argument('--start', default="2000-01-03", help="시작일")
+    parser.add_argument('--years', type=float, default=5, help="기간 (년, 252 거래일 기준)")
+    parser.add_argument('--bar-minutes', type=int, default=None, help="분봉 간격 (기본값: 일봉)")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    periods = int(args.years * TRADING_DAYS_PER_YEAR) * bars_per_session(args.bar_minutes)
+    rows = write_market_panel(args.directory, args.start, periods, bar_minutes=args.bar_minutes, seed=args.seed)
+    print(f"{args.directory}에 {rows:,}개 봉을 저장했습니다.")
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 저장소 최상위 모듈(simulation_engine 등)을 import 할 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_market(periods=1000, start='2015-01-02', seed=7):
+    """로그 정규 랜덤 워크로 만든 SOXL-VXX 일봉 (self.data 형식, RangeIndex)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=periods)
+    soxl = 30 * np.exp(np.cumsum(rng.normal(0.001, 0.04, periods)))
+    vxx = 50 * np.exp(np.cumsum(rng.normal(-0.002, 0.035, periods)))
+    return pd.DataFrame({
+        'Date': dates,
+        'SOXL_Close': soxl,
+        'VXX_Close': vxx,
+        'SOXL_Volume': rng.integers(10**6, 10**7, periods).astype(np.float64),
+        'VXX_Volume': rng.integers(10**6, 10**7, periods).astype(np.float64),
+    })
+
+
+@pytest.fixture(scope='session')
+def market():
+    """약 4년치 SOXL-VXX 일봉"""
+    return make_market()
+
+
+@pytest.fixture(scope='session')
+def prices(market):
+    return market[['SOXL_Close', 'VXX_Close']].to_numpy()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from batch_backtest import backtest_allocation_curve, backtest_weight_matrix
+from performance import compute_performance_metrics
+from rebalance_schedule import rebalance_schedule
+from simulation_engine import simulate_rebalancing
+
+
+@pytest.mark.parametrize('rule', ['monthly', 'quarterly', 'none'])
+def test_weight_matrix_matches_individual_runs(market, prices, rule):
+    rng = np.random.default_rng(0)
+    weights = rng.dirichlet(np.ones(3), size=40)[:, :2]     # 행 합 < 1: 나머지는 현금
+    weights[:3] = [[1.0, 0.0], [0.0, 1.0], [0.75, 0.25]]
+    indices = rebalance_schedule(market['Date'], rule)
+
+    values = backtest_weight_matrix(prices, weights, 10000, indices)
+    expected = np.column_stack([simulate_rebalancing(prices, w, 10000, indices)['portfolio_value'] for w in weights])
+    assert values.shape == (len(prices), len(weights))
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 512])
+def test_allocation_curve_matches_individual_runs(market, prices, chunk_size):
+    ratios = np.linspace(0, 1, 21)
+    results, equity = backtest_allocation_curve(market, ratios, 'monthly', 10000, chunk_size=chunk_size,
+                                                return_equity=True)
+    indices = rebalance_schedule(market['Date'], 'monthly')
+
+    np.testing.assert_array_equal(results['SOXL_Ratio'], ratios)
+    for k, ratio in enumerate(ratios):
+        values = simulate_rebalancing(prices, (ratio, 1 - ratio), 10000, indices)['portfolio_value']
+        expected = compute_performance_metrics(market['Date'], values, 10000)
+        np.testing.assert_allclose(equity[:, k], values, rtol=1e-12)
+        row = results.iloc[k]
+        for key, column in [('final_value', 'Final_Value'), ('annual_return', 'Annual_Return'),
+                            ('volatility', 'Volatility'), ('max_drawdown', 'Max_Drawdown'),
+                            ('sharpe_ratio', 'Sharpe_Ratio')]:
+            assert row[column] == pytest.approx(expected[key], rel=1e-9), (ratio, column)
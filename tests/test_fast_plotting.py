@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from fast_plotting import line_trace, lttb_indices
+
+
+def reference_lttb(x, y, n_out):
+    """Steinarsson의 원래 LTTB 구현 (점마다 파이썬 루프)"""
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        avg_start = int(math.floor((i + 1) * every)) + 1
+        avg_end = min(int(math.floor((i + 2) * every)) + 1, n)
+        avg_x = sum(x[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(y[avg_start:avg_end]) / (avg_end - avg_start)
+
+        start = int(math.floor(i * every)) + 1
+        stop = int(math.floor((i + 1) * every)) + 1
+        best, best_area = start, -1.0
+        for j in range(start, stop):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return np.array(selected)
+
+
+def test_lttb_known_example():
+    x = np.arange(10.0)
+    y = np.array([0.0, 1.0, 0.0, 1.0, 9.0, 1.0, 0.0, -7.0, 0.0, 1.0])
+    # 양 끝점과 두 구간의 급등(4)/급락(7)을 남김
+    np.testing.assert_array_equal(lttb_indices(x, y, 4), [0, 4, 7, 9])
+
+
+@pytest.mark.parametrize('n, n_out', [(10, 3), (100, 7), (1000, 50), (5003, 3000), (2500, 2499)])
+def test_lttb_matches_reference(n, n_out):
+    rng = np.random.default_rng(n)
+    x = np.cumsum(rng.random(n) + 0.1)
+    y = np.cumsum(rng.normal(size=n))
+    indices = lttb_indices(x, y, n_out)
+
+    assert len(indices) == n_out
+    assert indices[0] == 0 and indices[-1] == n - 1
+    assert np.all(np.diff(indices) > 0)
+    np.testing.assert_array_equal(indices, reference_lttb(x, y, n_out))
+
+
+def test_lttb_keeps_short_series():
+    np.testing.assert_array_equal(lttb_indices(np.arange(5.0), np.ones(5), 10), np.arange(5))
+
+
+@pytest.mark.parametrize('n, max_points, expected_type, expected_points', [
+    (500, 3000, go.Scatter, 500),
+    (1000, 3000, go.Scatter, 1000),
+    (1001, 3000, go.Scattergl, 1001),
+    (10000, 3000, go.Scattergl, 3000),
+    (10000, 800, go.Scatter, 800),
+])
+def test_line_trace_switches_to_webgl(n, max_points, expected_type, expected_points):
+    dates = pd.Series(pd.date_range('2000-01-03', periods=n, freq='min'))
+    trace = line_trace(dates, np.sin(np.arange(n) / 50), max_points=max_points, name='value')
+    assert type(trace) is expected_type
+    assert len(trace.y) == expected_points
+    assert trace.mode == 'lines' and trace.name == 'value'
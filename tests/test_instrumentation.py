@@ -0,0 +1,55 @@
+import json
+
+import instrumentation
+from instrumentation import count, profiling, span
+
+
+def test_span_and_count_are_no_ops_when_inactive():
+    assert instrumentation._ACTIVE is None
+    assert span('fetch_data') is instrumentation._NULL_SPAN
+    assert span('engine', core=True) is instrumentation._NULL_SPAN
+    with span('fetch_data'):
+        count('rows', 10)
+    assert instrumentation._ACTIVE is None
+
+
+def test_profiling_collects_nested_spans_and_counters(tmp_path, capsys):
+    json_path = tmp_path / 'profile.json'
+    with profiling(json_path=str(json_path)) as profiler:
+        assert instrumentation._ACTIVE is profiler
+        with span('simulation'):
+            count('rows', 100)
+            for _ in range(3):
+                with span('engine'):
+                    count('rebalances')
+        with span('export'):
+            count('rows', 5)
+    assert instrumentation._ACTIVE is None
+
+    assert list(profiler.spans) == ['simulation', 'simulation/engine', 'export']
+    assert profiler.spans['simulation']['calls'] == 1
+    assert profiler.spans['simulation/engine']['calls'] == 3
+    assert profiler.spans['simulation']['seconds'] >= profiler.spans['simulation/engine']['seconds']
+    assert profiler.counters == {'rows': 105, 'rebalances': 3}
+    assert profiler.wall_time >= profiler.spans['simulation']['seconds']
+
+    saved = json.loads(json_path.read_text(encoding='utf-8'))
+    assert [entry['stage'] for entry in saved['spans']] == ['simulation', 'simulation/engine', 'export']
+    assert saved['counters'] == {'rows': 105, 'rebalances': 3}
+    # 보고서는 하위 단계를 상위 단계 아래에 이름만 들여 써서 출력
+    report = capsys.readouterr().out
+    assert '\n  engine' in report and 'simulation/engine' not in report
+
+
+def test_profiling_restores_previous_profiler_after_error(capsys):
+    try:
+        with profiling() as outer:
+            with profiling() as inner:
+                with span('inner'):
+                    raise RuntimeError
+    except RuntimeError:
+        pass
+    capsys.readouterr()
+    assert instrumentation._ACTIVE is None
+    assert 'inner' in inner.spans and inner.spans['inner']['calls'] == 1
+    assert outer.spans == {}
@@ -0,0 +1,92 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import make_market
+from live_trading import PaperTradingDaemon, ReplayQuoteFeed
+
+TICKERS = ['SOXL', 'VXX']
+
+
+def test_replay_feed_drift_rebalance():
+    data = pd.DataFrame({
+        'Date': pd.bdate_range('2024-01-01', periods=4),
+        'SOXL_Close': [10.0, 10.0, 20.0, 20.0],
+        'VXX_Close': [10.0, 10.0, 10.0, 10.0],
+    })
+    daemon = PaperTradingDaemon(TICKERS, [0.5, 0.5], 100, ReplayQuoteFeed(data, TICKERS), drift_threshold=0.1)
+    asyncio.run(daemon.run())
+
+    # 3번째 시세에서 SOXL 비율이 2/3로 이탈하여 한 번 리밸런싱
+    trades = daemon.trade_history
+    assert list(trades['Type']) == ['Initial Investment', 'Rebalance']
+    assert trades['Date'].iloc[1] == data['Date'].iloc[2].isoformat()
+    assert trades['Portfolio_Value'].iloc[1] == 150
+    np.testing.assert_allclose(daemon.portfolio.holdings, [3.75, 7.5])
+    assert (daemon.ticks, daemon.rebalances) == (4, 1)
+
+
+def run_daemon(feed, snapshot_path=None, max_ticks=None, weights=(0.75, 0.25)):
+    daemon = PaperTradingDaemon(TICKERS, list(weights), 10000, feed, snapshot_path=snapshot_path,
+                                snapshot_every=40)
+    asyncio.run(daemon.run(max_ticks))
+    return daemon
+
+
+def assert_same_state(daemon, expected):
+    assert (daemon.ticks, daemon.trades, daemon.rebalances) == (expected.ticks, expected.trades,
+                                                                 expected.rebalances)
+    np.testing.assert_array_equal(daemon.portfolio.holdings, expected.portfolio.holdings)
+    assert daemon.metrics.snapshot() == pytest.approx(expected.metrics.snapshot(), rel=1e-12)
+    pd.testing.assert_frame_equal(daemon.trade_history, expected.trade_history)
+
+
+def test_snapshot_restore_round_trip(tmp_path):
+    feed = ReplayQuoteFeed(make_market(periods=500), TICKERS)
+    expected = run_daemon(feed)
+    snapshot = str(tmp_path / 'state.json')
+
+    run_daemon(feed, snapshot, max_ticks=173)
+    resumed = run_daemon(feed, snapshot)
+    assert resumed.session_ticks == 500 - 173
+    assert_same_state(resumed, expected)
+
+    # 스냅샷에는 카운터만 저장되고 거래는 JSONL 기록 파일에 있음
+    assert 'trade_history' not in pd.read_json(snapshot, typ='series')
+    assert (tmp_path / 'state.trades.jsonl').exists()
+
+
+def test_restore_drops_trades_logged_after_snapshot(tmp_path):
+    feed = ReplayQuoteFeed(make_market(periods=500), TICKERS)
+    expected = run_daemon(feed)
+    snapshot = str(tmp_path / 'state.json')
+
+    # 스냅샷 후 거래를 기록 파일에만 쓰고 중단된 경우
+    daemon = run_daemon(feed, snapshot, max_ticks=120)
+    saved = daemon.trades
+    for quote in asyncio.run(collect(feed, daemon.last_timestamp, 150)):
+        daemon.on_quote(quote)
+    daemon._flush_trades()
+    assert daemon.trades > saved
+
+    resumed = run_daemon(feed, snapshot)
+    assert_same_state(resumed, expected)
+
+
+async def collect(feed, after, n):
+    quotes = []
+    async for quote in feed.stream(after=after):
+        quotes.append(quote)
+        if len(quotes) == n:
+            break
+    return quotes
+
+
+def test_restore_rejects_changed_weights(tmp_path):
+    feed = ReplayQuoteFeed(make_market(periods=100), TICKERS)
+    snapshot = str(tmp_path / 'state.json')
+    run_daemon(feed, snapshot, max_ticks=50)
+    with pytest.raises(ValueError, match='목표 비율'):
+        run_daemon(feed, snapshot, weights=(0.6, 0.4))
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from parameter_sweep import sweep
+from portfolio_core import SOXLVXXSimulator
+
+COLUMNS = ['Window_Start', 'Window_End', 'Frequency', 'Band', 'SOXL_Ratio', 'VXX_Ratio', 'Final_Value',
+           'Total_Return', 'Annual_Return', 'Volatility', 'Max_Drawdown', 'Sharpe_Ratio', 'Rebalances']
+
+
+def test_process_pool_sweep_matches_run_simulation(market, capsys):
+    ratios = [0.0, 0.3, 0.75]
+    results = sweep(market, ratios=ratios, frequencies=('monthly', 'band'), bands=(0.05, 0.1),
+                    initial_capital=10000, max_workers=2)
+    capsys.readouterr()
+
+    assert list(results.columns) == COLUMNS
+    assert len(results) == len(ratios) * 3
+    for row in results.itertuples():
+        simulator = SOXLVXXSimulator(10000, row.SOXL_Ratio, row.VXX_Ratio)
+        simulator.data = market
+        simulator.run_simulation(row.Frequency, band=row.Band)
+        assert row.Final_Value == pytest.approx(simulator.final_value, rel=1e-12)
+        assert row.Annual_Return == pytest.approx(simulator.annual_return, rel=1e-12)
+        assert row.Volatility == pytest.approx(simulator.volatility, rel=1e-12)
+        assert row.Max_Drawdown == pytest.approx(simulator.max_drawdown, rel=1e-12)
+        assert row.Sharpe_Ratio == pytest.approx(simulator.sharpe_ratio, rel=1e-12)
+        assert row.Rebalances == len(simulator.rebalance_dates)
+    capsys.readouterr()
+
+
+def test_serial_and_pool_sweeps_agree(market):
+    kwargs = dict(ratios=np.linspace(0, 1, 5), frequencies=('quarterly', 'none'),
+                  windows=(None, ('2016-01-01', '2017-06-30')))
+    serial = sweep(market, max_workers=1, **kwargs)
+    pooled = sweep(market, max_workers=3, chunksize=2, **kwargs)
+    assert len(serial) == 5 * 2 * 2
+    assert serial.equals(pooled)
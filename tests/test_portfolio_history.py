@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_core import SOXLVXXSimulator
+from portfolio_history import PortfolioHistory
+from rebalance_schedule import rebalance_schedule
+from simulation_engine import simulate_rebalancing
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_engine_writes_into_history_buffers(market, prices, dtype):
+    indices = rebalance_schedule(market['Date'], 'monthly')
+    expected = simulate_rebalancing(prices, (0.5, 0.3), 10000, indices)
+
+    history = PortfolioHistory(market['Date'].to_numpy(), ['SOXL', 'VXX'],
+                               {'SOXL': prices[:, 0], 'VXX': prices[:, 1]}, dtype)
+    result = simulate_rebalancing(prices, (0.5, 0.3), 10000, indices, out=history.buffers())
+    assert 'holdings' not in result
+    assert np.shares_memory(result['portfolio_value'], history.values)
+
+    rtol = 1e-15 if dtype is np.float64 else 1e-6
+    np.testing.assert_allclose(history.portfolio_value, expected['portfolio_value'], rtol=rtol)
+    np.testing.assert_allclose(history.asset_value('VXX'), expected['asset_values'][:, 1], rtol=rtol)
+    np.testing.assert_allclose(history.cash, expected['cash'], rtol=rtol)
+    np.testing.assert_array_equal(result['event_values'], expected['event_values'])
+
+
+@pytest.mark.parametrize('costs', [None, {}])
+def test_float32_history_matches_float64(market, costs, capsys):
+    frames = {}
+    for dtype in (np.float64, np.float32):
+        simulator = SOXLVXXSimulator(10000)
+        simulator.history_dtype = dtype
+        simulator.costs = costs
+        simulator.data = market
+        simulator.run_simulation('monthly')
+        assert simulator.history.values.dtype == dtype
+        frames[dtype] = simulator.portfolio_history
+    capsys.readouterr()
+
+    full, compact = frames[np.float64], frames[np.float32]
+    assert list(compact.columns) == list(full.columns)
+    pd.testing.assert_series_equal(compact['Date'], full['Date'])
+    pd.testing.assert_frame_equal(compact.drop(columns='Date'), full.drop(columns='Date'),
+                                  check_dtype=False, rtol=1e-6, atol=1e-6)
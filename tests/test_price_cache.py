@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from price_cache import PriceCache
+from conftest import make_market
+
+
+class RecordingDownloader:
+    """요청한 (ticker, start, end)를 기록하고 준비한 일봉에서 잘라 반환하는 downloader"""
+
+    def __init__(self, market):
+        frame = market.set_index('Date')
+        self.frame = frame[['SOXL_Close', 'SOXL_Volume']].set_axis(['Close', 'Volume'], axis=1)
+        self.calls = []
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        frame = self.frame
+        return frame[(frame.index >= pd.Timestamp(start)) & (frame.index < pd.Timestamp(end))]
+
+
+def assert_same_rows(left, right):
+    # 새로 내려받은 결과와 디스크에서 읽은 결과는 날짜 단위(us/ns)가 다를 수 있음
+    np.testing.assert_array_equal(left.index.as_unit('ns'), right.index.as_unit('ns'))
+    np.testing.assert_array_equal(left[['Close', 'Volume']].to_numpy(), right[['Close', 'Volume']].to_numpy())
+
+
+@pytest.fixture
+def downloader():
+    return RecordingDownloader(make_market(periods=600, start='2016-01-04'))
+
+
+def test_covered_range_is_served_from_disk(tmp_path, downloader):
+    cache = PriceCache(str(tmp_path), downloader=downloader)
+    first = cache.get('SOXL', '2016-03-01', '2017-03-01')
+    second = cache.get('SOXL', '2016-06-01', '2016-09-01')
+
+    assert downloader.calls == [('SOXL', '2016-03-01', '2017-03-01')]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert_same_rows(second, first[(first.index >= '2016-06-01') & (first.index < '2016-09-01')])
+    # 새 인스턴스도 manifest로 같은 범위를 캐시에서 읽음
+    reopened = PriceCache(str(tmp_path), downloader=downloader)
+    assert reopened.coverage('SOXL') == (pd.Timestamp('2016-03-01'), pd.Timestamp('2017-03-01'))
+
+
+def test_head_and_tail_top_up_fetch_only_missing_ranges(tmp_path, downloader):
+    cache = PriceCache(str(tmp_path), downloader=downloader)
+    cache.get('SOXL', '2016-03-01', '2016-09-01')
+    frame = cache.get('SOXL', '2016-01-15', '2016-12-01')
+
+    assert downloader.calls[1:] == [('SOXL', '2016-01-15', '2016-03-01'), ('SOXL', '2016-09-01', '2016-12-01')]
+    assert cache.coverage('SOXL') == (pd.Timestamp('2016-01-15'), pd.Timestamp('2016-12-01'))
+    expected = downloader.frame[(downloader.frame.index >= '2016-01-15') & (downloader.frame.index < '2016-12-01')]
+    assert_same_rows(frame, expected)
+
+
+def test_empty_top_up_still_records_requested_range(tmp_path, downloader):
+    cache = PriceCache(str(tmp_path), downloader=downloader)
+    # 2016-03-05(토) ~ 2016-03-07(월) 앞까지는 주말뿐이라 내려받은 결과가 비어 있음
+    cache.get('SOXL', '2016-02-01', '2016-03-05')
+    cache.get('SOXL', '2016-02-01', '2016-03-07')
+    assert cache.coverage('SOXL')[1] == pd.Timestamp('2016-03-07')
+
+    calls = len(downloader.calls)
+    cache.get('SOXL', '2016-02-01', '2016-03-07')
+    assert len(downloader.calls) == calls
+
+
+def test_downloader_can_be_given_per_call(tmp_path, downloader):
+    cache = PriceCache(str(tmp_path), downloader=None)
+    cache.get('SOXL', '2016-03-01', '2016-06-01', downloader=downloader)
+    assert cache.downloader is None
+    assert len(downloader.calls) == 1
+
+
+def test_offline_miss_raises_and_hit_is_served(tmp_path, downloader):
+    PriceCache(str(tmp_path), downloader=downloader).get('SOXL', '2016-03-01', '2016-09-01')
+    offline = PriceCache(str(tmp_path), offline=True, downloader=downloader)
+
+    assert len(offline.get('SOXL', '2016-04-01', '2016-05-01'))
+    with pytest.raises(ValueError, match='오프라인'):
+        offline.get('SOXL', '2016-01-01', '2016-09-01')
+    with pytest.raises(ValueError, match='오프라인'):
+        offline.get('VXX', '2016-03-01', '2016-09-01')
+    assert len(downloader.calls) == 1
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rebalance_schedule import rebalance_schedule, schedule_dates, trading_days
+
+
+def test_trading_days_skip_nyse_holidays():
+    days = trading_days('2024-12-20', '2025-01-10')
+    for holiday in ['2024-12-25', '2025-01-01', '2025-01-09']:
+        assert pd.Timestamp(holiday) not in days
+    assert pd.Timestamp('2024-12-24') in days
+    assert len(days) == 13
+
+
+@pytest.mark.parametrize('rule, expected', [
+    ('monthly', ['2024-02-01', '2024-03-01']),
+    ('month_end', ['2024-01-31', '2024-02-29']),
+    ('quarterly', []),
+])
+def test_rebalance_schedule_rules(rule, expected):
+    days = trading_days('2024-01-02', '2024-03-15')
+    np.testing.assert_array_equal(days[rebalance_schedule(days, rule)], pd.DatetimeIndex(expected))
+
+
+@pytest.mark.parametrize('rule', [None, 'none', 'fortnightly', 'Monthly'])
+def test_unknown_rule_means_no_rebalancing(rule):
+    days = trading_days('2024-01-02', '2024-12-31')
+    assert len(rebalance_schedule(days, rule)) == 0
+
+
+def test_integer_rule_accepts_numpy_integers():
+    days = trading_days('2024-01-02', '2024-12-31')
+    np.testing.assert_array_equal(rebalance_schedule(days, np.int64(21)), rebalance_schedule(days, 21))
+    with pytest.raises(ValueError):
+        rebalance_schedule(days, 0)
+
+
+def test_schedule_dates_canonicalizes_cache_keys():
+    # 스윕 격자가 NumPy 배열에서 오면 규칙이 np.int64가 됨
+    expected = schedule_dates(21, '2024-01-01', '2024-12-31')
+    assert schedule_dates(np.int64(21), '2024-01-01', '2024-12-31') is expected
+
+    dates = ['2024-03-04', '2024-06-15']
+    listed = schedule_dates(dates, '2024-01-01', '2024-12-31')
+    assert schedule_dates(np.array(dates, dtype='datetime64[ns]'), '2024-01-01', '2024-12-31') is listed
+    np.testing.assert_array_equal(listed, pd.DatetimeIndex(['2024-03-04', '2024-06-17']))
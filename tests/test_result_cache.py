@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from portfolio_core import SOXLVXXSimulator
+from result_cache import ResultCache, cache_key, data_fingerprint
+
+
+def test_cache_key_is_stable_and_order_independent():
+    key = cache_key(a=1, b=[1, 2], c='x')
+    # 저장된 결과를 재사용하려면 실행(프로세스)이 바뀌어도 같은 키여야 함
+    assert key == 'ed60d8300f9dfe0d3dfc111dd255111f496f0e76a564b7c5fc354ffc2f8317b6'
+    assert cache_key(c='x', b=[1, 2], a=1) == key
+    assert cache_key(a=1, b=[2, 1], c='x') != key
+    assert cache_key(a=1, b=[1, 2], c='x', d=None) != key
+
+
+def test_data_fingerprint_depends_on_content_dtype_and_shape():
+    values = np.arange(4, dtype=np.int64)
+    fingerprint = data_fingerprint(values, np.array([1.5, 2.5]))
+    assert fingerprint == '6e3cef241bec57a68d83e0f256610e9ccd20d5e918d4539dbd24890b80391f73'
+    # 연속되지 않은 뷰도 내용이 같으면 같은 지문
+    assert data_fingerprint(np.arange(8, dtype=np.int64)[::2] // 2, np.array([1.5, 2.5])) == fingerprint
+    assert data_fingerprint(values.astype(np.int32), np.array([1.5, 2.5])) != fingerprint
+    assert data_fingerprint(values.reshape(2, 2), np.array([1.5, 2.5])) != fingerprint
+    assert data_fingerprint(values, np.array([1.5, 2.25])) != fingerprint
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    value = {'history': pd.DataFrame({'Value': [1.0, 2.0]}), 'holdings': np.array([3.0, 4.0]), 'cash': 5.0}
+    cache.put('abc', value)
+
+    restored = cache.get('abc')
+    pd.testing.assert_frame_equal(restored['history'], value['history'])
+    np.testing.assert_array_equal(restored['holdings'], value['holdings'])
+    assert restored['cash'] == 5.0
+    assert cache.get('missing') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # 깨진 항목은 없는 것으로 처리
+    with open(os.path.join(str(tmp_path), 'broken.pkl'), 'wb') as f:
+        f.write(b'not a pickle')
+    assert cache.get('broken') is None
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    payload = np.zeros(1000)
+    cache = ResultCache(str(tmp_path), max_bytes=10**9)
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.put(key, payload)
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    size = os.path.getsize(cache._path('a'))
+
+    # 'a'를 읽으면 마지막 사용 시각이 갱신되어 가장 오래된 항목은 'b'가 됨
+    cache.get('a')
+    cache.max_bytes = 3 * size
+    cache.put('d', payload)
+    assert sorted(name[:-4] for name in os.listdir(str(tmp_path))) == ['a', 'c', 'd']
+
+
+def test_simulation_key_separates_history_dtype(market, tmp_path, capsys):
+    cache = ResultCache(str(tmp_path))
+    simulators = {}
+    for dtype in (np.float64, np.float32):
+        simulator = SOXLVXXSimulator(10000)
+        simulator.history_dtype = dtype
+        simulator.data = market
+        simulator.run_simulation('monthly', result_cache=cache)
+        simulators[dtype] = simulator
+    assert simulators[np.float64].simulation_key('monthly') != simulators[np.float32].simulation_key('monthly')
+
+    # 저장된 결과를 다시 불러와도 자료형별 기록이 유지됨
+    for dtype, simulator in simulators.items():
+        restored = SOXLVXXSimulator(10000)
+        restored.history_dtype = dtype
+        restored.data = market
+        restored.run_simulation('monthly', result_cache=cache)
+        assert restored.history.portfolio_value.dtype == dtype
+        pd.testing.assert_frame_equal(restored.portfolio_history, simulator.portfolio_history)
+    assert cache.hits == 2
+    capsys.readouterr()
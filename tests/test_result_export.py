@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from result_export import export_frame, export_tables, read_dataset, write_partitioned
+
+def requires(fmt):
+    if fmt in ('parquet', 'arrow'):
+        pytest.importorskip('pyarrow')
+
+
+def read(path, fmt):
+    if fmt == 'csv':
+        return pd.read_csv(path, parse_dates=['Date'])
+    if fmt == 'parquet':
+        return pd.read_parquet(path)
+    return read_dataset(os.path.dirname(path), 'arrow')
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 23
+    return pd.DataFrame({
+        'Date': pd.bdate_range('2024-01-01', periods=n),
+        'Frequency': np.array(['monthly', 'quarterly', 'band'])[np.arange(n) % 3],
+        'SOXL_Ratio': np.round(rng.random(n), 2),
+        'Final_Value': rng.random(n) * 1e5,
+        'Rebalances': rng.integers(0, 50, n),
+    })
+
+
+def assert_same(left, right):
+    pd.testing.assert_frame_equal(left.reset_index(drop=True), right.reset_index(drop=True),
+                                  check_dtype=False)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet', 'arrow'])
+def test_export_tables_round_trip(tmp_path, frame, fmt):
+    requires(fmt)
+    paths = export_tables({'Results': frame, 'Empty': frame.iloc[:0]}, str(tmp_path), fmt)
+
+    # 빈 표는 저장하지 않음
+    assert [os.path.basename(path) for path in paths] == [f"Results.{fmt}"]
+    back = read(paths[0], fmt)
+    back['Date'] = back['Date'].astype('datetime64[ns]')
+    assert_same(back, frame)
+
+
+def test_chunked_csv_writes_one_header(tmp_path, frame):
+    path = export_frame(frame, str(tmp_path / 'results.csv'), chunk_rows=5)
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert len(lines) == len(frame) + 1
+    assert sum(line.startswith('Date,') for line in lines) == 1
+    assert_same(pd.read_csv(path, parse_dates=['Date']), frame)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet', 'arrow'])
+def test_partitioned_dataset_round_trip(tmp_path, frame, fmt):
+    requires(fmt)
+    root = str(tmp_path / 'dataset')
+    frame = frame.assign(Window=np.where(np.arange(len(frame)) < 10, 'early', 'late'))
+    paths = write_partitioned(frame, root, ['Frequency', 'Window'], fmt)
+
+    # root/Frequency=값/Window=값/part-<uuid>.<확장자>
+    layouts = sorted(os.path.relpath(os.path.dirname(path), root) for path in paths)
+    expected = sorted(os.path.join(f"Frequency={f}", f"Window={w}")
+                      for f, w in frame[['Frequency', 'Window']].drop_duplicates().itertuples(index=False))
+    assert layouts == expected
+    assert all(os.path.basename(path).startswith('part-') and path.endswith(f".{fmt}") for path in paths)
+
+    back = read_dataset(root, fmt)
+    back['Date'] = pd.to_datetime(back['Date']).astype('datetime64[ns]')
+    key = ['Date']
+    assert_same(back.sort_values(key)[frame.columns], frame.sort_values(key))
+
+    # 같은 데이터셋에 다시 추가해도 기존 파일을 덮어쓰지 않음
+    write_partitioned(frame, root, ['Frequency', 'Window'], fmt)
+    assert len(read_dataset(root, fmt)) == 2 * len(frame)
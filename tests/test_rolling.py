@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from performance import compute_performance_metrics
+from rebalance_schedule import rebalance_schedule
+from rolling_analytics import compute_rolling_metrics, sliding_max
+from rolling_windows import rolling_window_backtest
+from simulation_engine import simulate_rebalancing
+
+METRICS = [('final_value', 'Final_Value'), ('annual_return', 'Annual_Return'), ('volatility', 'Volatility'),
+           ('max_drawdown', 'Max_Drawdown'), ('sharpe_ratio', 'Sharpe_Ratio')]
+
+
+@pytest.mark.parametrize('rule', ['monthly', 'quarterly', 'month_end', 'none'])
+def test_rolling_window_backtest_matches_per_window(market, prices, rule):
+    results = rolling_window_backtest(market, window_years=1, rebalance_frequency=rule, step=7)
+    dates = pd.DatetimeIndex(market['Date'])
+    assert len(results)
+
+    for row in results.itertuples():
+        start, end = dates.get_loc(row.Window_Start), dates.get_loc(row.Window_End)
+        window_dates = dates[start:end + 1]
+        result = simulate_rebalancing(prices[start:end + 1], (0.75, 0.25), 10000,
+                                      rebalance_schedule(window_dates, rule))
+        expected = compute_performance_metrics(window_dates, result['portfolio_value'], 10000)
+        for key, column in METRICS:
+            assert getattr(row, column) == pytest.approx(expected[key], rel=1e-9, abs=1e-12), (row.Index, column)
+        assert row.Rebalances == len(result['event_indices']) - 1
+
+
+def test_rolling_metrics_match_pandas(market, prices):
+    values = simulate_rebalancing(prices, (0.75, 0.25), 10000, rebalance_schedule(market['Date'], 'monthly'))
+    values = values['portfolio_value']
+    metrics = compute_rolling_metrics(market['Date'], values, prices, windows=(21, 63))
+
+    returns = pd.Series(values).pct_change()
+    assets = pd.DataFrame(prices).pct_change()
+    for window in (21, 63):
+        volatility = returns.rolling(window).std() * np.sqrt(252)
+        excess = returns.rolling(window).mean() * 252 - 0.03
+        downside = np.sqrt((np.minimum(returns, 0) ** 2).rolling(window).mean() * 252)
+        beta = returns.rolling(window).cov(assets[0]) / assets[0].rolling(window).var()
+        drawdown = pd.Series(values) / pd.Series(values).rolling(window + 1).max() - 1
+
+        np.testing.assert_allclose(metrics[f"Volatility_{window}"], volatility, rtol=1e-8)
+        np.testing.assert_allclose(metrics[f"Sharpe_{window}"], excess / volatility, rtol=1e-7)
+        np.testing.assert_allclose(metrics[f"Sortino_{window}"], excess / downside, rtol=1e-7)
+        np.testing.assert_allclose(metrics[f"Correlation_{window}"],
+                                   assets[0].rolling(window).corr(assets[1]), rtol=1e-8)
+        np.testing.assert_allclose(metrics[f"Beta_{window}"], beta, rtol=1e-8)
+        np.testing.assert_allclose(metrics[f"Drawdown_{window}"], drawdown, rtol=1e-12, atol=1e-15)
+
+
+def test_rolling_metrics_single_asset_has_no_correlation(market, prices):
+    metrics = compute_rolling_metrics(market['Date'], prices[:, 0], prices[:, 0], windows=(21,))
+    assert 'Correlation_21' not in metrics
+    np.testing.assert_allclose(metrics['Beta_21'][21:], 1.0, rtol=1e-9)
+
+
+@pytest.mark.parametrize('window', [1, 2, 5, 64, 999, 1000, 1001])
+def test_sliding_max_matches_naive(prices, window):
+    values = prices[:1000, 0]
+    expected = np.array([values[i:i + window].max() for i in range(len(values) - window + 1)])
+    np.testing.assert_array_equal(sliding_max(values, window), expected)
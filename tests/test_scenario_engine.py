@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from performance import compute_path_metrics
+from scenario_engine import (block_bootstrap_indices, historical_returns, run_scenarios,
+                             simulate_strategy_paths, stationary_bootstrap_indices)
+from simulation_engine import simulate_rebalancing
+
+
+def block_lengths(indices, n_obs):
+    """경로별로 직전 인덱스 다음 날(원형)이 아닌 곳에서 나눈 블록 길이"""
+    lengths = []
+    for path in indices:
+        breaks = np.flatnonzero(path[1:] != (path[:-1] + 1) % n_obs) + 1
+        lengths.append(np.diff(np.concatenate(([0], breaks, [len(path)]))))
+    return np.concatenate(lengths)
+
+
+def test_stationary_bootstrap_indices():
+    rng = np.random.default_rng(0)
+    indices = stationary_bootstrap_indices(999, 400, 500, 20, rng)
+    assert indices.shape == (400, 500)
+    assert indices.min() >= 0 and indices.max() < 999
+    # 기하분포 블록 길이 (경로 끝에서 잘린 블록은 제외)
+    lengths = block_lengths(indices[:, :400], 999)
+    assert lengths.mean() == pytest.approx(20, rel=0.1)
+
+
+def test_block_bootstrap_indices():
+    rng = np.random.default_rng(0)
+    indices = block_bootstrap_indices(50, 30, 95, 10, rng)
+    assert indices.shape == (30, 95)
+    assert indices.min() >= 0 and indices.max() < 50
+    for path in indices:
+        # 고정 길이 블록 안에서는 원형으로 하루씩 이어짐
+        blocks = path[:90].reshape(9, 10)
+        np.testing.assert_array_equal((blocks[:, 1:] - blocks[:, :-1]) % 50, 1)
+
+
+@pytest.mark.parametrize('rebalance_every', [0, 1, 21, 63])
+def test_identity_path_reproduces_historical_run(market, prices, rebalance_every):
+    returns = historical_returns(market)
+    values = simulate_strategy_paths(returns[None], (0.75, 0.25), 10000, rebalance_every)
+
+    indices = np.arange(rebalance_every, len(prices), rebalance_every) if rebalance_every else []
+    expected = simulate_rebalancing(prices, (0.75, 0.25), 10000, indices)['portfolio_value']
+    assert values.shape == (len(prices), 1)
+    np.testing.assert_allclose(values[:, 0], expected, rtol=1e-10)
+
+
+def test_scenarios_reproducible_across_workers(market):
+    returns = historical_returns(market)
+    kwargs = dict(n_paths=250, n_steps=120, seed=42, chunk_size=60, initial_capital=10000)
+    serial = run_scenarios(returns, max_workers=1, **kwargs).to_frame()
+    pooled = run_scenarios(returns, max_workers=3, **kwargs).to_frame()
+    assert len(serial) == 250
+    assert serial.equals(pooled)
+    assert not serial.equals(run_scenarios(returns, max_workers=1, **{**kwargs, 'seed': 43}).to_frame())
+
+
+def test_scenario_chunk_matches_manual_paths(market):
+    returns = historical_returns(market)
+    results = run_scenarios(returns, n_paths=40, n_steps=60, seed=5, chunk_size=40, method='block', block=10,
+                            initial_capital=10000)
+
+    rng = np.random.default_rng(np.random.SeedSequence(5).spawn(1)[0])
+    indices = block_bootstrap_indices(len(returns), 40, 60, 10, rng)
+    values = simulate_strategy_paths(returns[indices], (0.75, 0.25), 10000, 21)
+    expected = compute_path_metrics(values, 10000)
+    for name, column in expected.items():
+        np.testing.assert_allclose(results.metrics[name], column, rtol=1e-12)
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from performance import infer_periods_per_year
+from price_store import PriceStore, append_panel
+from rebalance_schedule import rebalance_schedule
+from simulation_engine import band_rebalance_indices, simulate_rebalancing, simulate_rebalancing_chunked
+
+TICKERS = ('SOXL', 'VXX')
+
+
+def naive_rebalancing(prices, weights, initial_capital, rebalance_indices):
+    """하루씩 보유 수량과 현금을 갱신하는 기준 구현"""
+    weights = np.asarray(weights)
+    targets = set(int(idx) for idx in rebalance_indices)
+    shares = initial_capital * weights / prices[0]
+    cash = initial_capital * (1 - weights.sum())
+    values = []
+    for t in range(len(prices)):
+        value = shares @ prices[t] + cash
+        if t in targets and t > 0:
+            shares = value * weights / prices[t]
+            cash = value * (1 - weights.sum())
+        values.append(value)
+    return np.array(values)
+
+
+@pytest.mark.parametrize('weights', [(0.75, 0.25), (0.5, 0.3)])
+@pytest.mark.parametrize('rule', ['monthly', 'quarterly', 'weekly', 'none'])
+def test_simulate_rebalancing_matches_loop(market, prices, weights, rule):
+    indices = rebalance_schedule(market['Date'], rule)
+    result = simulate_rebalancing(prices, weights, 10000, indices)
+    expected = naive_rebalancing(prices, weights, 10000, indices)
+    np.testing.assert_allclose(result['portfolio_value'], expected, rtol=1e-12)
+    np.testing.assert_allclose(result['asset_values'].sum(axis=1) + result['cash'], expected, rtol=1e-12)
+
+
+def test_simulate_rebalancing_ignores_out_of_range_indices(prices):
+    inside = simulate_rebalancing(prices, (0.75, 0.25), 10000, [100, 200])
+    padded = simulate_rebalancing(prices, (0.75, 0.25), 10000, [-5, 0, 100, 200, 200, len(prices) + 3])
+    np.testing.assert_array_equal(padded['event_indices'], [0, 100, 200])
+    np.testing.assert_array_equal(padded['portfolio_value'], inside['portfolio_value'])
+
+
+def naive_band_indices(prices, weights, band):
+    """매일 보유 비율을 확인하는 기준 구현"""
+    weights = np.asarray(weights)
+    cash_weight = 1 - weights.sum()
+    events, event = [], 0
+    for t in range(1, len(prices)):
+        values = prices[t] / prices[event] * weights
+        current = values / (values.sum() + cash_weight)
+        if np.abs(current - weights).max() > band:
+            events.append(t)
+            event = t
+    return np.array(events, dtype=np.int64)
+
+
+@pytest.mark.parametrize('weights', [(0.75, 0.25), (0.5, 0.3)])
+@pytest.mark.parametrize('band', [0.02, 0.05, 0.1, 0.5])
+def test_band_rebalance_indices_match_loop(prices, weights, band):
+    expected = naive_band_indices(prices, weights, band)
+    np.testing.assert_array_equal(band_rebalance_indices(prices, weights, band), expected)
+
+
+def run_chunked(store, rule, chunk_rows):
+    values = []
+    result = simulate_rebalancing_chunked(store, TICKERS, (0.75, 0.25), 10000, rule, chunk_rows=chunk_rows,
+                                          on_chunk=lambda start, dates, chunk: values.append(chunk['portfolio_value']))
+    return result, np.concatenate(values)
+
+
+@pytest.mark.parametrize('rule', ['monthly', 'band', 21])
+@pytest.mark.parametrize('chunk_rows', [1, 37, 250, 5000])
+def test_chunked_matches_in_memory(market, prices, rule, chunk_rows):
+    if rule == 'band':
+        indices = band_rebalance_indices(prices, (0.75, 0.25), 0.05)
+    else:
+        indices = rebalance_schedule(market['Date'], rule)
+    expected = simulate_rebalancing(prices, (0.75, 0.25), 10000, indices)
+
+    chunked, values = run_chunked(PriceStore.from_frame(market), rule, chunk_rows)
+    np.testing.assert_array_equal(chunked['event_indices'], expected['event_indices'])
+    np.testing.assert_allclose(chunked['event_values'], expected['event_values'], rtol=1e-12)
+    np.testing.assert_allclose(values, expected['portfolio_value'], rtol=1e-12)
+    assert chunked['final_value'] == pytest.approx(expected['portfolio_value'][-1], rel=1e-12)
+
+
+def test_chunked_reads_memory_mapped_minute_panel(tmp_path):
+    # 하루 390개 1분봉 20거래일을 청크로 나누어 디스크 패널에 추가
+    days = pd.bdate_range('2024-01-02', periods=20)
+    minutes = pd.DatetimeIndex(np.concatenate([day + pd.Timedelta(hours=9, minutes=30)
+                                               + pd.to_timedelta(np.arange(390), unit='min') for day in days]))
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame({'Date': minutes,
+                         'SOXL_Close': 30 * np.exp(np.cumsum(rng.normal(0, 0.002, len(minutes)))),
+                         'VXX_Close': 50 * np.exp(np.cumsum(rng.normal(0, 0.002, len(minutes))))})
+    for start in range(0, len(data), 1000):
+        append_panel(str(tmp_path), data.iloc[start:start + 1000])
+
+    store = PriceStore.open(str(tmp_path))
+    assert len(store) == len(data)
+    assert infer_periods_per_year(store.timestamps) == pytest.approx(252 * 390)
+
+    expected = simulate_rebalancing(data[list(f"{t}_Close" for t in TICKERS)].to_numpy(), (0.75, 0.25), 10000,
+                                    rebalance_schedule(store.dates(), 'daily'))
+    chunked, values = run_chunked(store, 'daily', 777)
+    assert len(chunked['event_indices']) == 20
+    np.testing.assert_allclose(values, expected['portfolio_value'], rtol=1e-12)
+
+
+@pytest.mark.parametrize('freq, expected', [('B', 252), ('W-FRI', 365.25 / 7), ('MS', 365.25 / 31)])
+def test_infer_periods_per_year_from_bar_spacing(freq, expected):
+    dates = pd.date_range('2020-01-01', periods=120, freq=freq)
+    assert infer_periods_per_year(dates) == pytest.approx(expected, rel=0.03)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from performance import compute_performance_metrics
+from rebalance_schedule import rebalance_schedule
+from simulation_engine import simulate_rebalancing
+from streaming_metrics import StreamingMetrics
+
+
+@pytest.mark.parametrize('chunk', [1, 17, 333, 5000])
+def test_streaming_matches_batch(market, prices, chunk):
+    values = simulate_rebalancing(prices, (0.75, 0.25), 10000, rebalance_schedule(market['Date'], 'monthly'))
+    values = values['portfolio_value']
+    dates = market['Date']
+    expected = compute_performance_metrics(dates, values, 10000)
+
+    one_by_one = StreamingMetrics(10000)
+    for date, value in zip(dates, values):
+        one_by_one.update(date, value)
+    chunked = StreamingMetrics(10000)
+    for start in range(0, len(values), chunk):
+        chunked.update_many(dates[start:start + chunk], values[start:start + chunk])
+
+    for metrics in (one_by_one.snapshot(), chunked.snapshot()):
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value, rel=1e-10), key
+
+
+def test_streaming_state_round_trip(market, prices):
+    values = prices @ np.array([75.0, 25.0])
+    dates = market['Date']
+    full = StreamingMetrics(values[0])
+    full.update_many(dates, values)
+
+    head = StreamingMetrics(values[0])
+    head.update_many(dates[:400], values[:400])
+    resumed = StreamingMetrics.from_state(head.to_state())
+    resumed.update_many(dates[400:], values[400:])
+    assert resumed.snapshot() == pytest.approx(full.snapshot(), rel=1e-10)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_core import SOXLVXXSimulator
+from trade_ledger import DEFAULT_COSTS, TradeLedger, average_daily_volume, trade_costs
+
+
+def test_average_daily_volume_excludes_current_bar():
+    volumes = np.array([[5.0, 1.0], [10.0, 2.0], [20.0, 4.0], [30.0, 8.0]])
+    adv = average_daily_volume(volumes, window=2)
+    expected = np.array([[0.0, 0.0], [5.0, 1.0], [7.5, 1.5], [15.0, 3.0]])
+    np.testing.assert_array_equal(adv, expected)
+
+
+def test_append_counts_events_without_trades():
+    dates = np.arange('2020-01-01', '2020-01-06', dtype='datetime64[D]').astype('datetime64[ns]')
+    ledger = TradeLedger(['SOXL', 'VXX'], dates)
+    ledger.append(0, [10.0, 20.0], [10.0, 5.0])
+    ledger.append(1, [0.0, 0.0], [11.0, 5.0])
+    ledger.append(2, [-1.0, 2.0], [12.0, 4.0])
+
+    assert ledger.n_events == 3
+    np.testing.assert_array_equal(ledger.records['event'], [0, 0, 2, 2])
+    costs = ledger.apply_costs().event_costs()
+    assert len(costs) == 3 and costs[1] == 0
+
+
+def test_from_events_matches_append():
+    dates = np.arange('2020-01-01', '2020-01-06', dtype='datetime64[D]').astype('datetime64[ns]')
+    shares = np.array([[10.0, 20.0], [10.0, 20.0], [9.0, 22.0]])
+    prices = np.array([[10.0, 5.0], [11.0, 5.0], [12.0, 4.0]])
+    ledger = TradeLedger.from_events(['SOXL', 'VXX'], dates, [0, 1, 2], shares, prices)
+
+    appended = TradeLedger(['SOXL', 'VXX'], dates)
+    for idx, change, price in zip([0, 1, 2], np.diff(shares, axis=0, prepend=0), prices):
+        appended.append(idx, change, price)
+    assert ledger.n_events == appended.n_events == 3
+    np.testing.assert_array_equal(ledger.records, appended.records)
+
+
+def test_wide_frame_has_one_row_per_traded_event():
+    dates = np.arange('2020-01-01', '2020-01-06', dtype='datetime64[D]').astype('datetime64[ns]')
+    ledger = TradeLedger(['SOXL', 'VXX'], dates)
+    ledger.append(0, [10.0, 20.0], [10.0, 5.0])
+    ledger.append(1, [0.0, 0.0], [11.0, 5.0])
+    ledger.append(3, [0.0, 2.0], [12.0, 4.0])
+    ledger.apply_costs()
+
+    wide = ledger.to_wide_frame()
+    assert list(wide.columns) == ['Date', 'Type', 'SOXL_Change', 'SOXL_Price', 'VXX_Change', 'VXX_Price',
+                                  'Fee', 'Slippage']
+    assert list(wide['Date']) == [pd.Timestamp('2020-01-01'), pd.Timestamp('2020-01-04')]
+    assert list(wide['Type']) == ['Initial Investment', 'Rebalance']
+    np.testing.assert_array_equal(wide['SOXL_Change'], [10.0, 0.0])
+    np.testing.assert_array_equal(wide['SOXL_Price'], [10.0, np.nan])
+    np.testing.assert_array_equal(wide['VXX_Change'], [20.0, 2.0])
+
+    long = ledger.to_frame()
+    np.testing.assert_allclose(wide['Fee'].sum(), long['Fee'].sum())
+    np.testing.assert_allclose(wide['Slippage'].to_numpy(), long.groupby('Date')['Slippage'].sum().to_numpy())
+
+
+def naive_costed_rebalancing(prices, volumes, weights, initial_capital, event_indices, costs):
+    """이벤트마다 목표 수량으로 거래하고 비용을 보유 비율대로 차감하는 단순 반복 구현"""
+    adv = average_daily_volume(volumes, costs['adv_window'])
+    holdings, cash = np.zeros(len(weights)), initial_capital
+    trades, trade_cost = [], []
+    for idx in event_indices:
+        value = holdings @ prices[idx] + cash
+        target = value * weights / prices[idx]
+        fee, slippage = trade_costs(target - holdings, prices[idx], adv[idx], costs['fee_rate'],
+                                    costs['half_spread'], costs['impact'])
+        trades.append(target - holdings)
+        trade_cost.append(fee + slippage)
+        scale = 1 - (fee + slippage).sum() / value
+        holdings, cash = target * scale, value * (1 - weights.sum()) * scale
+    return holdings @ prices[-1] + cash, np.array(trades), np.array(trade_cost)
+
+
+@pytest.mark.parametrize('weights', [(0.75, 0.25), (0.5, 0.3)])
+def test_costs_match_naive_loop_with_market_impact(market, weights, capsys):
+    costs = {**DEFAULT_COSTS, 'impact': 0.5}
+    simulator = SOXLVXXSimulator(1e9, *weights)
+    simulator.data = market
+    simulator.costs = {'impact': 0.5}
+    simulator.run_simulation('monthly')
+    capsys.readouterr()
+
+    prices = market[['SOXL_Close', 'VXX_Close']].to_numpy()
+    volumes = market[['SOXL_Volume', 'VXX_Volume']].to_numpy()
+    events = [0] + [simulator.price_store.index_of(date) for date in simulator.rebalance_dates]
+    final_value, trades, trade_cost = naive_costed_rebalancing(prices, volumes, np.array(weights), 1e9,
+                                                               events, costs)
+
+    # 충격 비용이 차감 배수에 비례하지 않으므로 선형 근사와 구분되는 규모인지 확인
+    assert trade_cost[1:].sum() > 1e-3 * final_value
+    assert simulator.final_value == pytest.approx(final_value, rel=1e-9)
+
+    records = simulator.ledger.records
+    np.testing.assert_allclose(records['quantity'], trades[records['event'], records['asset']], rtol=1e-9)
+    np.testing.assert_allclose(simulator.ledger.costs, trade_cost[records['event'], records['asset']], rtol=1e-9)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from price_cache import PriceCache
+from synthetic_market import SyntheticSource
+from universe_loader import StubDataSource, load_universe
+
+
+def frames(market):
+    frame = market.set_index('Date')
+    return {ticker: frame[[f"{ticker}_Close", f"{ticker}_Volume"]].set_axis(['Close', 'Volume'], axis=1)
+            for ticker in ('SOXL', 'VXX')}
+
+
+def test_load_universe_aligns_stub_frames(market):
+    source = StubDataSource(frames(market))
+    universe = load_universe(['SOXL', 'VXX'], '2015-01-01', '2030-01-01', source=source, max_workers=2)
+
+    panel = universe.panel
+    assert list(panel.columns) == ['Date', 'SOXL_Close', 'VXX_Close', 'SOXL_Volume', 'VXX_Volume']
+    np.testing.assert_array_equal(panel['Date'].to_numpy(), market['Date'].to_numpy())
+    np.testing.assert_array_equal(panel['SOXL_Close'].to_numpy(), market['SOXL_Close'].to_numpy())
+    assert sorted(call[0] for call in source.calls) == ['SOXL', 'VXX']
+    assert universe.rows == {'SOXL': len(market), 'VXX': len(market)}
+
+
+def test_load_universe_synthetic_matches_batched():
+    source = SyntheticSource(seed=3)
+    threaded = load_universe(['SOXL', 'VXX'], '2018-01-01', '2019-01-01', source=source)
+    batched = load_universe(['SOXL', 'VXX'], '2018-01-01', '2019-01-01', source=source, batched=True)
+    pd.testing.assert_frame_equal(threaded.panel, batched.panel)
+    assert threaded.panel['Date'].min() >= pd.Timestamp('2018-01-01')
+    assert threaded.panel['Date'].max() < pd.Timestamp('2019-01-01')
+
+
+def test_load_universe_through_cache(tmp_path, market):
+    source = StubDataSource(frames(market))
+    cache = PriceCache(str(tmp_path), downloader=None)
+    direct = load_universe(['SOXL', 'VXX'], '2015-01-01', '2017-01-01', source=source)
+
+    first = load_universe(['SOXL', 'VXX'], '2015-01-01', '2017-01-01', source=source, cache=cache)
+    calls = len(source.calls)
+    second = load_universe(['SOXL', 'VXX'], '2015-06-01', '2016-06-01', source=source, cache=cache)
+
+    pd.testing.assert_frame_equal(first.panel, direct.panel)
+    assert len(source.calls) == calls
+    assert cache.hits == 2
+    # 호출자가 공유하는 캐시의 downloader는 바뀌지 않음
+    assert cache.downloader is None
+    assert second.panel['Date'].min() >= pd.Timestamp('2015-06-01')
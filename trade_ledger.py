@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+
+from performance import TRADING_DAYS
+
+# 거래 한 건(자산 하나의 수량 변화)의 고정 스키마
+LEDGER_DTYPE = np.dtype([
+    ('date_index', np.int64),   # 거래일 인덱스 (dates 배열 기준)
+    ('event', np.int32),        # 거래 이벤트 번호 (0: 초기 투자, 1 이상: 리밸런싱)
+    ('asset', np.int16),        # 자산 인덱스 (tickers 기준)
+    ('quantity', np.float64),   # 수량 변화 (매수 +, 매도 -)
+    ('price', np.float64),      # 체결 가격 (종가)
+    ('notional', np.float64),   # 거래 금액 (quantity * price)
+    ('fee', np.float64),        # 수수료
+    ('slippage', np.float64),   # 슬리피지 (스프레드 + 시장 충격)
+])
+
+# 거래 비용 기본값
+DEFAULT_COSTS = {
+    'fee_rate': 0.0005,     # 거래 금액 대비 수수료 (5bp)
+    'half_spread': 0.0005,  # 호가 스프레드 절반 (5bp)
+    'impact': 0.1,          # 시장 충격 계수: impact * sqrt(수량 / 평균 거래량)
+    'adv_window': 20,       # 평균 거래량 계산 기간 (봉 수)
+}
+
+
+def average_daily_volume(volumes, window=DEFAULT_COSTS['adv_window']):
+    """
+    각 봉 직전 window개 봉의 평균 거래량을 누적합으로 계산합니다 (당일 거래량 미포함).
+
+    당일 거래량을 쓰지 않으므로(미래 정보 없음) 이전 봉이 없는 첫 봉은 0이며,
+    trade_costs는 이 경우 시장 충격 항을 제외합니다.
+
+    Parameters:
+    - volumes: (봉 수,) 또는 (봉 수, 자산 수) 거래량 배열
+
+    Returns:
+    - volumes와 같은 모양의 평균 거래량 배열
+    """
+    volumes = np.nan_to_num(np.asarray(volumes, dtype=np.float64))
+    cumulative = np.concatenate((np.zeros((1,) + volumes.shape[1:]), np.cumsum(volumes, axis=0)))
+    end = np.arange(len(volumes))
+    start = np.maximum(end - window, 0)
+    counts = (end - start).reshape((-1,) + (1,) * (volumes.ndim - 1))
+    return (cumulative[end] - cumulative[start]) / np.maximum(counts, 1)
+
+
+def trade_costs(quantity, price, adv=None, fee_rate=DEFAULT_COSTS['fee_rate'],
+                half_spread=DEFAULT_COSTS['half_spread'], impact=DEFAULT_COSTS['impact']):
+    """
+    거래별 수수료와 슬리피지를 한 번의 배열 연산으로 계산합니다.
+
+    - 수수료: fee_rate * |거래 금액|
+    - 슬리피지: |거래 금액| * (half_spread + impact * sqrt(|수량| / 평균 거래량))
+      (제곱근 시장 충격 모형, 평균 거래량이 없거나 0이면 충격 항 제외)
+
+    비용 계수에 (m, 1) 모양 배열을 넘기면 m개 비용 수준을 (m, 거래 수) 배열로
+    한 번에 계산하므로 비용 민감도 분석에 그대로 쓸 수 있습니다.
+
+    Returns:
+    - (fee, slippage) 배열
+    """
+    quantity = np.abs(np.asarray(quantity, dtype=np.float64))
+    notional = quantity * np.asarray(price, dtype=np.float64)
+    fee = np.asarray(fee_rate) * notional
+    rate = np.asarray(half_spread, dtype=np.float64)
+    if adv is not None:
+        adv = np.asarray(adv, dtype=np.float64)
+        participation = np.divide(quantity, adv, out=np.zeros_like(notional), where=adv > 0)
+        rate = rate + np.asarray(impact) * np.sqrt(participation)
+    return fee, rate * notional
+
+
+class TradeLedger:
+    def __init__(self, tickers, dates, records=None, n_events=None):
+        """
+        고정 스키마(LEDGER_DTYPE) NumPy 구조화 배열 기반 거래 기록
+
+        거래 한 건은 (거래일, 자산) 하나의 수량 변화이며, 초기 투자와 리밸런싱 모두
+        같은 필드를 가집니다. 회전율/비용/거래 횟수 집계는 배열 연산으로 계산합니다.
+
+        Parameters:
+        - tickers: 자산 티커 목록 (asset 필드의 인덱스 기준)
+        - dates: 거래일 datetime64[ns] 배열 (date_index 기준, 참조)
+        - records: LEDGER_DTYPE 구조화 배열 (None이면 빈 기록)
+        - n_events: 거래 이벤트 수 (거래가 없는 이벤트 포함, None이면 records에서 계산)
+        """
+        self.tickers = list(tickers)
+        self.dates = dates
+        self.records = np.zeros(0, dtype=LEDGER_DTYPE) if records is None else records
+        # 이벤트 번호는 거래가 없는 이벤트도 세므로 기록과 별도로 관리합니다
+        if n_events is None:
+            n_events = int(self.records['event'].max()) + 1 if len(self.records) else 0
+        self.n_events = n_events
+
+    @classmethod
+    def from_events(cls, tickers, dates, event_indices, event_shares, event_prices):
+        """
+        simulate_rebalancing 결과의 이벤트별 보유 수량에서 거래 기록을 만듭니다.
+
+        Parameters:
+        - event_indices: 거래 이벤트 거래일 인덱스 (0번째는 초기 투자)
+        - event_shares: (이벤트 수, 자산 수) 이벤트 직후 보유 수량
+        - event_prices: (이벤트 수, 자산 수) 이벤트 거래일 가격
+        """
+        event_shares = np.asarray(event_shares, dtype=np.float64)
+        change = np.diff(event_shares, axis=0, prepend=np.zeros((1, event_shares.shape[1])))
+        traded = change != 0
+        event, asset = np.nonzero(traded)
+
+        records = np.zeros(len(event), dtype=LEDGER_DTYPE)
+        records['date_index'] = np.asarray(event_indices)[event]
+        records['event'] = event
+        records['asset'] = asset
+        records['quantity'] = change[traded]
+        records['price'] = np.asarray(event_prices, dtype=np.float64)[traded]
+        records['notional'] = records['quantity'] * records['price']
+        return cls(tickers, dates, records, n_events=len(event_indices))
+
+    def __len__(self):
+        return len(self.records)
+
+    def append(self, date_index, quantities, prices):
+        """거래 이벤트 하나(자산별 수량 변화)를 추가합니다 (거래가 없어도 이벤트 번호 증가)."""
+        ledger = TradeLedger.from_events(self.tickers, self.dates, [date_index],
+                                         np.atleast_2d(quantities), np.atleast_2d(prices))
+        ledger.records['event'] = self.n_events
+        self.records = np.concatenate((self.records, ledger.records))
+        self.n_events += 1
+
+    def apply_costs(self, volumes=None, fee_rate=DEFAULT_COSTS['fee_rate'],
+                    half_spread=DEFAULT_COSTS['half_spread'], impact=DEFAULT_COSTS['impact'],
+                    adv_window=DEFAULT_COSTS['adv_window']):
+        """
+        모든 거래의 fee/slippage 필드를 한 번에 계산합니다 (trade_costs 참고).
+
+        Parameters:
+        - volumes: (거래일 수, 자산 수) 거래량 배열 (None이면 시장 충격 제외)
+        """
+        adv = None
+        if volumes is not None:
+            adv = average_daily_volume(volumes, adv_window)[self.records['date_index'], self.records['asset']]
+        self.records['fee'], self.records['slippage'] = trade_costs(
+            self.records['quantity'], self.records['price'], adv, fee_rate, half_spread, impact)
+        return self
+
+    def scale_events(self, factors):
+        """이벤트별 배수로 수량/금액/비용을 조정합니다 (거래 비용 차감 후 규모 반영)."""
+        factor = np.asarray(factors, dtype=np.float64)[self.records['event']]
+        for field in ('quantity', 'notional', 'fee', 'slippage'):
+            self.records[field] *= factor
+        return self
+
+    @property
+    def costs(self):
+        """거래별 총비용 (수수료 + 슬리피지)"""
+        return self.records['fee'] + self.records['slippage']
+
+    def event_costs(self, n_events=None):
+        """이벤트별 총비용 배열 (거래가 없는 이벤트는 0)"""
+        return np.bincount(self.records['event'], weights=self.costs,
+                           minlength=self.n_events if n_events is None else n_events)
+
+    def _years(self, n_periods, periods_per_year):
+        return max(n_periods - 1, 1) / periods_per_year
+
+    def turnover(self, portfolio_value, periods_per_year=TRADING_DAYS):
+        """
+        연율화 단방향 회전율: 리밸런싱 거래 금액 합 / 2 / 평균 포트폴리오 가치 / 연수
+        (초기 투자 제외)
+        """
+        rebalances = self.records['event'] > 0
+        traded = np.abs(self.records['notional'][rebalances]).sum() / 2
+        return traded / np.mean(portfolio_value) / self._years(len(portfolio_value), periods_per_year)
+
+    def cost_drag(self, portfolio_value, periods_per_year=TRADING_DAYS):
+        """연간 거래 비용 / 평균 포트폴리오 가치"""
+        return self.costs.sum() / np.mean(portfolio_value) / self._years(len(portfolio_value), periods_per_year)
+
+    def trades_per_year(self, n_periods, periods_per_year=TRADING_DAYS):
+        """연평균 리밸런싱 거래 건수 (자산별 거래를 각각 셈)"""
+        return np.count_nonzero(self.records['event'] > 0) / self._years(n_periods, periods_per_year)
+
+    def to_frame(self):
+        """거래 기록 DataFrame (Date, Type, Ticker, Quantity, Price, Notional, Fee, Slippage)"""
+        records = self.records
+        return pd.DataFrame({
+            'Date': np.asarray(self.dates)[records['date_index']],
+            'Type': np.where(records['event'] == 0, 'Initial Investment', 'Rebalance'),
+            'Ticker': np.asarray(self.tickers, dtype=object)[records['asset']],
+            'Quantity': records['quantity'],
+            'Price': records['price'],
+            'Notional': records['notional'],
+            'Fee': records['fee'],
+            'Slippage': records['slippage'],
+        })
+
+    def to_wide_frame(self):
+        """
+        거래 이벤트마다 한 행인 거래 기록 DataFrame (기존 trade_history와 같은 형태)
+
+        컬럼: Date, Type, 자산별 {ticker}_Change(수량 변화)와 {ticker}_Price(체결 가격), Fee, Slippage.
+        거래가 없는 자산은 Change 0, Price NaN이며 거래가 하나도 없는 이벤트는 행이 없습니다.
+        자산별 한 행인 형태는 to_frame()을 사용합니다.
+        """
+        records = self.records
+        events, first, row = np.unique(records['event'], return_index=True, return_inverse=True)
+        change = np.zeros((len(events), len(self.tickers)))
+        price = np.full((len(events), len(self.tickers)), np.nan)
+        change[row, records['asset']] = records['quantity']
+        price[row, records['asset']] = records['price']
+
+        columns = {
+            'Date': np.asarray(self.dates)[records['date_index'][first]],
+            'Type': np.where(events == 0, 'Initial Investment', 'Rebalance'),
+        }
+        for j, ticker in enumerate(self.tickers):
+            columns[f"{ticker}_Change"] = change[:, j]
+            columns[f"{ticker}_Price"] = price[:, j]
+        columns['Fee'] = np.bincount(row, weights=records['fee'], minlength=len(events))
+        columns['Slippage'] = np.bincount(row, weights=records['slippage'], minlength=len(events))
+        return pd.DataFrame(columns)
@@ -0,0 +1,182 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+FIELD_ALIASES = {
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'adj close': 'Adj Close',
+    'adj_close': 'Adj Close',
+    'adjclose': 'Adj Close',
+    'volume': 'Volume',
+}
+
+
+def _field_name(label):
+    return FIELD_ALIASES.get(str(label).strip().lower())
+
+
+def normalize_ohlcv(frame, ticker=None):
+    """
+    다양한 컬럼 구성을 이름 기준으로 Open/High/Low/Close/Adj Close/Volume 컬럼으로 정리합니다.
+
+    yfinance의 (Price, Ticker) MultiIndex 컬럼은 필드명이 들어 있는 레벨을 찾아
+    사용하며, 여러 티커가 섞여 있으면 ticker에 해당하는 컬럼만 선택합니다.
+    """
+    frame = frame.copy()
+    if isinstance(frame.columns, pd.MultiIndex):
+        field_level = None
+        for level in range(frame.columns.nlevels):
+            if any(_field_name(label) for label in frame.columns.get_level_values(level)):
+                field_level = level
+                break
+        if field_level is None:
+            raise ValueError(f"{ticker} 데이터에서 가격 컬럼을 찾을 수 없습니다.")
+
+        if ticker is not None and frame.columns.nlevels > 1:
+            for level in range(frame.columns.nlevels):
+                if level != field_level and ticker in frame.columns.get_level_values(level):
+                    frame = frame.xs(ticker, axis=1, level=level)
+                    break
+        if isinstance(frame.columns, pd.MultiIndex):
+            frame.columns = frame.columns.get_level_values(min(field_level, frame.columns.nlevels - 1))
+
+    renamed = {label: _field_name(label) for label in frame.columns if _field_name(label)}
+    frame = frame[list(renamed)].rename(columns=renamed)
+    frame = frame.loc[:, ~frame.columns.duplicated()]
+    if 'Close' not in frame.columns:
+        raise ValueError(f"{ticker} 데이터에 Close 컬럼이 없습니다.")
+
+    frame.index = pd.DatetimeIndex(frame.index).tz_localize(None)
+    frame.index.name = 'Date'
+    return frame.sort_index()
+
+
+class YFinanceSource:
+    """yfinance 기반 데이터 소스"""
+
+    def fetch(self, ticker, start, end):
+        """한 티커의 OHLCV 데이터를 내려받습니다."""
+        import yfinance as yf
+
+        data = yf.download(ticker, start=start, end=end, progress=False)
+        if data.empty:
+            return pd.DataFrame(columns=['Close'], index=pd.DatetimeIndex([], name='Date'))
+        return normalize_ohlcv(data, ticker)
+
+    def fetch_many(self, tickers, start, end):
+        """여러 티커를 한 번의 요청으로 내려받습니다."""
+        import yfinance as yf
+
+        data = yf.download(list(tickers), start=start, end=end, progress=False,
+                           group_by='ticker')
+        return {ticker: normalize_ohlcv(data, ticker) for ticker in tickers}
+
+
+class StubDataSource:
+    def __init__(self, frames, delay=0.0):
+        """
+        네트워크 없이 미리 준비한 데이터를 반환하는 로컬 데이터 소스
+
+        Parameters:
+        - frames: 티커 -> OHLCV DataFrame (DatetimeIndex)
+        - delay: 호출마다 대기할 시간(초), 동시 로딩 동작 확인용
+        """
+        self.frames = frames
+        self.delay = delay
+        self.calls = []
+
+    def fetch(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+        if self.delay:
+            time.sleep(self.delay)
+        frame = normalize_ohlcv(self.frames[ticker], ticker)
+        return frame[(frame.index >= pd.Timestamp(start)) & (frame.index < pd.Timestamp(end))]
+
+
+class UniverseData:
+    def __init__(self, tickers, panel, latency, rows):
+        """
+        load_universe 결과
+
+        - panel: 'Date'와 '{티커}_{필드}' 컬럼으로 정렬된 wide 가격 패널
+        - latency: 티커별 로딩 시간(초)
+        - rows: 티커별 원본 행 수 (정렬 전)
+        """
+        self.tickers = tickers
+        self.panel = panel
+        self.latency = latency
+        self.rows = rows
+
+    def print_latency_report(self):
+        """티커별 로딩 시간을 출력합니다."""
+        print(f"{'티커':<10} {'행 수':>8} {'소요 시간':>10}")
+        for ticker in self.tickers:
+            print(f"{ticker:<10} {self.rows[ticker]:>8} {self.latency[ticker]:>9.3f}초")
+
+
+def load_universe(tickers, start, end, source=None, cache=None, fields=('Close', 'Volume'),
+                  max_workers=8, batched=False):
+    """
+    여러 티커의 가격 데이터를 동시에 불러와 하나의 wide 패널로 정렬합니다.
+
+    Parameters:
+    - tickers: 티커 목록
+    - start, end: 조회 기간 [start, end)
+    - source: fetch(ticker, start, end)를 제공하는 데이터 소스 (기본값: YFinanceSource)
+    - cache: PriceCache (지정하면 캐시를 거쳐 부족한 구간만 source에서 내려받음)
+    - fields: 패널에 포함할 필드
+    - max_workers: 동시에 실행할 최대 스레드 수
+    - batched: True이면 source.fetch_many로 한 번에 요청 (캐시 미사용 시)
+
+    Returns:
+    - UniverseData
+    """
+    tickers = list(tickers)
+    if cache is not None:
+        # 호출자가 공유하는 캐시의 downloader는 바꾸지 않고 이 호출에서만 source 사용
+        fetch = cache.get if source is None else partial(cache.get, downloader=source.fetch)
+    else:
+        if source is None:
+            source = YFinanceSource()
+        fetch = source.fetch
+
+    latency = {}
+    frames = {}
+
+    if batched and cache is None and hasattr(source, 'fetch_many'):
+        started = time.perf_counter()
+        frames = source.fetch_many(tickers, start, end)
+        elapsed = time.perf_counter() - started
+        latency = {ticker: elapsed for ticker in tickers}
+    else:
+        def load(ticker):
+            started = time.perf_counter()
+            frame = fetch(ticker, start, end)
+            return ticker, frame, time.perf_counter() - started
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers)))) as executor:
+            for ticker, frame, elapsed in executor.map(load, tickers):
+                frames[ticker] = frame
+                latency[ticker] = elapsed
+
+    columns = {}
+    for field in fields:
+        for ticker in tickers:
+            frame = frames[ticker]
+            if frame.empty:
+                raise ValueError(f"{ticker} 데이터를 가져올 수 없습니다.")
+            if field not in frame.columns:
+                raise ValueError(f"{ticker} 데이터에 {field} 컬럼이 없습니다.")
+            columns[f"{ticker}_{field}"] = frame[field]
+
+    panel = pd.concat(columns, axis=1, join='inner').dropna()
+    panel.index.name = None
+    panel.insert(0, 'Date', panel.index)
+
+    rows = {ticker: len(frames[ticker]) for ticker in tickers}
+    return UniverseData(tickers, panel, latency, rows)